@@ -0,0 +1,204 @@
+import argparse
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from closed_form import resolve_chase, resolve_fight
+from config import DEFAULT_CONFIG, SimulationConfig
+from constants import ClawSize, CreatureProfile, TeethSharpness
+from creature import CLAW_SIZES, TEETH_SHARPNESSES, Creature, CreatureBuilder
+from simulate import Simulation
+
+# z-score of a two-sided 95% confidence interval
+Z_95: float = 1.96
+
+
+@dataclass(frozen=True)
+class TraitCell:
+    legs: int
+    wings: int
+    claws: ClawSize
+    teeth: TeethSharpness
+
+    def __str__(self) -> str:
+        return f"{self.legs}L{self.wings}W {self.claws.name[0]}/{self.teeth.name[0]}"
+
+
+def trait_grid(profile: CreatureProfile) -> List[TraitCell]:
+    """Every combination of body plan, claws and teeth a profile can evolve."""
+    low_legs, high_legs = profile["legs_range"]
+    low_wings, high_wings = profile["wings_range"]
+    return [
+        TraitCell(legs, wings, claws, teeth)
+        for legs, wings, claws, teeth in product(
+            range(low_legs, high_legs + 1),
+            range(low_wings, high_wings + 1),
+            CLAW_SIZES,
+            TEETH_SHARPNESSES,
+        )
+    ]
+
+
+def wilson_interval(wins: int, samples: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval of a win probability."""
+    if samples == 0:
+        return 0.0, 1.0
+    p = wins / samples
+    denominator = 1 + z * z / samples
+    center = (p + z * z / (2 * samples)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / samples + z * z / (4 * samples**2))
+    return max(0.0, center - spread / denominator), min(
+        1.0, center + spread / denominator
+    )
+
+
+@dataclass(frozen=True)
+class CellEstimate:
+    predator: TraitCell
+    prey: TraitCell
+    wins: int
+    samples: int
+
+    @property
+    def probability(self) -> float:
+        return self.wins / self.samples if self.samples else 0.0
+
+    @property
+    def interval(self) -> Tuple[float, float]:
+        return wilson_interval(self.wins, self.samples)
+
+    @property
+    def half_width(self) -> float:
+        low, high = self.interval
+        return (high - low) / 2
+
+
+def evolve(
+    rng: random.Random, profile: CreatureProfile, cell: TraitCell, position: int
+) -> Creature:
+    """A creature with the cell's traits and stats drawn from the profile."""
+    return (
+        CreatureBuilder()
+        .add_legs(cell.legs)
+        .add_wings(cell.wings)
+        .add_claws(cell.claws)
+        .add_teeth(cell.teeth)
+        .set_health(rng.randint(*profile["health_range"]))
+        .set_stamina(rng.randint(*profile["stamina_range"]))
+        .set_base_attack(rng.randint(*profile["base_attack_range"]))
+        .set_position(position)
+        .build()
+    )
+
+
+def sample_cell(
+    predator: TraitCell,
+    prey: TraitCell,
+    seed: str,
+    count: int,
+    config: Optional[SimulationConfig] = None,
+) -> Tuple[int, int]:
+    """Plays count matchups of one cell. Returns (predator wins, samples)."""
+    rng = random.Random(seed)
+    simulation = Simulation(config=config)
+    config = simulation.config
+    limit = simulation.MAX_ITERATIONS
+    wins = 0
+
+    for _ in range(count):
+        hunter = evolve(rng, config.predator_profile, predator, 0)
+        hunted = evolve(
+            rng, config.prey_profile, prey, rng.randint(0, config.world_max_position)
+        )
+        if resolve_chase(hunter, hunted, simulation.movement_chain, limit).caught:
+            wins += resolve_fight(hunter, hunted, limit).predator_won
+
+    return wins, count
+
+
+def sweep(
+    predators: Sequence[TraitCell],
+    prey: Sequence[TraitCell],
+    seed: int = 0,
+    batch_size: int = 200,
+    max_samples: int = 5000,
+    tolerance: float = 0.02,
+    workers: Optional[int] = None,
+    config: Optional[SimulationConfig] = None,
+) -> List[CellEstimate]:
+    """
+    Estimates the predator's win probability for every (predator, prey) cell,
+    playing by config, by default DEFAULT_CONFIG.
+    Cells are sampled batch_size matchups at a time, in parallel, until the
+    95% interval's half-width is within tolerance or max_samples is reached.
+    Every batch has its own random stream, so results do not depend on workers.
+    """
+    cells = list(product(predators, prey))
+    tallies: Dict[int, Tuple[int, int]] = {index: (0, 0) for index in range(len(cells))}
+    active = list(tallies)
+    batch = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while active:
+            outcomes = pool.map(
+                sample_cell,
+                [cells[index][0] for index in active],
+                [cells[index][1] for index in active],
+                [f"{seed}/{index}/{batch}" for index in active],
+                [batch_size] * len(active),
+                [config] * len(active),
+                chunksize=16,
+            )
+            for index, (wins, samples) in zip(active, outcomes):
+                total_wins, total_samples = tallies[index]
+                tallies[index] = (total_wins + wins, total_samples + samples)
+
+            active = [
+                index
+                for index in active
+                if tallies[index][1] < max_samples
+                and CellEstimate(*cells[index], *tallies[index]).half_width > tolerance
+            ]
+            batch += 1
+
+    return [CellEstimate(*cells[index], *tallies[index]) for index in tallies]
+
+
+def format_table(estimates: Iterable[CellEstimate]) -> str:
+    """One line per cell: predator, prey, win probability, 95% interval, samples."""
+    lines = [f"{'predator':<12}{'prey':<12}{'p(win)':>7}  {'95% CI':<13}{'n':>6}"]
+    for estimate in estimates:
+        low, high = estimate.interval
+        lines.append(
+            f"{str(estimate.predator):<12}{str(estimate.prey):<12}"
+            f"{estimate.probability:>7.3f}  [{low:.3f},{high:.3f}]{estimate.samples:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep win rates over trait space.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--max-samples", type=int, default=5000)
+    parser.add_argument("--tolerance", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    estimates = sweep(
+        trait_grid(DEFAULT_CONFIG.predator_profile),
+        trait_grid(DEFAULT_CONFIG.prey_profile),
+        seed=args.seed,
+        batch_size=args.batch_size,
+        max_samples=args.max_samples,
+        tolerance=args.tolerance,
+        workers=args.workers,
+    )
+    print(format_table(estimates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import pytest
+
+from analytics import (
+    CellEstimate,
+    TraitCell,
+    format_table,
+    sample_cell,
+    sweep,
+    trait_grid,
+    wilson_interval,
+)
+from config import SimulationConfig
+from constants import PRAY_PROFILE, PREDATOR_PROFILE, ClawSize, TeethSharpness
+
+
+class TestAnalytics:
+    @pytest.fixture
+    def flyer(self) -> TraitCell:
+        return TraitCell(0, 2, ClawSize.LARGE, TeethSharpness.VERY_SHARP)
+
+    @pytest.fixture
+    def crawler(self) -> TraitCell:
+        return TraitCell(0, 0, ClawSize.SMALL, TeethSharpness.DULL)
+
+    def test_sample_cell_plays_by_the_config(self, crawler: TraitCell) -> None:
+        # Crawlers only catch each other when the prey starts at the predator
+        same_spot = SimulationConfig(world_max_position=0)
+
+        default_wins, _ = sample_cell(crawler, crawler, "3", 200)
+        same_spot_wins, _ = sample_cell(crawler, crawler, "3", 200, same_spot)
+
+        assert default_wins < same_spot_wins
+
+    def test_trait_grid(self) -> None:
+        assert len(trait_grid(PREDATOR_PROFILE)) == 5 * 3 * 3 * 3
+        assert len(trait_grid(PRAY_PROFILE)) == 4 * 2 * 3 * 3
+
+    def test_wilson_interval(self) -> None:
+        low, high = wilson_interval(50, 100)
+        assert low == pytest.approx(0.4038, abs=1e-4)
+        assert high == pytest.approx(0.5962, abs=1e-4)
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+    def test_sample_cell_is_reproducible(
+        self, flyer: TraitCell, crawler: TraitCell
+    ) -> None:
+        assert sample_cell(flyer, crawler, "7", 100) == sample_cell(
+            flyer, crawler, "7", 100
+        )
+
+    def test_sweep_stops_early_on_certain_cells(
+        self, flyer: TraitCell, crawler: TraitCell
+    ) -> None:
+        estimates = sweep(
+            [flyer, crawler], [crawler, flyer], batch_size=100, max_samples=1000
+        )
+        by_cell = {(e.predator, e.prey): e for e in estimates}
+
+        # Crawlers move at the same speed, so the prey is almost never caught
+        hopeless = by_cell[(crawler, crawler)]
+        assert hopeless.wins == 0
+        assert hopeless.samples == 100
+        # Flyer against flyer is too uncertain to stop before max_samples
+        assert by_cell[(flyer, flyer)].samples == 1000
+        assert all(e.samples % 100 == 0 and e.samples <= 1000 for e in estimates)
+
+    def test_sweep_independent_of_workers(
+        self, flyer: TraitCell, crawler: TraitCell
+    ) -> None:
+        single = sweep([flyer], [crawler, flyer], batch_size=50, workers=1)
+        several = sweep([flyer], [crawler, flyer], batch_size=50, workers=3)
+        assert single == several
+
+    def test_format_table(self, flyer: TraitCell, crawler: TraitCell) -> None:
+        table = format_table([CellEstimate(flyer, crawler, 30, 40)])
+        assert table.splitlines()[1].split() == [
+            "0L2W",
+            "L/V",
+            "0L0W",
+            "S/D",
+            "0.750",
+            "[0.598,0.858]",
+            "40",
+        ]
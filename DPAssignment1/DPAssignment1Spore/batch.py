@@ -0,0 +1,225 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from creature import Creature, CreatureBuilder, MovementHandler
+from population import CreaturePopulation
+from simulate import Simulation
+
+IntColumn = npt.NDArray[np.int64]
+BoolColumn = npt.NDArray[np.bool_]
+
+
+@dataclass
+class CreatureColumns:
+    """
+    A population of creatures stored as one array per attribute.
+    Row i of every column describes the same creature.
+    """
+
+    legs: IntColumn
+    wings: IntColumn
+    stamina: IntColumn
+    position: IntColumn
+    health: IntColumn
+    attack: IntColumn
+
+    @classmethod
+    def from_creatures(cls, creatures: Sequence[Creature]) -> "CreatureColumns":
+        def column(values: Sequence[int]) -> IntColumn:
+            return np.array(values, dtype=np.int64)
+
+        return cls(
+            legs=column([c.legs for c in creatures]),
+            wings=column([c.wings for c in creatures]),
+            stamina=column([c.stamina for c in creatures]),
+            position=column([c.position for c in creatures]),
+            health=column([c.health for c in creatures]),
+            attack=column([c.get_attack_power() for c in creatures]),
+        )
+
+    @classmethod
+    def from_population(cls, population: CreaturePopulation) -> "CreatureColumns":
+        def column(name: str) -> IntColumn:
+            return population.columns[name].astype(np.int64)
+
+        return cls(
+            legs=column("legs"),
+            wings=column("wings"),
+            stamina=column("stamina"),
+            position=column("position"),
+            health=column("health"),
+            attack=population.attack_power(),
+        )
+
+    def take(self, mask: BoolColumn) -> "CreatureColumns":
+        return CreatureColumns(
+            legs=self.legs[mask],
+            wings=self.wings[mask],
+            stamina=self.stamina[mask],
+            position=self.position[mask],
+            health=self.health[mask],
+            attack=self.attack[mask],
+        )
+
+    def __len__(self) -> int:
+        return len(self.legs)
+
+
+@dataclass
+class GaitColumns:
+    speed: IntColumn
+    cost: IntColumn
+    stamina_required: IntColumn
+
+    @classmethod
+    def resolve(
+        cls, creatures: CreatureColumns, movement_chain: MovementHandler
+    ) -> "GaitColumns":
+        """
+        Resolves the movement strategy of every creature through the chain.
+        The chain only looks at legs and wings, so it runs once per body plan.
+        """
+        modes = np.zeros(len(creatures), dtype=np.int64)
+        plans = np.stack([creatures.legs, creatures.wings], axis=1)
+        for legs, wings in np.unique(plans, axis=0):
+            strategy = movement_chain.resolve(int(legs), int(wings))
+            modes[(creatures.legs == legs) & (creatures.wings == wings)] = strategy.mode
+
+        table = movement_chain.table
+        speed = table.speed[modes]
+        cost = table.stamina_cost[modes]
+        required = table.threshold[modes]
+        return cls(speed=speed, cost=cost, stamina_required=required)
+
+
+def rounds_to_kill(
+    health: IntColumn, attack: IntColumn, max_iterations: int
+) -> IntColumn:
+    """Vectorized closed_form.rounds_to_kill."""
+    never = max_iterations + 1
+    safe_attack = np.maximum(attack, 1)
+    falls = np.minimum(-(-health // safe_attack), never)
+    return np.where(health - attack <= 0, 1, np.where(attack > 0, falls, never))
+
+
+class BatchSimulation:
+    """
+    Runs many predator/prey matchups at once, advancing every chase in
+    lockstep and resolving the fights in closed form. Gives the same
+    outcomes as Simulation for the same rng.
+    """
+
+    def __init__(self, simulation: Optional[Simulation] = None) -> None:
+        self.simulation = simulation if simulation is not None else Simulation()
+
+    def simulate_chase(
+        self, predators: CreatureColumns, prey: CreatureColumns
+    ) -> BoolColumn:
+        """
+        Simulates the chase phase for every pair. Returns a mask of the pairs
+        where the predator catches the prey. Stamina and positions are updated in place.
+        """
+        chain = self.simulation.movement_chain
+        predator_gait = GaitColumns.resolve(predators, chain)
+        prey_gait = GaitColumns.resolve(prey, chain)
+
+        caught = np.zeros(len(predators), dtype=np.bool_)
+        active = np.ones(len(predators), dtype=np.bool_)
+
+        for _ in range(self.simulation.MAX_ITERATIONS):
+            if not active.any():
+                break
+
+            predator_moves = active & (
+                predators.stamina >= predator_gait.stamina_required
+            )
+            prey_moves = active & (prey.stamina >= prey_gait.stamina_required)
+
+            # If neither can move and predator hasn't caught prey, chase ends
+            active &= predator_moves | prey_moves
+
+            predators.stamina -= np.where(predator_moves, predator_gait.cost, 0)
+            prey.stamina -= np.where(prey_moves, prey_gait.cost, 0)
+            predators.position += np.where(predator_moves, predator_gait.speed, 0)
+            prey.position += np.where(prey_moves, prey_gait.speed, 0)
+
+            active &= predators.stamina > 0
+
+            hit = active & (predators.position >= prey.position)
+            caught |= hit
+            active &= ~hit
+
+        return caught
+
+    def simulate_fight(
+        self, predators: CreatureColumns, prey: CreatureColumns
+    ) -> BoolColumn:
+        """
+        Resolves the fight phase for every pair in closed form (see resolve_fight).
+        Returns a mask of the pairs where the predator wins. The health of the
+        columns given is updated; resolve_outcomes passes copies of the caught
+        pairs, so its callers' columns keep their health.
+        """
+        limit = self.simulation.MAX_ITERATIONS
+        predator_falls = rounds_to_kill(predators.health, prey.attack, limit)
+        prey_falls = rounds_to_kill(prey.health, predators.attack, limit)
+
+        rounds = np.minimum(np.minimum(predator_falls, prey_falls), limit)
+        predators.health -= rounds * prey.attack
+        prey.health -= rounds * predators.attack
+        return (prey_falls < predator_falls) & (prey_falls <= limit)
+
+    def run_simulation(self, count: Optional[int] = None) -> BoolColumn:
+        """
+        Evolves count matchups, by default the config's simulation_count, and
+        resolves them together.
+        Returns a mask of the matchups where the predator ate the prey.
+        """
+        if count is None:
+            count = self.simulation.config.simulation_count
+        matchups = [self.simulation.create_matchup() for _ in range(count)]
+        predators = CreatureColumns.from_creatures(
+            [predator for predator, _ in matchups]
+        )
+        prey = CreatureColumns.from_creatures([p for _, p in matchups])
+        return self.resolve_matchups(predators, prey)
+
+    def run_generated(
+        self, count: int, rng: Optional[np.random.Generator] = None
+    ) -> BoolColumn:
+        """
+        Like run_simulation, but evolves both populations with
+        CreatureBuilder.build_many. This draws from a NumPy generator, so the
+        matchups differ from the ones Simulation would evolve.
+        """
+        generator = rng if rng is not None else np.random.default_rng()
+        config = self.simulation.config
+        predators = CreatureBuilder.build_many(
+            count, config.predator_profile, generator
+        )
+        prey = CreatureBuilder.build_many(count, config.prey_profile, generator)
+        prey.columns["position"][:] = generator.integers(
+            0, config.world_max_position, size=count, endpoint=True
+        )
+        return self.resolve_matchups(
+            CreatureColumns.from_population(predators),
+            CreatureColumns.from_population(prey),
+        )
+
+    def resolve_matchups(
+        self, predators: CreatureColumns, prey: CreatureColumns
+    ) -> BoolColumn:
+        """Chases every pair and fights the caught ones."""
+        return self.resolve_outcomes(predators, prey)[1]
+
+    def resolve_outcomes(
+        self, predators: CreatureColumns, prey: CreatureColumns
+    ) -> Tuple[BoolColumn, BoolColumn]:
+        """Like resolve_matchups, but also returns which prey were caught."""
+        caught = self.simulate_chase(predators, prey)
+        won = np.zeros(len(predators), dtype=np.bool_)
+        won[caught] = self.simulate_fight(predators.take(caught), prey.take(caught))
+        return caught, won
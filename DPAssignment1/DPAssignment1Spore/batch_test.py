@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+import pytest
+
+from batch import BatchSimulation, CreatureColumns
+from config import SimulationConfig
+from constants import ClawSize, TeethSharpness
+from creature import Creature
+from simulate import Simulation
+from sinks import CounterSink
+
+
+class TestBatchSimulation:
+    @pytest.fixture
+    def batch(self) -> BatchSimulation:
+        return BatchSimulation()
+
+    def test_columns_from_creatures(self) -> None:
+        creatures = [
+            Creature(legs=2, wings=1, stamina=80, position=3, health=90),
+            Creature(
+                base_attack=10,
+                claw_multiplier=ClawSize.MEDIUM.value,
+                teeth_bonus=TeethSharpness.SHARP.value,
+            ),
+        ]
+        columns = CreatureColumns.from_creatures(creatures)
+
+        assert len(columns) == 2
+        assert columns.legs.tolist() == [2, 0]
+        assert columns.wings.tolist() == [1, 0]
+        assert columns.stamina.tolist() == [80, 100]
+        assert columns.position.tolist() == [3, 0]
+        assert columns.health.tolist() == [90, 100]
+        assert columns.attack.tolist() == [10, 36]
+
+    def test_simulate_chase(self, batch: BatchSimulation) -> None:
+        predators = CreatureColumns.from_creatures(
+            [
+                Creature(legs=4, stamina=100, position=0),
+                Creature(legs=2, stamina=20, position=0),
+            ]
+        )
+        prey = CreatureColumns.from_creatures(
+            [
+                Creature(legs=1, stamina=100, position=5),
+                Creature(wings=2, stamina=100, position=50),
+            ]
+        )
+
+        assert batch.simulate_chase(predators, prey).tolist() == [True, False]
+
+    def test_simulate_fight(self, batch: BatchSimulation) -> None:
+        strong = Creature(
+            base_attack=20,
+            claw_multiplier=ClawSize.LARGE.value,
+            teeth_bonus=TeethSharpness.VERY_SHARP.value,
+            health=100,
+        )
+        weak = Creature(base_attack=5, health=50)
+        predators = CreatureColumns.from_creatures([strong, weak])
+        prey = CreatureColumns.from_creatures([weak, strong])
+
+        assert batch.simulate_fight(predators, prey).tolist() == [True, False]
+
+    def test_simulate_fight_edge_cases(self, batch: BatchSimulation) -> None:
+        predators = CreatureColumns.from_creatures(
+            [Creature(base_attack=10, health=20), Creature(base_attack=0, health=20)]
+        )
+        prey = CreatureColumns.from_creatures(
+            [Creature(base_attack=10, health=20), Creature(base_attack=0, health=20)]
+        )
+
+        assert batch.simulate_fight(predators, prey).tolist() == [False, False]
+        assert predators.health.tolist() == [0, 20]
+        assert prey.health.tolist() == [0, 20]
+
+    @pytest.mark.parametrize("seed", [0, 1, 42])
+    def test_matches_scalar_simulation(self, seed: int) -> None:
+        scalar = Simulation(random.Random(seed), sink=CounterSink()).run_simulation(200)
+        batch = BatchSimulation(
+            Simulation(random.Random(seed), sink=CounterSink())
+        ).run_simulation(200)
+
+        assert batch.tolist() == scalar
+
+    def test_runs_the_config_count_by_default(self) -> None:
+        config = SimulationConfig(simulation_count=37)
+        batch = BatchSimulation(Simulation(random.Random(4), config=config))
+
+        assert len(batch.run_simulation()) == 37
+
+    def test_run_generated_is_reproducible(self, batch: BatchSimulation) -> None:
+        first = batch.run_generated(500, np.random.default_rng(3))
+        second = batch.run_generated(500, np.random.default_rng(3))
+
+        assert len(first) == 500
+        assert first.tolist() == second.tolist()
+        assert 0 < first.sum() < 500
@@ -0,0 +1,176 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from creature import Creature
+from population import CreaturePopulation
+from simulate import Simulation
+from sinks import CounterSink
+
+# Seed of every throughput benchmark, so each run times the same matchups
+SEED: int = 2024
+# Fraction a rate may drop below its baseline before it counts as a regression
+TOLERANCE: float = 0.2
+
+
+def allocated_bytes(factory: Callable[[], object]) -> int:
+    """Bytes still allocated by whatever factory returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def creature_memory(count: int = 100_000) -> Dict[str, float]:
+    """
+    Bytes per creature for a list of plain dataclass creatures (the old
+    representation), a list of slotted Creatures and a CreaturePopulation.
+    """
+    dict_creature = make_dataclass(
+        "DictCreature", [(field.name, int, field.default) for field in fields(Creature)]
+    )
+    return {
+        "dataclass": allocated_bytes(lambda: [dict_creature() for _ in range(count)])
+        / count,
+        "slotted": allocated_bytes(lambda: [Creature() for _ in range(count)]) / count,
+        "population": allocated_bytes(lambda: CreaturePopulation(count)) / count,
+    }
+
+
+def _matchups(count: int) -> List[Tuple[Creature, Creature]]:
+    simulation = Simulation(random.Random(SEED))
+    return [simulation.create_matchup() for _ in range(count)]
+
+
+def _timed(run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def bench_move(count: int) -> float:
+    """Seconds for count Creature.move calls through the handler chain."""
+    chain = Simulation().movement_chain
+    creatures = [predator for predator, _ in _matchups(100)]
+
+    def run() -> None:
+        for i in range(count):
+            creatures[i % 100].move(chain)
+
+    return _timed(run)
+
+
+def bench_chase(count: int) -> float:
+    """Seconds to simulate count chases tick by tick, every tick of them."""
+    simulation = Simulation(prune=False)
+    matchups = _matchups(count)
+    return _timed(lambda: [simulation.simulate_chase(a, b) for a, b in matchups])
+
+
+def bench_fight(count: int) -> float:
+    """Seconds to simulate count fights round by round."""
+    simulation = Simulation()
+    matchups = _matchups(count)
+    return _timed(lambda: [simulation.simulate_fight(a, b) for a, b in matchups])
+
+
+def bench_create(count: int) -> float:
+    """Seconds for count create_random_creature calls."""
+    simulation = Simulation(random.Random(SEED))
+    return _timed(
+        lambda: [simulation.create_random_creature(i % 2) for i in range(count)]
+    )
+
+
+def bench_run_simulation(count: int) -> float:
+    """Seconds for a full run_simulation of count matchups."""
+    simulation = Simulation(random.Random(SEED), sink=CounterSink())
+    return _timed(lambda: simulation.run_simulation(count))
+
+
+# Benchmark name: (function, operations per unit of scale)
+BENCHMARKS: Dict[str, Tuple[Callable[[int], float], int]] = {
+    "creature_move": (bench_move, 100_000),
+    "simulate_chase": (bench_chase, 1_000),
+    "simulate_fight": (bench_fight, 10_000),
+    "create_random_creature": (bench_create, 10_000),
+    "run_simulation": (bench_run_simulation, 1_000),
+}
+
+
+def run_benchmarks(scale: float = 1.0, repeat: int = 3) -> Dict[str, float]:
+    """Operations per second of every benchmark, best of repeat runs."""
+    rates = {}
+    for name, (bench, operations) in BENCHMARKS.items():
+        count = max(1, int(operations * scale))
+        rates[name] = count / min(bench(count) for _ in range(repeat))
+    return rates
+
+
+def save_baseline(path: Path, rates: Dict[str, float]) -> None:
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": SEED,
+        "rates": rates,
+        "bytes_per_creature": creature_memory(),
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def find_regressions(
+    rates: Dict[str, float], baseline: Dict[str, float], tolerance: float = TOLERANCE
+) -> List[str]:
+    """Names of the benchmarks slower than their baseline by more than tolerance."""
+    return [
+        name
+        for name, rate in rates.items()
+        if name in baseline and rate < baseline[name] * (1 - tolerance)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Spore hot paths.")
+    parser.add_argument("--baseline", type=Path, default=Path("benchmark.json"))
+    parser.add_argument(
+        "--save", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    rates = run_benchmarks(args.scale, args.repeat)
+    baseline = (
+        json.loads(args.baseline.read_text())["rates"] if args.baseline.exists() else {}
+    )
+    for name, rate in rates.items():
+        change = f"{rate / baseline[name] - 1:>+8.1%}" if name in baseline else ""
+        print(f"{name:<24}{rate:>14,.0f} ops/s{change}")
+
+    memory = creature_memory()
+    for name, size in memory.items():
+        saving = 1 - size / memory["dataclass"]
+        print(f"{name:<12}{size:>8.1f} bytes/creature{saving:>8.0%} saved")
+
+    if args.save:
+        save_baseline(args.baseline, rates)
+    elif regressions := find_regressions(rates, baseline, args.tolerance):
+        print(f"Regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import json
+from pathlib import Path
+
+from benchmark import BENCHMARKS, find_regressions, run_benchmarks, save_baseline
+
+
+class TestBenchmark:
+    def test_run_benchmarks(self) -> None:
+        rates = run_benchmarks(scale=0.01, repeat=1)
+
+        assert set(rates) == set(BENCHMARKS)
+        assert all(rate > 0 for rate in rates.values())
+
+    def test_save_baseline(self, tmp_path: Path) -> None:
+        path = tmp_path / "benchmark.json"
+        save_baseline(path, {"simulate_chase": 1000.0})
+
+        baseline = json.loads(path.read_text())
+        assert baseline["rates"] == {"simulate_chase": 1000.0}
+        assert baseline["bytes_per_creature"]["population"] > 0
+
+    def test_find_regressions(self) -> None:
+        baseline = {"simulate_chase": 1000.0, "simulate_fight": 1000.0}
+        rates = {
+            "simulate_chase": 700.0,
+            "simulate_fight": 900.0,
+            "run_simulation": 1.0,
+        }
+
+        assert find_regressions(rates, baseline, tolerance=0.2) == ["simulate_chase"]
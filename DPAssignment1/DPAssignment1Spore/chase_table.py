@@ -0,0 +1,250 @@
+import functools
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from closed_form import Gait, finish_chase
+from creature import Creature, MovementHandler
+from movement_table import MOVEMENT_TABLE, MovementTable
+from results import ChaseResult
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    The discrete chase space a table covers. There's no default: a table of
+    every starting stamina and gap of constants.py is about 460 MB and takes
+    seconds to build, for barely any gain over resolve_chase, so cover the
+    range you look up and let Simulation fall back to the chase loop or the
+    closed form outside it.
+    """
+
+    predator_stamina: Tuple[int, int]
+    prey_stamina: Tuple[int, int]
+    max_gap: int
+    max_iterations: int = 1000
+
+    def __post_init__(self) -> None:
+        # Outcomes are stored as signed ticks in an int16 table
+        if not 0 < self.max_iterations <= np.iinfo(np.int16).max:
+            raise ValueError(
+                f"max_iterations must be between 1 and {np.iinfo(np.int16).max}"
+            )
+
+    def version(self, table: MovementTable = MOVEMENT_TABLE) -> str:
+        """Hash of everything the table's contents depend on."""
+        payload = json.dumps(
+            {
+                "movement_stats": dict(zip(table.modes, table.stats)),
+                "predator_stamina": self.predator_stamina,
+                "prey_stamina": self.prey_stamina,
+                "max_gap": self.max_gap,
+                "max_iterations": self.max_iterations,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class _SideClasses:
+    """
+    Groups (gait, stamina) pairs that behave identically in a chase. Only the
+    speed, the ticks spent moving and, for the predator, the exhaustion tick
+    matter, so many staminas share a class.
+    """
+
+    def __init__(
+        self, gaits: List[Gait], stamina: Tuple[int, int], limit: int, predator: bool
+    ) -> None:
+        low, high = stamina
+        self.class_of = np.zeros((len(gaits), high - low + 1), dtype=np.int32)
+        keys: Dict[Tuple[int, int, int], int] = {}
+
+        for gait_index, gait in enumerate(gaits):
+            for offset, value in enumerate(range(low, high + 1)):
+                moving = gait.moving_ticks(value, limit)
+                exhausted = (
+                    gait.exhaustion_tick(value, moving, limit) if predator else 0
+                )
+                key = (gait.speed, moving, exhausted)
+                self.class_of[gait_index, offset] = keys.setdefault(key, len(keys))
+
+        ordered = sorted(keys, key=keys.__getitem__)
+        self.moving = np.array([moving for _, moving, _ in ordered], dtype=np.int64)
+        self.exhausted = np.array([ex for _, _, ex in ordered], dtype=np.int64)
+        ticks = np.arange(1, limit + 1)
+        # Distance covered after every tick, one row per class
+        self.distance = np.array(
+            [speed * np.minimum(ticks, moving) for speed, moving, _ in ordered]
+        )
+
+    def __len__(self) -> int:
+        return len(self.moving)
+
+
+class ChaseTable:
+    """
+    Precomputed chase outcomes for every predator gait and stamina, prey gait
+    and stamina, and starting gap in a TableSpec. Entry t > 0 means caught at
+    tick t, t < 0 escaped at tick -t. The outcomes live in a memory-mapped
+    .npy file named after the spec's version, so it's built once per spec and
+    movement table and shared by every process that opens it.
+
+    The table covers the gaits of MOVEMENT_TABLE when it's opened, those
+    registered since included; gaits registered later fall outside it.
+
+    An opened table pickles as its directory and spec, so a worker process
+    maps the file once rather than receiving a copy of it with every task.
+    """
+
+    def __init__(
+        self,
+        spec: TableSpec,
+        outcomes: npt.NDArray[np.int16],
+        directory: Optional[Path] = None,
+    ) -> None:
+        self.spec = spec
+        self.outcomes = outcomes
+        self.directory = directory
+        limit = spec.max_iterations
+        gaits = self.gaits()
+        self._predators = _SideClasses(gaits, spec.predator_stamina, limit, True)
+        self._prey = _SideClasses(gaits, spec.prey_stamina, limit, False)
+
+    @staticmethod
+    def gaits() -> List[Gait]:
+        """Gait of every MOVEMENT_TABLE mode, in mode order."""
+        return [Gait.from_stats(stats) for stats in MOVEMENT_TABLE.stats]
+
+    @staticmethod
+    def path(directory: Path, spec: TableSpec) -> Path:
+        return directory / f"chase_table_{spec.version()}.npy"
+
+    @classmethod
+    def open(cls, directory: Path, spec: TableSpec) -> "ChaseTable":
+        """Maps the table for spec from directory, building it first if missing."""
+        path = cls.path(directory, spec)
+        if not path.exists():
+            cls.build(directory, spec)
+        outcomes = np.load(path, mmap_mode="r")
+        return cls(spec, outcomes, directory)
+
+    def __reduce__(self) -> Any:
+        if self.directory is None:
+            return super().__reduce__()
+        return _open_shared, (self.directory, self.spec)
+
+    @classmethod
+    def build(cls, directory: Path, spec: TableSpec) -> Path:
+        """Computes every outcome of spec and writes the table to directory."""
+        limit = spec.max_iterations
+        gaits = cls.gaits()
+        predators = _SideClasses(gaits, spec.predator_stamina, limit, True)
+        prey = _SideClasses(gaits, spec.prey_stamina, limit, False)
+        gaps = np.arange(spec.max_gap + 1)
+
+        path = cls.path(directory, spec)
+        partial = path.with_suffix(".partial.npy")
+        outcomes = np.lib.format.open_memmap(
+            partial,
+            mode="w+",
+            dtype=np.int16,
+            shape=(len(predators), len(prey), len(gaps)),
+        )
+        for p in range(len(predators)):
+            for y in range(len(prey)):
+                # Furthest the predator has got relative to the prey after each tick
+                gained = predators.distance[p] - prey.distance[y]
+                ahead = np.maximum.accumulate(gained)
+                catch = np.searchsorted(ahead, gaps, side="left") + 1
+                stuck = max(predators.moving[p], prey.moving[y]) + 1
+                exhausted = predators.exhausted[p]
+                outcomes[p, y] = np.where(
+                    stuck <= np.minimum(min(exhausted, limit), catch),
+                    -stuck,
+                    np.where(
+                        exhausted <= np.minimum(catch, limit),
+                        -exhausted,
+                        np.where(catch <= limit, catch, -limit),
+                    ),
+                )
+        outcomes.flush()
+        del outcomes
+        partial.replace(path)
+        return path
+
+    def lookup(
+        self,
+        predator_gait: str,
+        predator_stamina: int,
+        prey_gait: str,
+        prey_stamina: int,
+        gap: int,
+    ) -> Optional[int]:
+        """The stored outcome, or None when the key is outside the table."""
+        gaits = len(self._predators.class_of)
+        predator_mode = MOVEMENT_TABLE.modes.get(predator_gait, gaits)
+        prey_mode = MOVEMENT_TABLE.modes.get(prey_gait, gaits)
+        if predator_mode >= gaits or prey_mode >= gaits:
+            return None
+        spec = self.spec
+        predator_offset = predator_stamina - spec.predator_stamina[0]
+        prey_offset = prey_stamina - spec.prey_stamina[0]
+        if not (
+            0 <= predator_offset < self._predators.class_of.shape[1]
+            and 0 <= prey_offset < self._prey.class_of.shape[1]
+            and 0 <= gap <= spec.max_gap
+        ):
+            return None
+        predator_class = self._predators.class_of[predator_mode, predator_offset]
+        prey_class = self._prey.class_of[prey_mode, prey_offset]
+        return int(self.outcomes[predator_class, prey_class, gap])
+
+    def resolve(
+        self,
+        predator: Creature,
+        prey: Creature,
+        movement_chain: MovementHandler,
+        max_iterations: int,
+    ) -> Optional[ChaseResult]:
+        """
+        Resolves a chase from the table, with the same result and final state
+        as Simulation.simulate_chase. None when the chase isn't covered, or
+        the chain moves creatures by another table than MOVEMENT_TABLE.
+        """
+        if (
+            max_iterations != self.spec.max_iterations
+            or movement_chain.table is not MOVEMENT_TABLE
+        ):
+            return None
+        predator_strategy = movement_chain.resolve(predator.legs, predator.wings)
+        prey_strategy = movement_chain.resolve(prey.legs, prey.wings)
+        outcome = self.lookup(
+            predator_strategy.name,
+            predator.stamina,
+            prey_strategy.name,
+            prey.stamina,
+            prey.position - predator.position,
+        )
+        if outcome is None:
+            return None
+        return finish_chase(
+            predator,
+            prey,
+            Gait.of(predator, movement_chain),
+            Gait.of(prey, movement_chain),
+            outcome > 0,
+            abs(outcome),
+            max_iterations,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _open_shared(directory: Path, spec: TableSpec) -> ChaseTable:
+    """ChaseTable.open, once per process for every directory and spec."""
+    return ChaseTable.open(directory, spec)
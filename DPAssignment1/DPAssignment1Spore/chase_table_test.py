@@ -0,0 +1,108 @@
+import pickle
+import random
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from chase_table import ChaseTable, TableSpec
+from closed_form import resolve_chase
+from constants import MOVEMENT_STATS
+from creature import Creature
+from movement_table import MovementTable
+from simulate import Simulation
+
+
+@pytest.fixture(scope="module")
+def spec() -> TableSpec:
+    return TableSpec(predator_stamina=(0, 120), prey_stamina=(-5, 60), max_gap=300)
+
+
+@pytest.fixture(scope="module")
+def table(spec: TableSpec, tmp_path_factory: pytest.TempPathFactory) -> ChaseTable:
+    return ChaseTable.open(tmp_path_factory.mktemp("tables"), spec)
+
+
+class TestChaseTable:
+    def test_version_depends_on_spec(self, spec: TableSpec) -> None:
+        assert spec.version() == TableSpec(
+            predator_stamina=(0, 120), prey_stamina=(-5, 60), max_gap=300
+        ).version()
+        assert spec.version() != replace(spec, max_gap=301).version()
+
+    def test_version_follows_movement_table(self, spec: TableSpec) -> None:
+        table = MovementTable(MOVEMENT_STATS)
+        before = spec.version(table)
+        table.add("glide", {"speed": 5, "stamina_cost": 1, "stamina_required": 30})
+
+        assert spec.version(table) != before
+        assert spec.version(MovementTable(MOVEMENT_STATS)) == before
+
+    def test_open_reuses_built_table(self, spec: TableSpec, tmp_path: Path) -> None:
+        path = ChaseTable.build(tmp_path, spec)
+        built_at = path.stat().st_mtime_ns
+
+        table = ChaseTable.open(tmp_path, spec)
+
+        assert path.stat().st_mtime_ns == built_at
+        assert list(tmp_path.iterdir()) == [path]
+        assert table.lookup("fly", 100, "crawl", 10, 0) == 1
+
+    def test_rejects_limit_beyond_int16(self) -> None:
+        with pytest.raises(ValueError):
+            TableSpec(
+                predator_stamina=(0, 1),
+                prey_stamina=(0, 1),
+                max_gap=1,
+                max_iterations=40000,
+            )
+
+    def test_pickles_as_its_file(self, table: ChaseTable) -> None:
+        payload = pickle.dumps(table)
+        restored = pickle.loads(payload)
+
+        assert len(payload) < table.outcomes.nbytes
+        assert pickle.loads(payload) is restored
+        assert restored.lookup("run", 100, "hop", 20, 10) == table.lookup(
+            "run", 100, "hop", 20, 10
+        )
+
+    def test_out_of_range_keys(self, table: ChaseTable) -> None:
+        assert table.lookup("run", 121, "hop", 20, 10) is None
+        assert table.lookup("run", 100, "hop", -6, 10) is None
+        assert table.lookup("run", 100, "hop", 20, 301) is None
+        assert table.lookup("run", 100, "hop", 20, -1) is None
+
+    def test_matches_closed_form(self, table: ChaseTable, spec: TableSpec) -> None:
+        rng = random.Random(0)
+        simulation = Simulation()
+
+        for _ in range(3000):
+            predator = Creature(
+                legs=rng.randint(0, 4),
+                wings=rng.randint(0, 2),
+                stamina=rng.randint(*spec.predator_stamina),
+            )
+            prey = Creature(
+                legs=rng.randint(0, 4),
+                wings=rng.randint(0, 2),
+                stamina=rng.randint(*spec.prey_stamina),
+                position=rng.randint(0, spec.max_gap),
+            )
+            solved_predator, solved_prey = replace(predator), replace(prey)
+
+            expected = resolve_chase(
+                solved_predator, solved_prey, simulation.movement_chain, 1000
+            )
+            result = table.resolve(predator, prey, simulation.movement_chain, 1000)
+
+            assert result == expected
+            assert (predator, prey) == (solved_predator, solved_prey)
+
+    def test_simulation_falls_back_outside_table(self, table: ChaseTable) -> None:
+        simulation = Simulation(chase_table=table)
+        predator = Creature(legs=4, stamina=500, position=0)
+        prey = Creature(legs=1, stamina=100, position=5)
+
+        assert table.resolve(predator, prey, simulation.movement_chain, 1000) is None
+        assert simulation.simulate_chase(predator, prey).caught is True
@@ -0,0 +1,109 @@
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from results import OutcomeCounts
+
+# A run checkpoint is a fixed-size struct rather than a pickle, unlike
+# evolution.EvolutionState: it's rewritten every CHECKPOINT_INTERVAL
+# matchups of runs that go on for hours, so it's kept small, checksummed and
+# safe to load from a file someone else wrote. An evolution state holds
+# whole populations of genomes, is saved once per generation and only ever
+# read back by the run that wrote it, so pickling it is enough.
+
+# Matchups between two checkpoints of a run
+CHECKPOINT_INTERVAL: int = 10_000
+
+MAGIC = b"SPCK"
+FORMAT_VERSION = 1
+
+# Magic, format version, then count, completed, the four OutcomeCounts
+# fields and the output offset
+_HEADER = struct.Struct("<4sB7Q")
+# Mersenne Twister state: its version, whether a gauss value is pending, that
+# value, and the 624 words plus the position in them
+_MT_WORDS = 625
+_RNG = struct.Struct(f"<BBd{_MT_WORDS}I")
+# CRC32 of everything before it
+_TRAILER = struct.Struct("<I")
+
+
+@dataclass(frozen=True)
+class RunCheckpoint:
+    """Progress of a Simulation.run_simulation call, enough to carry it on."""
+
+    # Matchups the run was asked for, and how many of them are done
+    count: int
+    completed: int
+    # State of the simulation's random stream after the completed matchups
+    rng_state: Any
+    counts: OutcomeCounts = field(default_factory=OutcomeCounts)
+    # Bytes of output the sink had written, so a resumed run can drop the rest
+    output_offset: int = 0
+
+    def to_bytes(self) -> bytes:
+        version, words, gauss_next = self.rng_state
+        if len(words) != _MT_WORDS:
+            raise ValueError("only Mersenne Twister states can be checkpointed")
+        body = _HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            self.count,
+            self.completed,
+            self.counts.matchups,
+            self.counts.escapes,
+            self.counts.predator_wins,
+            self.counts.prey_wins,
+            self.output_offset,
+        ) + _RNG.pack(
+            version,
+            gauss_next is not None,
+            gauss_next if gauss_next is not None else 0.0,
+            *words,
+        )
+        return body + _TRAILER.pack(zlib.crc32(body))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RunCheckpoint":
+        if len(data) != _HEADER.size + _RNG.size + _TRAILER.size:
+            raise ValueError("checkpoint has the wrong size")
+        body, (crc,) = data[: -_TRAILER.size], _TRAILER.unpack(data[-_TRAILER.size :])
+        if zlib.crc32(body) != crc:
+            raise ValueError("checkpoint is corrupted")
+
+        magic, format_version, *numbers = _HEADER.unpack_from(body)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError("not a simulation checkpoint of a supported version")
+        count, completed, matchups, escapes, predator_wins, prey_wins, offset = numbers
+
+        version, has_gauss, gauss_next, *words = _RNG.unpack_from(body, _HEADER.size)
+        return cls(
+            count=count,
+            completed=completed,
+            rng_state=(version, tuple(words), gauss_next if has_gauss else None),
+            counts=OutcomeCounts(matchups, escapes, predator_wins, prey_wins),
+            output_offset=offset,
+        )
+
+    def save(self, path: Path) -> None:
+        """Writes the checkpoint to path, replacing the previous one atomically."""
+        partial = path.with_suffix(".partial")
+        partial.write_bytes(self.to_bytes())
+        partial.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "RunCheckpoint":
+        return cls.from_bytes(path.read_bytes())
+
+
+def reopen_output(path: Path, offset: int) -> TextIO:
+    """
+    Opens the output of an interrupted run for appending, after dropping
+    whatever was written past the checkpoint's offset.
+    """
+    stream = open(path, "r+")
+    stream.truncate(offset)
+    stream.seek(offset)
+    return stream
@@ -0,0 +1,99 @@
+import random
+from pathlib import Path
+from typing import IO, List
+
+import pytest
+
+from checkpoint import RunCheckpoint, reopen_output
+from results import MatchupRecord, OutcomeCounts
+from simulate import Simulation
+from sinks import CounterSink, CsvSink
+
+
+class Interrupted(Exception):
+    pass
+
+
+class CrashingSink(CsvSink):
+    """Dies on the given matchup, like a killed run."""
+
+    def __init__(self, stream: IO[str], crash_at: int, header: bool = True) -> None:
+        super().__init__(stream, batch_size=7, header=header)
+        self.crash_at = crash_at
+
+    def record(self, matchup: MatchupRecord) -> None:
+        if matchup.index == self.crash_at:
+            raise Interrupted
+        super().record(matchup)
+
+
+class TestRunCheckpoint:
+    def test_round_trip(self) -> None:
+        rng = random.Random(1)
+        rng.gauss(0, 1)
+        checkpoint = RunCheckpoint(
+            count=500,
+            completed=120,
+            rng_state=rng.getstate(),
+            counts=OutcomeCounts(120, 70, 30, 20),
+            output_offset=4096,
+        )
+
+        data = checkpoint.to_bytes()
+
+        assert len(data) < 2600
+        assert RunCheckpoint.from_bytes(data) == checkpoint
+
+    def test_rejects_corruption(self) -> None:
+        data = bytearray(RunCheckpoint(1, 0, random.Random(2).getstate()).to_bytes())
+        data[10] ^= 0xFF
+        with pytest.raises(ValueError):
+            RunCheckpoint.from_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            RunCheckpoint.from_bytes(bytes(data[:-1]))
+
+    @pytest.mark.parametrize("interval", [0, -5])
+    def test_rejects_invalid_interval(self, tmp_path: Path, interval: int) -> None:
+        simulation = Simulation(random.Random(3), sink=CounterSink())
+
+        with pytest.raises(ValueError):
+            simulation.run_simulation(10, tmp_path / "run.ckpt", interval)
+
+    def test_resumed_counts_match_uninterrupted_run(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.checkpoint"
+        expected = CounterSink()
+        Simulation(random.Random(3), sink=expected).run_simulation(300)
+
+        Simulation(random.Random(3), sink=CounterSink()).run_simulation(
+            300, checkpoint=path, interval=40
+        )
+        checkpoint = RunCheckpoint.load(path)
+        assert checkpoint.completed == 300
+        assert checkpoint.counts == expected.counts
+
+    def test_resume_after_crash(self, tmp_path: Path) -> None:
+        path, output = tmp_path / "run.checkpoint", tmp_path / "run.csv"
+        with open(tmp_path / "expected.csv", "w") as stream:
+            sink = CsvSink(stream)
+            expected: List[bool] = Simulation(
+                random.Random(4), sink=sink
+            ).run_simulation(250)
+            sink.close()
+
+        with open(output, "w") as stream:
+            simulation = Simulation(random.Random(4), sink=CrashingSink(stream, 173))
+            with pytest.raises(Interrupted):
+                simulation.run_simulation(250, checkpoint=path, interval=50)
+
+        checkpoint = RunCheckpoint.load(path)
+        assert checkpoint.completed == 150
+        with reopen_output(output, checkpoint.output_offset) as stream:
+            sink = CsvSink(stream, header=False)
+            rest = Simulation(sink=sink).run_simulation(
+                checkpoint.count, checkpoint=path, resume_from=checkpoint
+            )
+            sink.close()
+
+        assert rest == expected[150:]
+        assert output.read_text() == (tmp_path / "expected.csv").read_text()
+        assert RunCheckpoint.load(path).counts.matchups == 250
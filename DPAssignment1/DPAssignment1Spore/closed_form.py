@@ -0,0 +1,253 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from constants import MovementStats
+from creature import Creature, MovementHandler
+from results import ChaseResult, FightResult
+
+
+@dataclass(frozen=True)
+class Gait:
+    speed: int
+    stamina_cost: int
+    # 0 means the gait is always available, whatever the stamina
+    stamina_required: int
+
+    @classmethod
+    def from_stats(cls, stats: MovementStats) -> "Gait":
+        return cls(stats["speed"], stats["stamina_cost"], stats["stamina_required"])
+
+    @classmethod
+    def of(cls, creature: Creature, movement_chain: MovementHandler) -> "Gait":
+        strategy = movement_chain.resolve(creature.legs, creature.wings)
+        return cls.from_stats(strategy.table.stats[strategy.mode])
+
+    def moving_ticks(self, stamina: int, limit: int) -> int:
+        """
+        Number of ticks the gait keeps moving when starting with the given stamina,
+        capped at limit. The stamina only changes while moving, so once the gait
+        stops it never starts again.
+        """
+        if self.stamina_required == 0:
+            return limit
+        if stamina < self.stamina_required:
+            return 0
+        if self.stamina_cost == 0:
+            return limit
+        return min((stamina - self.stamina_required) // self.stamina_cost + 1, limit)
+
+    def exhaustion_tick(self, stamina: int, moving: int, limit: int) -> int:
+        """
+        Tick at which a predator with this gait runs out of stamina, given its
+        moving ticks, or limit + 1 if it doesn't within limit ticks.
+        """
+        if stamina <= 0:
+            return 1
+        if self.stamina_cost > 0 and _ceil_div(stamina, self.stamina_cost) <= moving:
+            return _ceil_div(stamina, self.stamina_cost)
+        return limit + 1
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def _catch_tick(
+    predator: Gait,
+    predator_moving: int,
+    prey: Gait,
+    prey_moving: int,
+    gap: int,
+    limit: int,
+) -> Optional[int]:
+    """
+    First tick at which the predator's position reaches the prey's, if any.
+    The gap closes at a constant rate between the ticks where either side
+    stops moving, so each of those segments is solved directly.
+    """
+    bounds: List[int] = sorted({0, predator_moving, prey_moving, limit})
+    for lo, hi in zip(bounds, bounds[1:]):
+        predator_speed = predator.speed if hi <= predator_moving else 0
+        prey_speed = prey.speed if hi <= prey_moving else 0
+        rate = predator_speed - prey_speed
+        # Distance still to close after tick lo + 1
+        first = lo + 1
+        behind = (
+            gap
+            - min(first, predator_moving) * predator.speed
+            + min(first, prey_moving) * prey.speed
+        )
+        if behind <= 0:
+            return first
+        if rate > 0:
+            tick = first + _ceil_div(behind, rate)
+            if tick <= hi:
+                return tick
+    return None
+
+
+def resolve_chase(
+    predator: Creature,
+    prey: Creature,
+    movement_chain: MovementHandler,
+    max_iterations: int,
+) -> ChaseResult:
+    """
+    Resolves a chase without stepping it tick by tick. Gives the same result as
+    Simulation.simulate_chase and leaves both creatures in the same final state.
+    """
+    predator_gait = Gait.of(predator, movement_chain)
+    prey_gait = Gait.of(prey, movement_chain)
+    predator_moving = predator_gait.moving_ticks(predator.stamina, max_iterations)
+    prey_moving = prey_gait.moving_ticks(prey.stamina, max_iterations)
+
+    never = max_iterations + 1
+    # Neither can move
+    stuck = max(predator_moving, prey_moving) + 1
+    # Predator runs out of stamina
+    exhausted = predator_gait.exhaustion_tick(
+        predator.stamina, predator_moving, max_iterations
+    )
+    catch = _catch_tick(
+        predator_gait,
+        predator_moving,
+        prey_gait,
+        prey_moving,
+        prey.position - predator.position,
+        max_iterations,
+    )
+    caught_at = catch if catch is not None else never
+
+    # Same precedence as the checks inside one tick of the loop
+    if stuck <= min(exhausted, caught_at, max_iterations):
+        caught, ticks = False, stuck
+    elif exhausted <= min(caught_at, max_iterations):
+        caught, ticks = False, exhausted
+    elif caught_at <= max_iterations:
+        caught, ticks = True, caught_at
+    else:
+        caught, ticks = False, max_iterations
+
+    return finish_chase(
+        predator, prey, predator_gait, prey_gait, caught, ticks, max_iterations
+    )
+
+
+def cannot_catch(
+    predator_gait: Gait,
+    predator_moving: int,
+    prey_gait: Gait,
+    prey_moving: int,
+    gap: int,
+) -> bool:
+    """
+    Whether bounds alone prove the predator never reaches the prey. The prey
+    never moves backwards, so it's out of reach when the gap is more than the
+    predator can still cover, or when the prey is at least as fast for as long
+    as the predator keeps moving.
+    """
+    if gap <= 0:
+        return False
+    if predator_gait.speed * predator_moving < gap:
+        return True
+    return prey_moving >= predator_moving and prey_gait.speed >= predator_gait.speed
+
+
+def prune_chase(
+    predator: Creature,
+    prey: Creature,
+    movement_chain: MovementHandler,
+    max_iterations: int,
+) -> Optional[ChaseResult]:
+    """
+    Ends a chase the predator can't win (see cannot_catch) at the tick the
+    loop would stop it, fast-forwarding both creatures there. None when the
+    outcome isn't certain yet.
+    """
+    predator_gait = Gait.of(predator, movement_chain)
+    prey_gait = Gait.of(prey, movement_chain)
+    predator_moving = predator_gait.moving_ticks(predator.stamina, max_iterations)
+    prey_moving = prey_gait.moving_ticks(prey.stamina, max_iterations)
+    if not cannot_catch(
+        predator_gait,
+        predator_moving,
+        prey_gait,
+        prey_moving,
+        prey.position - predator.position,
+    ):
+        return None
+
+    stuck = max(predator_moving, prey_moving) + 1
+    exhausted = predator_gait.exhaustion_tick(
+        predator.stamina, predator_moving, max_iterations
+    )
+    # Same precedence as resolve_chase when there's no catch
+    if stuck <= min(exhausted, max_iterations):
+        ticks = stuck
+    else:
+        ticks = min(exhausted, max_iterations)
+    return finish_chase(
+        predator, prey, predator_gait, prey_gait, False, ticks, max_iterations
+    )
+
+
+def finish_chase(
+    predator: Creature,
+    prey: Creature,
+    predator_gait: Gait,
+    prey_gait: Gait,
+    caught: bool,
+    ticks: int,
+    max_iterations: int,
+) -> ChaseResult:
+    """
+    Moves both creatures to where a chase with the given outcome leaves them.
+    """
+    predator_moving = predator_gait.moving_ticks(predator.stamina, max_iterations)
+    prey_moving = prey_gait.moving_ticks(prey.stamina, max_iterations)
+    # A stalled chase ends before anyone moves on its last tick
+    stalled = not caught and ticks == max(predator_moving, prey_moving) + 1
+    moved_ticks = ticks - 1 if stalled else ticks
+
+    for creature, gait, moving in (
+        (predator, predator_gait, predator_moving),
+        (prey, prey_gait, prey_moving),
+    ):
+        creature.stamina -= min(moved_ticks, moving) * gait.stamina_cost
+        creature.position += min(moved_ticks, moving) * gait.speed
+
+    return ChaseResult(caught, ticks, predator.stamina, prey.stamina)
+
+
+def rounds_to_kill(health: int, attack: int, max_iterations: int) -> int:
+    """
+    Round in which a creature with the given health falls to the given attack,
+    or max_iterations + 1 if it never does.
+    """
+    if health - attack <= 0:
+        return 1
+    if attack <= 0:
+        return max_iterations + 1
+    return min(_ceil_div(health, attack), max_iterations + 1)
+
+
+def resolve_fight(
+    predator: Creature, prey: Creature, max_iterations: int
+) -> FightResult:
+    """
+    Resolves a fight in constant time. Attack power never changes during a fight,
+    so each side falls after ceil(health / attack) rounds. Gives the same result as
+    Simulation.simulate_fight and leaves both creatures with the same health.
+    """
+    predator_attack = predator.get_attack_power()
+    prey_attack = prey.get_attack_power()
+    predator_falls = rounds_to_kill(predator.health, prey_attack, max_iterations)
+    prey_falls = rounds_to_kill(prey.health, predator_attack, max_iterations)
+
+    # The predator's health is checked first, so a double knockout goes to the prey
+    rounds = min(predator_falls, prey_falls, max_iterations)
+    predator_won = prey_falls < predator_falls and prey_falls <= max_iterations
+
+    predator.health -= rounds * prey_attack
+    prey.health -= rounds * predator_attack
+    return FightResult(predator_won, rounds, predator.health, prey.health)
@@ -0,0 +1,174 @@
+import random
+from dataclasses import replace
+from typing import List, Tuple
+
+import pytest
+
+from closed_form import Gait, cannot_catch, resolve_chase, resolve_fight
+from creature import Creature, MovementHandler
+from simulate import Simulation
+
+
+def random_creature(rng: random.Random) -> Creature:
+    return Creature(
+        legs=rng.randint(0, 4),
+        wings=rng.randint(0, 2),
+        stamina=rng.randint(-5, 900),
+        position=rng.randint(-10, 1000),
+    )
+
+
+class TestGait:
+    def test_crawl_never_stops(self) -> None:
+        crawl = Gait(speed=1, stamina_cost=1, stamina_required=0)
+        assert crawl.moving_ticks(-50, 1000) == 1000
+
+    def test_moving_ticks(self) -> None:
+        fly = Gait(speed=8, stamina_cost=4, stamina_required=80)
+        assert fly.moving_ticks(79, 1000) == 0
+        assert fly.moving_ticks(80, 1000) == 1
+        assert fly.moving_ticks(100, 1000) == 6
+        assert fly.moving_ticks(100, 3) == 3
+
+
+class TestResolveChase:
+    @pytest.fixture
+    def simulation(self) -> Simulation:
+        return Simulation(closed_form=True)
+
+    def test_predator_catches(self, simulation: Simulation) -> None:
+        predator = Creature(legs=4, stamina=100, position=0)
+        prey = Creature(legs=1, stamina=100, position=5)
+
+        assert simulation.simulate_chase(predator, prey).caught is True
+
+    def test_prey_escapes(self, simulation: Simulation) -> None:
+        predator = Creature(legs=2, stamina=20, position=0)
+        prey = Creature(wings=2, stamina=100, position=50)
+
+        assert simulation.simulate_chase(predator, prey).caught is False
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_tick_by_tick_chase(self, seed: int) -> None:
+        rng = random.Random(seed)
+        reference = Simulation(prune=False)
+
+        for _ in range(500):
+            predator, prey = random_creature(rng), random_creature(rng)
+            stepped_predator, stepped_prey = replace(predator), replace(prey)
+
+            stepped = reference.simulate_chase(stepped_predator, stepped_prey)
+            result = resolve_chase(
+                predator, prey, reference.movement_chain, reference.MAX_ITERATIONS
+            )
+
+            assert result == stepped
+            assert predator == stepped_predator
+            assert prey == stepped_prey
+
+
+class TestPruning:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_pruned_chase_matches_full_loop(self, seed: int) -> None:
+        rng = random.Random(seed)
+        full, pruned = Simulation(prune=False), Simulation()
+
+        for _ in range(500):
+            predator, prey = random_creature(rng), random_creature(rng)
+            pruned_predator, pruned_prey = replace(predator), replace(prey)
+
+            assert pruned.simulate_chase(
+                pruned_predator, pruned_prey
+            ) == full.simulate_chase(predator, prey)
+            assert (pruned_predator, pruned_prey) == (predator, prey)
+
+    def test_escape_stops_early(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        moves: List[Creature] = []
+        move = Creature.move
+
+        def counted_move(self: Creature, chain: MovementHandler) -> Tuple[int, int]:
+            moves.append(self)
+            return move(self, chain)
+
+        monkeypatch.setattr(Creature, "move", counted_move)
+        # Two crawlers: the gap never closes and the predator tires at tick 900
+        predator = Creature(stamina=900, position=0)
+        prey = Creature(stamina=-5, position=10)
+
+        result = Simulation().simulate_chase(predator, prey)
+
+        assert result.caught is False
+        assert result.ticks == 900
+        assert predator.position == 900
+        assert len(moves) == 2
+
+    def test_cannot_catch(self) -> None:
+        run = Gait(speed=6, stamina_cost=4, stamina_required=60)
+        fly = Gait(speed=8, stamina_cost=4, stamina_required=80)
+        # Gap beyond what the predator can still cover
+        assert cannot_catch(run, 10, fly, 0, 61)
+        assert not cannot_catch(run, 10, fly, 0, 60)
+        # Faster prey that outlasts the predator
+        assert cannot_catch(run, 10, fly, 10, 1)
+        assert not cannot_catch(run, 10, fly, 9, 1)
+        assert not cannot_catch(fly, 10, run, 20, 0)
+
+
+class TestResolveFight:
+    def test_predator_wins(self) -> None:
+        predator = Creature(
+            base_attack=20, claw_multiplier=4, teeth_bonus=9, health=100
+        )
+        prey = Creature(base_attack=5, health=50)
+
+        result = resolve_fight(predator, prey, 1000)
+
+        assert result.predator_won is True
+        assert result.rounds == 1
+        assert result.predator_health == 95
+        assert result.prey_health == -39
+
+    def test_double_knockout_goes_to_prey(self) -> None:
+        predator = Creature(base_attack=10, health=20)
+        prey = Creature(base_attack=10, health=20)
+
+        result = resolve_fight(predator, prey, 1000)
+
+        assert result.predator_won is False
+        assert result.rounds == 2
+
+    def test_harmless_creatures_hit_iteration_cap(self) -> None:
+        predator = Creature(base_attack=0, health=20)
+        prey = Creature(base_attack=0, health=20)
+
+        result = resolve_fight(predator, prey, 1000)
+
+        assert result.predator_won is False
+        assert result.rounds == 1000
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_round_by_round_fight(self, seed: int) -> None:
+        rng = random.Random(seed)
+        reference = Simulation()
+
+        for _ in range(500):
+            predator = Creature(
+                health=rng.randint(-5, 200),
+                base_attack=rng.randint(0, 50),
+                claw_multiplier=rng.randint(1, 4),
+                teeth_bonus=rng.choice([0, 3, 6, 9]),
+            )
+            prey = Creature(
+                health=rng.randint(-5, 200),
+                base_attack=rng.randint(0, 30),
+                claw_multiplier=rng.randint(1, 4),
+                teeth_bonus=rng.choice([0, 3, 6, 9]),
+            )
+            fought_predator, fought_prey = replace(predator), replace(prey)
+
+            fought = reference.simulate_fight(fought_predator, fought_prey)
+            result = resolve_fight(predator, prey, reference.MAX_ITERATIONS)
+
+            assert result == fought
+            assert predator == fought_predator
+            assert prey == fought_prey
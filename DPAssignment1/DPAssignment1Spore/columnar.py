@@ -0,0 +1,163 @@
+import json
+import struct
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from results import MatchupRecord, Row
+from sinks import OutcomeSink
+
+# Column name and type of every MatchupRecord.as_row() field, in file order
+SCHEMA: List[Tuple[str, str]] = [
+    ("index", "<i8"),
+    ("predator_legs", "i1"),
+    ("predator_wings", "i1"),
+    ("predator_attack_power", "<i4"),
+    ("predator_position", "<i4"),
+    ("prey_legs", "i1"),
+    ("prey_wings", "i1"),
+    ("prey_attack_power", "<i4"),
+    ("prey_position", "<i4"),
+    ("caught", "?"),
+    ("chase_ticks", "<i4"),
+    ("predator_stamina", "<i4"),
+    ("prey_stamina", "<i4"),
+    ("predator_won", "?"),
+    ("fight_rounds", "<i4"),
+    ("predator_health", "<i4"),
+    ("prey_health", "<i4"),
+]
+
+# Stored in place of the fight columns of matchups that never fought
+MISSING: int = int(np.iinfo(np.int32).min)
+
+ROW_GROUP_SIZE: int = 65_536
+
+MAGIC = b"SPCOLS01"
+# Every column chunk starts on a multiple of this, so mapped views are aligned
+ALIGNMENT = 64
+# Footer length, then the magic again
+_TAIL = struct.Struct("<Q8s")
+
+
+class ColumnarWriter:
+    """
+    Streams rows into a chunked binary column file. Rows are buffered in one
+    preallocated array per column and written out as a row group whenever
+    row_group_size of them are pending, so memory stays flat however many
+    rows go through. close() writes the footer indexing every row group.
+
+    Layout: magic, then the row groups, each the raw little-endian values of
+    every column in SCHEMA order, then a JSON footer with the schema and each
+    group's row count and column offsets, its length and the magic again.
+    """
+
+    def __init__(self, stream: IO[bytes], row_group_size: int = ROW_GROUP_SIZE) -> None:
+        self.stream = stream
+        self.row_group_size = row_group_size
+        self._buffers = {
+            name: np.empty(row_group_size, dtype=dtype) for name, dtype in SCHEMA
+        }
+        self._pending = 0
+        self._row_groups: List[Dict[str, Any]] = []
+        self._position = 0
+        self._write(MAGIC)
+
+    def _write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self._position += len(data)
+
+    def _pad(self) -> None:
+        self._write(b"\0" * (-self._position % ALIGNMENT))
+
+    def append(self, row: Row) -> None:
+        at = self._pending
+        for name, _ in SCHEMA:
+            value = row[name]
+            self._buffers[name][at] = MISSING if value is None else value
+        self._pending += 1
+        if self._pending == self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the pending rows as a row group."""
+        if not self._pending:
+            return
+        offsets = []
+        for name, _ in SCHEMA:
+            self._pad()
+            offsets.append(self._position)
+            self._write(self._buffers[name][: self._pending].tobytes())
+        self._row_groups.append({"rows": self._pending, "offsets": offsets})
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        footer = json.dumps(
+            {"schema": SCHEMA, "row_groups": self._row_groups}, separators=(",", ":")
+        ).encode()
+        self._write(footer)
+        self._write(_TAIL.pack(len(footer), MAGIC))
+        self.stream.flush()
+
+
+class ColumnarReader:
+    """
+    Memory-maps a file written by ColumnarWriter. Columns come back as views
+    into the mapping, so reading one copies nothing until it's touched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(self._data[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a columnar matchup file")
+        footer_length, magic = 0, b""
+        if len(self._data) >= len(MAGIC) + _TAIL.size:
+            footer_length, magic = _TAIL.unpack(bytes(self._data[-_TAIL.size :]))
+        if magic != MAGIC:
+            raise ValueError(f"{path} has no footer; was the writer closed?")
+        start = len(self._data) - _TAIL.size - footer_length
+        footer = json.loads(bytes(self._data[start : start + footer_length]))
+        self.schema: Dict[str, np.dtype[Any]] = {
+            name: np.dtype(dtype) for name, dtype in footer["schema"]
+        }
+        self.row_groups: List[Dict[str, Any]] = footer["row_groups"]
+
+    def __len__(self) -> int:
+        return sum(group["rows"] for group in self.row_groups)
+
+    def column_chunks(self, name: str) -> Iterator[npt.NDArray[Any]]:
+        """Zero-copy views of a column, one per row group."""
+        position = list(self.schema).index(name)
+        dtype = self.schema[name]
+        for group in self.row_groups:
+            offset = group["offsets"][position]
+            chunk = self._data[offset : offset + group["rows"] * dtype.itemsize]
+            yield chunk.view(dtype)
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """A whole column. A view when the file has a single row group."""
+        chunks = list(self.column_chunks(name))
+        if len(chunks) == 1:
+            return chunks[0]
+        if not chunks:
+            return np.empty(0, dtype=self.schema[name])
+        return np.concatenate(chunks)
+
+    def columns(self) -> Dict[str, npt.NDArray[Any]]:
+        return {name: self.column(name) for name in self.schema}
+
+
+class ColumnarSink(OutcomeSink):
+    """Writes every matchup to a ColumnarWriter."""
+
+    def __init__(self, stream: IO[bytes], row_group_size: int = ROW_GROUP_SIZE) -> None:
+        self.writer = ColumnarWriter(stream, row_group_size)
+
+    def record(self, matchup: MatchupRecord) -> None:
+        self.writer.append(matchup.as_row())
+
+    def close(self) -> None:
+        self.writer.close()
@@ -0,0 +1,65 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from columnar import MISSING, SCHEMA, ColumnarReader, ColumnarSink, ColumnarWriter
+from simulate import Simulation
+from sinks import CounterSink
+
+
+def run_to_file(path: Path, count: int, row_group_size: int) -> None:
+    with open(path, "wb") as stream:
+        sink = ColumnarSink(stream, row_group_size)
+        Simulation(random.Random(8), closed_form=True, sink=sink).run_simulation(count)
+        sink.close()
+
+
+class TestColumnar:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.spcol"
+        run_to_file(path, 1000, row_group_size=128)
+        counts = CounterSink()
+        Simulation(random.Random(8), closed_form=True, sink=counts).run_simulation(1000)
+
+        reader = ColumnarReader(path)
+
+        assert len(reader) == 1000
+        assert [group["rows"] for group in reader.row_groups] == [128] * 7 + [104]
+        assert list(reader.column("index")) == list(range(1000))
+        caught = reader.column("caught")
+        won = reader.column("predator_won")
+        assert int((~caught).sum()) == counts.counts.escapes
+        assert int(won.sum()) == counts.counts.predator_wins
+        assert (reader.column("fight_rounds")[~caught] == MISSING).all()
+        assert (reader.column("fight_rounds")[caught] >= 1).all()
+
+    def test_single_group_columns_are_views(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.spcol"
+        run_to_file(path, 300, row_group_size=1000)
+
+        reader = ColumnarReader(path)
+        ticks = reader.column("chase_ticks")
+
+        assert not ticks.flags.owndata
+        assert not ticks.flags.writeable
+        assert ticks.ctypes.data % 8 == 0
+        assert len(reader.columns()) == 17
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.spcol"
+        with open(path, "wb") as stream:
+            ColumnarWriter(stream).close()
+
+        reader = ColumnarReader(path)
+        assert len(reader) == 0
+        assert len(reader.column("caught")) == 0
+
+    def test_unclosed_file_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "partial.spcol"
+        with open(path, "wb") as stream:
+            writer = ColumnarWriter(stream, row_group_size=4)
+            for _ in range(6):
+                writer.append({name: 0 for name, _ in SCHEMA})
+        with pytest.raises(ValueError):
+            ColumnarReader(path)
@@ -0,0 +1,133 @@
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+from constants import (
+    MOVEMENT_STATS,
+    PRAY_PROFILE,
+    PREDATOR_PROFILE,
+    SIMULATION_COUNT,
+    WORLD_MAX_POSITION,
+    CreatureProfile,
+    MovementStats,
+)
+from creature import (
+    CLAW_SIZES,
+    TEETH_SHARPNESSES,
+    FlyHandler,
+    HopHandler,
+    MovementHandler,
+    RunHandler,
+    WalkHandler,
+)
+from movement_table import MOVEMENT_TABLE, MovementTable
+
+
+def freeze(value: Any) -> Any:
+    """Read-only deep copy of value: mappings become MappingProxyType, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain dicts again, for pickling: MappingProxyType can't be pickled."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
+
+
+def hashable(value: Any) -> Any:
+    # frozenset, not tuple, so mappings equal in any order hash the same
+    if isinstance(value, Mapping):
+        return frozenset((key, hashable(item)) for key, item in value.items())
+    if isinstance(value, tuple):
+        return tuple(hashable(item) for item in value)
+    return value
+
+
+def attack_power_range(profile: CreatureProfile) -> Tuple[int, int]:
+    """Weakest and strongest attack power a creature of the profile can evolve."""
+    low, high = profile["base_attack_range"]
+    claws = [claw.value for claw in CLAW_SIZES]
+    teeth = [sharpness.value for sharpness in TEETH_SHARPNESSES]
+    return low * min(claws) + min(teeth), high * max(claws) + max(teeth)
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """
+    The constants a Simulation plays by. Pass one as Simulation(config=...)
+    to run with other numbers than constants.py without re-importing it.
+
+    The tables derived from a config are built the first time they're used
+    and kept per process for every equal config, so simulations sharing a
+    config share its movement table and chain. They aren't pickled: a worker
+    process builds its own once per config, however many tasks carry it.
+
+    The stats and profiles are deep-copied into read-only mappings, so a
+    config is hashable and changing the dicts it was made from after its
+    tables are built can't make it disagree with them.
+    """
+
+    movement_stats: Mapping[str, MovementStats] = field(
+        default_factory=lambda: MOVEMENT_STATS
+    )
+    predator_profile: CreatureProfile = field(default_factory=lambda: PREDATOR_PROFILE)
+    prey_profile: CreatureProfile = field(default_factory=lambda: PRAY_PROFILE)
+    world_max_position: int = WORLD_MAX_POSITION
+    simulation_count: int = SIMULATION_COUNT
+    max_iterations: int = 1000
+
+    def __post_init__(self) -> None:
+        for name in ("movement_stats", "predator_profile", "prey_profile"):
+            object.__setattr__(self, name, freeze(getattr(self, name)))
+
+    def __hash__(self) -> int:
+        return hash(tuple(hashable(getattr(self, item.name)) for item in fields(self)))
+
+    @cached_property
+    def movement_table(self) -> MovementTable:
+        return movement_tables(self)[0]
+
+    @cached_property
+    def movement_chain(self) -> MovementHandler:
+        return movement_tables(self)[1]
+
+    @cached_property
+    def predator_attack_range(self) -> Tuple[int, int]:
+        return attack_power_range(self.predator_profile)
+
+    @cached_property
+    def prey_attack_range(self) -> Tuple[int, int]:
+        return attack_power_range(self.prey_profile)
+
+    def profile(self, type: int) -> CreatureProfile:
+        """Profile of creature type 0 (predator) or any other type (prey)."""
+        return self.predator_profile if type == 0 else self.prey_profile
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {item.name: thaw(getattr(self, item.name)) for item in fields(self)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        vars(self).update(state)
+        self.__post_init__()
+
+
+@lru_cache(maxsize=None)
+def movement_tables(
+    config: SimulationConfig,
+) -> Tuple[MovementTable, MovementHandler]:
+    """Movement table and chain of config, built once per process."""
+    # The shared table keeps gaits added with register_gait and chase tables
+    if config.movement_stats == MOVEMENT_STATS:
+        table = MOVEMENT_TABLE
+    else:
+        table = MovementTable(config.movement_stats)
+    return table, FlyHandler(RunHandler(WalkHandler(HopHandler())), table=table)
+
+
+DEFAULT_CONFIG = SimulationConfig()
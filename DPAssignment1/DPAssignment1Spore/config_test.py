@@ -0,0 +1,129 @@
+import dataclasses
+import pickle
+import random
+from dataclasses import replace
+from typing import List
+
+import pytest
+
+from batch import BatchSimulation, CreatureColumns
+from closed_form import resolve_chase
+from config import DEFAULT_CONFIG, SimulationConfig, attack_power_range
+from constants import MOVEMENT_STATS, PRAY_PROFILE, PREDATOR_PROFILE
+from movement_table import MOVEMENT_TABLE
+from simulate import Simulation
+from sinks import CounterSink
+
+# Every gait twice as fast as in constants.py
+FAST_STATS = {
+    name: {**stats, "speed": stats["speed"] * 2}
+    for name, stats in MOVEMENT_STATS.items()
+}
+
+
+@pytest.fixture
+def fast() -> SimulationConfig:
+    return SimulationConfig(movement_stats=FAST_STATS)  # type: ignore[arg-type]
+
+
+class TestSimulationConfig:
+    def test_default_config_uses_constants(self) -> None:
+        simulation = Simulation()
+
+        assert simulation.config is DEFAULT_CONFIG
+        assert simulation.movement_chain.table is MOVEMENT_TABLE
+        assert simulation.MAX_ITERATIONS == 1000
+
+    def test_config_is_immutable(self) -> None:
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            DEFAULT_CONFIG.world_max_position = 5  # type: ignore[misc]
+
+    def test_copies_the_dicts_it_is_given(self) -> None:
+        stats = {name: dict(gait) for name, gait in MOVEMENT_STATS.items()}
+        config = SimulationConfig(movement_stats=stats)  # type: ignore[arg-type]
+        config.movement_chain
+
+        stats["fly"]["speed"] = 99
+
+        assert config.movement_stats["fly"]["speed"] == 8
+        assert config.movement_chain.resolve(0, 2).move(100) == (8, 4)
+        with pytest.raises(TypeError):
+            config.movement_stats["fly"]["speed"] = 99
+
+    def test_config_is_hashable(self, fast: SimulationConfig) -> None:
+        assert hash(SimulationConfig()) == hash(DEFAULT_CONFIG)
+        assert {DEFAULT_CONFIG: 1, fast: 2}[SimulationConfig()] == 1
+
+    def test_derived_tables_are_built_once(self, fast: SimulationConfig) -> None:
+        assert fast.movement_table is not MOVEMENT_TABLE
+        assert fast.movement_table is fast.movement_table
+        assert Simulation(config=fast).movement_chain is fast.movement_chain
+
+    def test_attack_power_ranges(self) -> None:
+        assert DEFAULT_CONFIG.predator_attack_range == (30 * 2 + 3, 45 * 4 + 9)
+        assert DEFAULT_CONFIG.prey_attack_range == attack_power_range(PRAY_PROFILE)
+
+    def test_movement_stats_change_the_chase(self, fast: SimulationConfig) -> None:
+        strategy = fast.movement_chain.resolve(legs=0, wings=2)
+
+        assert strategy.name == "fly"
+        assert strategy.move(100) == (16, 4)
+        # The default chain is untouched
+        assert DEFAULT_CONFIG.movement_chain.resolve(0, 2).move(100) == (8, 4)
+
+    def test_engines_agree_under_a_config(self, fast: SimulationConfig) -> None:
+        simulation = Simulation(random.Random(4), config=fast)
+        matchups = [simulation.create_matchup() for _ in range(300)]
+        predators = [predator for predator, _ in matchups]
+        prey = [p for _, p in matchups]
+
+        caught = BatchSimulation(simulation).simulate_chase(
+            CreatureColumns.from_creatures(predators),
+            CreatureColumns.from_creatures(prey),
+        )
+        closed = [
+            resolve_chase(replace(a), replace(b), simulation.movement_chain, 1000)
+            for a, b in matchups
+        ]
+        stepped = [simulation.simulate_chase(a, b) for a, b in matchups]
+
+        assert closed == stepped
+        assert list(caught) == [result.caught for result in stepped]
+
+    def test_profiles_and_world_size(self) -> None:
+        config = SimulationConfig(
+            predator_profile={**PREDATOR_PROFILE, "wings_range": (0, 0)},
+            world_max_position=10,
+        )
+        simulation = Simulation(random.Random(2), config=config)
+
+        for _ in range(200):
+            predator, prey = simulation.create_matchup()
+            assert predator.wings == 0
+            assert 0 <= prey.position <= 10
+
+    def test_configs_back_to_back(self, fast: SimulationConfig) -> None:
+        def run(config: SimulationConfig) -> List[bool]:
+            simulation = Simulation(random.Random(9), sink=CounterSink(), config=config)
+            return simulation.run_simulation(300)
+
+        default = run(DEFAULT_CONFIG)
+
+        assert run(fast) != default
+        assert run(DEFAULT_CONFIG) == default
+
+    def test_pickles_without_derived_tables(self, fast: SimulationConfig) -> None:
+        fast.movement_chain
+        copy = pickle.loads(pickle.dumps(fast))
+
+        assert copy == fast
+        assert "movement_chain" not in vars(copy)
+        assert copy.movement_chain.resolve(0, 2).move(100) == (16, 4)
+
+    def test_unpickled_copies_share_derived_tables(
+        self, fast: SimulationConfig
+    ) -> None:
+        copies = [pickle.loads(pickle.dumps(fast)) for _ in range(3)]
+
+        assert all(copy.movement_chain is fast.movement_chain for copy in copies)
+        assert all(copy.movement_table is fast.movement_table for copy in copies)
@@ -34,4 +34,27 @@ BASE_ATTACK_RANGE_PREDATOR: Tuple[int, int] = (30, 45)
 
 INITIAL_HEALTH_RANGE_PRAY: Tuple[int, int] = (30, 100)
 INITIAL_STAMINA_RANGE_PRAY: Tuple[int, int] = (300, 500)
-BASE_ATTACK_RANGE_PRAY: Tuple[int, int] = (20, 25)
\ No newline at end of file
+BASE_ATTACK_RANGE_PRAY: Tuple[int, int] = (20, 25)
+
+class CreatureProfile(TypedDict):
+    legs_range: Tuple[int, int]
+    wings_range: Tuple[int, int]
+    health_range: Tuple[int, int]
+    stamina_range: Tuple[int, int]
+    base_attack_range: Tuple[int, int]
+
+PREDATOR_PROFILE: CreatureProfile = {
+    "legs_range": (0, 4),
+    "wings_range": (0, 2),
+    "health_range": INITIAL_HEALTH_RANGE_PREDATOR,
+    "stamina_range": INITIAL_STAMINA_RANGE_PREDATOR,
+    "base_attack_range": BASE_ATTACK_RANGE_PREDATOR,
+}
+
+PRAY_PROFILE: CreatureProfile = {
+    "legs_range": (0, 3),
+    "wings_range": (0, 1),
+    "health_range": INITIAL_HEALTH_RANGE_PRAY,
+    "stamina_range": INITIAL_STAMINA_RANGE_PRAY,
+    "base_attack_range": BASE_ATTACK_RANGE_PRAY,
+}
@@ -1,77 +1,177 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
+from weakref import WeakSet
 
-from constants import ClawSize, TeethSharpness
+import numpy as np
+import numpy.typing as npt
+
+from constants import ClawSize, CreatureProfile, TeethSharpness
+from movement_table import MOVEMENT_TABLE, MovementTable
+
+if TYPE_CHECKING:
+    from population import CreaturePopulation
+
+CLAW_SIZES: Tuple[ClawSize, ...] = tuple(ClawSize)
+TEETH_SHARPNESSES: Tuple[TeethSharpness, ...] = tuple(TeethSharpness)
 
 # Movement Strategy Pattern
-class MovementStrategy(ABC):
-    @abstractmethod
+class MovementStrategy:
+    # Key of this strategy's row in its movement table
+    name: str
+
+    def __init__(
+        self, name: Optional[str] = None, table: Optional[MovementTable] = None
+    ) -> None:
+        if name is not None:
+            self.name = name
+        self.table = table if table is not None else MOVEMENT_TABLE
+        self.mode = self.table.mode(self.name)
+        speed, stamina_cost, self.threshold = self.table.rows[self.mode]
+        self.step = (speed, stamina_cost)
+
+    def bind(self, table: MovementTable) -> "MovementStrategy":
+        """This gait, with its numbers read from another movement table."""
+        return self if table is self.table else type(self)(self.name, table)
+
     def move(self, stamina: int) -> Tuple[int, int]:  # Returns (speed, stamina_cost)
-        pass
+        return self.step if stamina >= self.threshold else (0, 0)
 
 class CrawlStrategy(MovementStrategy):
-    def move(self, stamina: int) -> Tuple[int, int]:
-        return (1, 1)
+    name = "crawl"
 
 class HopStrategy(MovementStrategy):
-    def move(self, stamina: int) -> Tuple[int, int]:
-        return (3, 2) if stamina >= 20 else (0, 0)
+    name = "hop"
 
 class WalkStrategy(MovementStrategy):
-    def move(self, stamina: int) -> Tuple[int, int]:
-        return (4, 2) if stamina >= 40 else (0, 0)
+    name = "walk"
 
 class RunStrategy(MovementStrategy):
-    def move(self, stamina: int) -> Tuple[int, int]:
-        return (6, 4) if stamina >= 60 else (0, 0)
+    name = "run"
 
 class FlyStrategy(MovementStrategy):
-    def move(self, stamina: int) -> Tuple[int, int]:
-        return (8, 4) if stamina >= 80 else (0, 0)
+    name = "fly"
 
 # Movement Chain of Responsibility
 class MovementHandler(ABC):
-    def __init__(self, successor: Optional["MovementHandler"] = None) -> None:
+    def __init__(
+        self,
+        successor: Optional["MovementHandler"] = None,
+        table: Optional[MovementTable] = None,
+    ) -> None:
+        self._strategies: Dict[Tuple[int, int], MovementStrategy] = {}
+        # Handlers whose successor this is, whose caches rewiring it invalidates
+        self._predecessors: "WeakSet[MovementHandler]" = WeakSet()
+        self._successor: Optional["MovementHandler"] = None
         self.successor = successor
+        # Movement table of the strategies this handler gives out when it heads
+        # a chain; the successors' own tables are ignored
+        self.table = table if table is not None else MOVEMENT_TABLE
+
+    @property
+    def successor(self) -> Optional["MovementHandler"]:
+        return self._successor
+
+    @successor.setter
+    def successor(self, successor: Optional["MovementHandler"]) -> None:
+        if self._successor is not None:
+            self._successor._predecessors.discard(self)
+        self._successor = successor
+        if successor is not None:
+            successor._predecessors.add(self)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        # Clears the cache of every chain running through this handler, and
+        # only theirs
+        pending = [self]
+        seen: Set[int] = set()
+        while pending:
+            handler = pending.pop()
+            if id(handler) in seen:
+                continue
+            seen.add(id(handler))
+            handler._strategies.clear()
+            pending.extend(handler._predecessors)
+
+    def resolve(self, legs: int, wings: int) -> MovementStrategy:
+        """
+        Returns the strategy for a body plan. The chain only looks at legs and wings,
+        so it is walked once per body plan and the strategy instance is shared.
+        """
+        key = (legs, wings)
+        strategy = self._strategies.get(key)
+        if strategy is None:
+            strategy = self.handle(Creature(legs=legs, wings=wings))
+            self._strategies[key] = strategy
+        return strategy
 
-    @abstractmethod
     def handle(self, creature: "Creature") -> MovementStrategy:
+        return self._walk(creature)[0]
+
+    def depth(self, legs: int, wings: int) -> int:
+        """How many handlers resolving a body plan visits, this one included."""
+        return self._walk(Creature(legs=legs, wings=wings))[1]
+
+    def _walk(self, creature: "Creature") -> Tuple[MovementStrategy, int]:
+        handler = self
+        depth = 1
+        while True:
+            strategy = handler.accept(creature)
+            if strategy is not None:
+                return strategy.bind(self.table), depth
+            if handler.successor is None:
+                return CrawlStrategy(table=self.table), depth
+            handler = handler.successor
+            depth += 1
+
+    @abstractmethod
+    def accept(self, creature: "Creature") -> Optional[MovementStrategy]:
+        """The strategy this handler gives the creature, or None to pass it on."""
         pass
 
 class FlyHandler(MovementHandler):
-    def handle(self, creature: "Creature") -> MovementStrategy:
-        if creature.wings >= 2:
-            return FlyStrategy()
-        if self.successor:
-            return self.successor.handle(creature)
-        return CrawlStrategy()
+    def accept(self, creature: "Creature") -> Optional[MovementStrategy]:
+        return FlyStrategy() if creature.wings >= 2 else None
 
 class RunHandler(MovementHandler):
-    def handle(self, creature: "Creature") -> MovementStrategy:
-        if creature.legs >= 2:
-            return RunStrategy()
-        if self.successor:
-            return self.successor.handle(creature)
-        return CrawlStrategy()
+    def accept(self, creature: "Creature") -> Optional[MovementStrategy]:
+        return RunStrategy() if creature.legs >= 2 else None
 
 class WalkHandler(MovementHandler):
-    def handle(self, creature: "Creature") -> MovementStrategy:
-        if creature.legs >= 2:
-            return WalkStrategy()
-        if self.successor:
-            return self.successor.handle(creature)
-        return CrawlStrategy()
+    def accept(self, creature: "Creature") -> Optional[MovementStrategy]:
+        return WalkStrategy() if creature.legs >= 2 else None
 
 class HopHandler(MovementHandler):
-    def handle(self, creature: "Creature") -> MovementStrategy:
-        if creature.legs >= 1:
-            return HopStrategy()
-        if self.successor:
-            return self.successor.handle(creature)
-        return CrawlStrategy()
+    def accept(self, creature: "Creature") -> Optional[MovementStrategy]:
+        return HopStrategy() if creature.legs >= 1 else None
+
+class GaitHandler(MovementHandler):
+    """
+    Gives a gait from MOVEMENT_TABLE to creatures with at least the given legs
+    and wings, so a gait added with register_gait can join a chain without
+    classes of its own.
+    """
 
-@dataclass
+    def __init__(
+        self,
+        gait: str,
+        legs: int = 0,
+        wings: int = 0,
+        successor: Optional[MovementHandler] = None,
+        table: Optional[MovementTable] = None,
+    ) -> None:
+        super().__init__(successor, table)
+        self.strategy = MovementStrategy(gait, table)
+        self.legs = legs
+        self.wings = wings
+
+    def accept(self, creature: "Creature") -> Optional[MovementStrategy]:
+        if creature.legs >= self.legs and creature.wings >= self.wings:
+            return self.strategy
+        return None
+
+@dataclass(slots=True)
 class Creature:
     legs: int = 0
     wings: int = 0
@@ -86,7 +186,7 @@ class Creature:
         return (self.base_attack * self.claw_multiplier) + self.teeth_bonus
 
     def move(self, movement_chain: MovementHandler) -> Tuple[int, int]:
-        strategy = movement_chain.handle(self)
+        strategy = movement_chain.resolve(self.legs, self.wings)
         return strategy.move(self.stamina)
 
 # Creature Builder Pattern
@@ -134,4 +234,33 @@ class CreatureBuilder:
     def build(self) -> Creature:
         creature = self._creature
         self.reset()
-        return creature
\ No newline at end of file
+        return creature
+
+    @staticmethod
+    def build_many(
+        n: int, profile: CreatureProfile, rng: Optional[np.random.Generator] = None
+    ) -> "CreaturePopulation":
+        """
+        Builds n random creatures of a profile with one vectorized draw per trait.
+        Every creature starts at position 0.
+        """
+        from population import CreaturePopulation
+
+        generator = rng if rng is not None else np.random.default_rng()
+        population = CreaturePopulation(n)
+        columns = population.columns
+
+        def draw(bounds: Tuple[int, int]) -> npt.NDArray[np.int64]:
+            return generator.integers(bounds[0], bounds[1], size=n, endpoint=True)
+
+        columns["legs"][:] = draw(profile["legs_range"])
+        columns["wings"][:] = draw(profile["wings_range"])
+        columns["health"][:] = draw(profile["health_range"])
+        columns["stamina"][:] = draw(profile["stamina_range"])
+        columns["base_attack"][:] = draw(profile["base_attack_range"])
+        claws = [claw.value for claw in CLAW_SIZES]
+        teeth = [sharpness.value for sharpness in TEETH_SHARPNESSES]
+        columns["claw_multiplier"][:] = generator.choice(claws, n)
+        columns["teeth_bonus"][:] = generator.choice(teeth, n)
+
+        return population
\ No newline at end of file
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 
+from constants import PRAY_PROFILE, PREDATOR_PROFILE, CreatureProfile
 from creature import (
     ClawSize,
     Creature,
@@ -100,4 +102,32 @@ class TestCreatureBuilder:
         creature = builder.add_legs(1).add_wings(1).build()
 
         assert creature.legs == 1
-        assert creature.wings == 1
\ No newline at end of file
+        assert creature.wings == 1
+
+class TestBuildMany:
+    @pytest.mark.parametrize("profile", [PREDATOR_PROFILE, PRAY_PROFILE])
+    def test_traits_within_profile(self, profile: CreatureProfile) -> None:
+        population = CreatureBuilder.build_many(
+            10_000, profile, np.random.default_rng(0)
+        )
+        columns = population.columns
+
+        assert len(population) == 10_000
+        for column, (low, high) in (
+            (columns["legs"], profile["legs_range"]),
+            (columns["wings"], profile["wings_range"]),
+            (columns["health"], profile["health_range"]),
+            (columns["stamina"], profile["stamina_range"]),
+            (columns["base_attack"], profile["base_attack_range"]),
+        ):
+            assert column.min() == low
+            assert column.max() == high
+        assert set(columns["claw_multiplier"]) == {c.value for c in ClawSize}
+        assert set(columns["teeth_bonus"]) == {t.value for t in TeethSharpness}
+        assert not columns["position"].any()
+
+    def test_same_seed_same_population(self) -> None:
+        first = CreatureBuilder.build_many(100, PRAY_PROFILE, np.random.default_rng(1))
+        second = CreatureBuilder.build_many(100, PRAY_PROFILE, np.random.default_rng(1))
+
+        assert [v.to_creature() for v in first] == [v.to_creature() for v in second]
@@ -0,0 +1,358 @@
+import argparse
+import pickle
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch import BatchSimulation, CreatureColumns
+from config import DEFAULT_CONFIG, SimulationConfig
+from constants import ClawSize, CreatureProfile, TeethSharpness
+from creature import CLAW_SIZES, TEETH_SHARPNESSES, Creature, CreatureBuilder
+from simulate import Simulation
+
+# Matchups per unit of work sent to the process pool
+CHUNK_SIZE: int = 2000
+
+# Stat mutations move a gene by up to this fraction of the profile's range
+STAT_STEP: float = 0.1
+
+
+@dataclass(frozen=True)
+class Genome:
+    legs: int
+    wings: int
+    claws: ClawSize
+    teeth: TeethSharpness
+    health: int
+    stamina: int
+    base_attack: int
+
+    @classmethod
+    def random(cls, rng: random.Random, profile: CreatureProfile) -> "Genome":
+        return cls(
+            legs=rng.randint(*profile["legs_range"]),
+            wings=rng.randint(*profile["wings_range"]),
+            claws=rng.choice(CLAW_SIZES),
+            teeth=rng.choice(TEETH_SHARPNESSES),
+            health=rng.randint(*profile["health_range"]),
+            stamina=rng.randint(*profile["stamina_range"]),
+            base_attack=rng.randint(*profile["base_attack_range"]),
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.legs}L{self.wings}W {self.claws.name[0]}/{self.teeth.name[0]} "
+            f"{self.health}hp {self.stamina}st {self.base_attack}atk"
+        )
+
+    def express(self, position: int = 0) -> Creature:
+        """The creature this genome grows into."""
+        return (
+            CreatureBuilder()
+            .add_legs(self.legs)
+            .add_wings(self.wings)
+            .add_claws(self.claws)
+            .add_teeth(self.teeth)
+            .set_health(self.health)
+            .set_stamina(self.stamina)
+            .set_base_attack(self.base_attack)
+            .set_position(position)
+            .build()
+        )
+
+
+def tournament(
+    rng: random.Random, genomes: Sequence[Genome], fitness: Sequence[float], size: int
+) -> Genome:
+    """The fittest of size genomes drawn at random."""
+    contenders = [rng.randrange(len(genomes)) for _ in range(size)]
+    return genomes[max(contenders, key=lambda index: fitness[index])]
+
+
+def crossover(rng: random.Random, mother: Genome, father: Genome) -> Genome:
+    """Takes every gene from either parent with equal odds."""
+    return Genome(
+        **{
+            gene.name: getattr(rng.choice((mother, father)), gene.name)
+            for gene in fields(Genome)
+        }
+    )
+
+
+def mutate(
+    rng: random.Random, genome: Genome, profile: CreatureProfile, rate: float
+) -> Genome:
+    """
+    Mutates every gene with probability rate. Body parts, claws and teeth are
+    redrawn, stats take a step of up to STAT_STEP of their range. Genes stay
+    within the profile.
+    """
+
+    def stat(value: int, bounds: Tuple[int, int]) -> int:
+        low, high = bounds
+        step = max(1, round((high - low) * STAT_STEP))
+        return min(high, max(low, value + rng.randint(-step, step)))
+
+    changes: Dict[str, Any] = {}
+    if rng.random() < rate:
+        changes["legs"] = rng.randint(*profile["legs_range"])
+    if rng.random() < rate:
+        changes["wings"] = rng.randint(*profile["wings_range"])
+    if rng.random() < rate:
+        changes["claws"] = rng.choice(CLAW_SIZES)
+    if rng.random() < rate:
+        changes["teeth"] = rng.choice(TEETH_SHARPNESSES)
+    if rng.random() < rate:
+        changes["health"] = stat(genome.health, profile["health_range"])
+    if rng.random() < rate:
+        changes["stamina"] = stat(genome.stamina, profile["stamina_range"])
+    if rng.random() < rate:
+        changes["base_attack"] = stat(genome.base_attack, profile["base_attack_range"])
+    return replace(genome, **changes)
+
+
+def breed(
+    rng: random.Random,
+    genomes: Sequence[Genome],
+    fitness: Sequence[float],
+    profile: CreatureProfile,
+    mutation_rate: float,
+    tournament_size: int,
+    elite: int,
+) -> List[Genome]:
+    """The elite fittest genomes unchanged, then children of tournament winners."""
+    ranked = sorted(range(len(genomes)), key=lambda index: -fitness[index])
+    children = [genomes[index] for index in ranked[:elite]]
+    while len(children) < len(genomes):
+        mother = tournament(rng, genomes, fitness, tournament_size)
+        father = tournament(rng, genomes, fitness, tournament_size)
+        children.append(
+            mutate(rng, crossover(rng, mother, father), profile, mutation_rate)
+        )
+    return children
+
+
+def evaluate_chunk(
+    predators: Sequence[Genome],
+    prey: Sequence[Genome],
+    positions: Sequence[int],
+    config: Optional[SimulationConfig] = None,
+) -> List[bool]:
+    """Plays predators[i] against prey[i] starting at positions[i], in one batch."""
+    won = BatchSimulation(Simulation(config=config)).resolve_matchups(
+        CreatureColumns.from_creatures([genome.express() for genome in predators]),
+        CreatureColumns.from_creatures(
+            [genome.express(position) for genome, position in zip(prey, positions)]
+        ),
+    )
+    return [bool(outcome) for outcome in won]
+
+
+@dataclass
+class EvolutionState:
+    """
+    Everything needed to carry on evolving from a generation, the config it
+    evolves by included. Saved as a pickle, see checkpoint.py for why run
+    checkpoints aren't.
+    """
+
+    generation: int
+    predators: List[Genome]
+    prey: List[Genome]
+    rng_state: Any
+    config: SimulationConfig = DEFAULT_CONFIG
+
+    @classmethod
+    def initial(
+        cls, size: int, seed: int, config: SimulationConfig = DEFAULT_CONFIG
+    ) -> "EvolutionState":
+        rng = random.Random(seed)
+        return cls(
+            generation=0,
+            predators=[
+                Genome.random(rng, config.predator_profile) for _ in range(size)
+            ],
+            prey=[Genome.random(rng, config.prey_profile) for _ in range(size)],
+            rng_state=rng.getstate(),
+            config=config,
+        )
+
+    def save(self, path: Path) -> None:
+        """Writes the state to path, replacing the previous checkpoint atomically."""
+        partial = path.with_suffix(".partial")
+        with open(partial, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+        partial.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "EvolutionState":
+        with open(path, "rb") as file:
+            state = pickle.load(file)
+        if not isinstance(state, cls):
+            raise ValueError(f"{path} is not an evolution checkpoint")
+        return state
+
+
+@dataclass(frozen=True)
+class GenerationReport:
+    generation: int
+    evaluations: int
+    seconds: float
+    best_predator: Genome
+    predator_fitness: float
+    best_prey: Genome
+    prey_fitness: float
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return self.evaluations / self.seconds if self.seconds else 0.0
+
+
+def evaluate(
+    pool: Executor, state: EvolutionState, rng: random.Random, matches: int
+) -> Tuple[List[float], List[float]]:
+    """
+    Plays every genome in matches matchups against random opponents. Returns the
+    predators' win rates and the prey's survival rates. Pairings and positions
+    are drawn here, so the outcome doesn't depend on how the pool splits the work.
+    """
+    size = len(state.predators)
+    predator_index: List[int] = []
+    prey_index: List[int] = []
+    for _ in range(matches):
+        opponents = list(range(size))
+        rng.shuffle(opponents)
+        predator_index.extend(range(size))
+        prey_index.extend(opponents)
+    positions = [
+        rng.randint(0, state.config.world_max_position) for _ in predator_index
+    ]
+
+    starts = range(0, len(positions), CHUNK_SIZE)
+    outcomes = pool.map(
+        evaluate_chunk,
+        [
+            [state.predators[i] for i in predator_index[s : s + CHUNK_SIZE]]
+            for s in starts
+        ],
+        [[state.prey[i] for i in prey_index[s : s + CHUNK_SIZE]] for s in starts],
+        [positions[s : s + CHUNK_SIZE] for s in starts],
+        [state.config] * len(starts),
+    )
+    won = np.concatenate([np.array(chunk, dtype=np.bool_) for chunk in outcomes])
+
+    predator_wins = np.bincount(predator_index, weights=won, minlength=size)
+    prey_losses = np.bincount(prey_index, weights=won, minlength=size)
+    return list(predator_wins / matches), list(1 - prey_losses / matches)
+
+
+def run_evolution(
+    state: EvolutionState,
+    generations: int,
+    matches: int = 10,
+    mutation_rate: float = 0.1,
+    tournament_size: int = 3,
+    elite: int = 2,
+    workers: Optional[int] = None,
+    checkpoint: Optional[Path] = None,
+) -> Iterator[GenerationReport]:
+    """
+    Evolves state until it reaches the given generation, yielding a report per
+    generation. When checkpoint is set the state is saved there after every
+    generation, so a run resumed from it continues exactly where it stopped.
+    """
+    rng = random.Random()
+    rng.setstate(state.rng_state)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while state.generation < generations:
+            started = time.perf_counter()
+            predator_fitness, prey_fitness = evaluate(pool, state, rng, matches)
+            seconds = time.perf_counter() - started
+
+            best_predator = max(
+                range(len(predator_fitness)), key=predator_fitness.__getitem__
+            )
+            best_prey = max(range(len(prey_fitness)), key=prey_fitness.__getitem__)
+            report = GenerationReport(
+                generation=state.generation,
+                evaluations=len(state.predators) * matches,
+                seconds=seconds,
+                best_predator=state.predators[best_predator],
+                predator_fitness=predator_fitness[best_predator],
+                best_prey=state.prey[best_prey],
+                prey_fitness=prey_fitness[best_prey],
+            )
+
+            state = EvolutionState(
+                generation=state.generation + 1,
+                predators=breed(
+                    rng,
+                    state.predators,
+                    predator_fitness,
+                    state.config.predator_profile,
+                    mutation_rate,
+                    tournament_size,
+                    elite,
+                ),
+                prey=breed(
+                    rng,
+                    state.prey,
+                    prey_fitness,
+                    state.config.prey_profile,
+                    mutation_rate,
+                    tournament_size,
+                    elite,
+                ),
+                rng_state=rng.getstate(),
+                config=state.config,
+            )
+            if checkpoint is not None:
+                state.save(checkpoint)
+            yield report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evolve predators and prey.")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--matches", type=int, default=10)
+    parser.add_argument("--mutation-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--checkpoint", type=Path, default=None)
+    parser.add_argument(
+        "--resume", action="store_true", help="continue from --checkpoint"
+    )
+    args = parser.parse_args()
+
+    if args.resume:
+        if args.checkpoint is None:
+            parser.error("--resume needs --checkpoint")
+        state = EvolutionState.load(args.checkpoint)
+    else:
+        state = EvolutionState.initial(args.size, args.seed)
+
+    for report in run_evolution(
+        state,
+        args.generations,
+        matches=args.matches,
+        mutation_rate=args.mutation_rate,
+        workers=args.workers,
+        checkpoint=args.checkpoint,
+    ):
+        print(
+            f"generation {report.generation}: "
+            f"predator {report.predator_fitness:.2f} {report.best_predator}, "
+            f"prey {report.prey_fitness:.2f} {report.best_prey}, "
+            f"{report.evaluations_per_second:,.0f} evaluations/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import random
+from dataclasses import fields
+from pathlib import Path
+from typing import List
+
+from config import SimulationConfig
+from constants import PRAY_PROFILE, PREDATOR_PROFILE, ClawSize, TeethSharpness
+from evolution import (
+    EvolutionState,
+    GenerationReport,
+    Genome,
+    crossover,
+    mutate,
+    run_evolution,
+)
+
+
+def genome(legs: int = 2, health: int = 100) -> Genome:
+    return Genome(
+        legs=legs,
+        wings=0,
+        claws=ClawSize.LARGE,
+        teeth=TeethSharpness.SHARP,
+        health=health,
+        stamina=600,
+        base_attack=40,
+    )
+
+
+class TestGenome:
+    def test_express(self) -> None:
+        creature = genome().express(position=30)
+        assert creature.legs == 2
+        assert creature.position == 30
+        assert creature.get_attack_power() == 40 * 4 + 6
+
+    def test_crossover_takes_genes_from_parents(self) -> None:
+        mother, father = genome(legs=1, health=60), genome(legs=4, health=140)
+        child = crossover(random.Random(1), mother, father)
+        for gene in fields(Genome):
+            assert getattr(child, gene.name) in (
+                getattr(mother, gene.name),
+                getattr(father, gene.name),
+            )
+
+    def test_mutation_stays_within_profile(self) -> None:
+        rng = random.Random(2)
+        current = genome(health=PREDATOR_PROFILE["health_range"][1])
+        for _ in range(500):
+            current = mutate(rng, current, PREDATOR_PROFILE, rate=1.0)
+            for gene in ("legs", "wings", "health", "stamina", "base_attack"):
+                low, high = PREDATOR_PROFILE[f"{gene}_range"]  # type: ignore[literal-required]
+                assert low <= getattr(current, gene) <= high
+
+    def test_no_mutation_at_rate_zero(self) -> None:
+        assert (
+            mutate(random.Random(3), genome(), PREDATOR_PROFILE, rate=0.0) == genome()
+        )
+
+
+class TestEvolution:
+    def test_reports_every_generation(self) -> None:
+        reports = list(run_evolution(EvolutionState.initial(20, seed=4), 3, matches=5))
+        assert [report.generation for report in reports] == [0, 1, 2]
+        assert all(report.evaluations == 100 for report in reports)
+        assert all(0 <= report.predator_fitness <= 1 for report in reports)
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "evolution.pickle"
+        uninterrupted = list(run_evolution(EvolutionState.initial(20, seed=5), 4))
+
+        list(
+            run_evolution(EvolutionState.initial(20, seed=5), 2, checkpoint=checkpoint)
+        )
+        state = EvolutionState.load(checkpoint)
+        assert state.generation == 2
+        resumed = list(run_evolution(state, 4, checkpoint=checkpoint))
+
+        def best(reports: List[GenerationReport]) -> List[object]:
+            return [(r.best_predator, r.predator_fitness, r.best_prey) for r in reports]
+
+        assert best(resumed) == best(uninterrupted[2:])
+        assert EvolutionState.load(checkpoint).generation == 4
+
+    def test_evolves_by_the_config(self, tmp_path: Path) -> None:
+        config = SimulationConfig(
+            predator_profile={**PREDATOR_PROFILE, "legs_range": (3, 4)},
+            prey_profile={**PRAY_PROFILE, "wings_range": (0, 0)},
+            world_max_position=10,
+        )
+        checkpoint = tmp_path / "evolution.pickle"
+
+        reports = list(
+            run_evolution(
+                EvolutionState.initial(20, seed=6, config=config),
+                3,
+                mutation_rate=1.0,
+                checkpoint=checkpoint,
+            )
+        )
+        state = EvolutionState.load(checkpoint)
+
+        assert state.config == config
+        assert all(3 <= genome.legs <= 4 for genome in state.predators)
+        assert all(genome.wings == 0 for genome in state.prey)
+        assert all(3 <= report.best_predator.legs for report in reports)
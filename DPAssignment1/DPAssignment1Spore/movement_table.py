@@ -0,0 +1,75 @@
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from constants import MOVEMENT_STATS, MovementStats
+
+# Stamina threshold of gaits that never run out (MOVEMENT_STATS lists them as 0)
+ALWAYS_AVAILABLE: int = int(np.iinfo(np.int64).min)
+
+# (speed, stamina cost, stamina threshold) of one gait
+Row = Tuple[int, int, int]
+
+
+class MovementTable:
+    """
+    Speed, stamina cost and stamina threshold of every gait, one row per mode.
+    Movement strategies read their row as Python ints, the vectorized engines
+    index the NumPy columns with arrays of modes, and both get the numbers
+    from here rather than from literals of their own.
+    """
+
+    def __init__(self, stats: Mapping[str, MovementStats]) -> None:
+        self.modes: Dict[str, int] = {}
+        self.stats: List[MovementStats] = []
+        self.rows: List[Row] = []
+        for name, gait in stats.items():
+            self.add(name, gait)
+
+    def add(self, name: str, stats: MovementStats) -> int:
+        """
+        Adds a gait and returns its mode. Gaits added at runtime aren't seen
+        by worker processes unless they add them too.
+        """
+        if name in self.modes:
+            raise ValueError(f"gait {name!r} is already in the movement table")
+        self.modes[name] = len(self.rows)
+        self.stats.append(stats)
+        self.rows.append(
+            (
+                stats["speed"],
+                stats["stamina_cost"],
+                stats["stamina_required"] or ALWAYS_AVAILABLE,
+            )
+        )
+        columns = np.array(self.rows, dtype=np.int64)
+        self.speed: npt.NDArray[np.int64] = columns[:, 0]
+        self.stamina_cost: npt.NDArray[np.int64] = columns[:, 1]
+        self.threshold: npt.NDArray[np.int64] = columns[:, 2]
+        return self.modes[name]
+
+    def mode(self, name: str) -> int:
+        return self.modes[name]
+
+    def move(self, mode: int, stamina: int) -> Tuple[int, int]:
+        """(speed, stamina cost) of one tick in the given mode."""
+        speed, cost, threshold = self.rows[mode]
+        return (speed, cost) if stamina >= threshold else (0, 0)
+
+
+MOVEMENT_TABLE = MovementTable(MOVEMENT_STATS)
+
+
+def register_gait(
+    name: str, speed: int, stamina_cost: int, stamina_required: int
+) -> int:
+    """Adds a custom gait to MOVEMENT_TABLE and returns its mode."""
+    return MOVEMENT_TABLE.add(
+        name,
+        {
+            "speed": speed,
+            "stamina_cost": stamina_cost,
+            "stamina_required": stamina_required,
+        },
+    )
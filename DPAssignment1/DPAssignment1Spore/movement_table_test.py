@@ -0,0 +1,105 @@
+import random
+from dataclasses import replace
+
+import pytest
+
+from batch import BatchSimulation, CreatureColumns
+from closed_form import resolve_chase
+from constants import MOVEMENT_STATS
+from creature import (
+    CrawlStrategy,
+    FlyHandler,
+    GaitHandler,
+    HopHandler,
+    MovementStrategy,
+    RunHandler,
+    WalkHandler,
+)
+from movement_table import (
+    ALWAYS_AVAILABLE,
+    MOVEMENT_TABLE,
+    MovementTable,
+    register_gait,
+)
+from simulate import Simulation
+
+
+@pytest.fixture
+def glide() -> MovementTable:
+    # A table of its own, so MOVEMENT_TABLE never sees the gait
+    table = MovementTable(MOVEMENT_STATS)
+    table.add("glide", {"speed": 5, "stamina_cost": 1, "stamina_required": 30})
+    return table
+
+
+class TestMovementTable:
+    def test_compiled_from_movement_stats(self) -> None:
+        for name, stats in MOVEMENT_STATS.items():
+            mode = MOVEMENT_TABLE.mode(name)
+            assert MOVEMENT_TABLE.speed[mode] == stats["speed"]
+            assert MOVEMENT_TABLE.stamina_cost[mode] == stats["stamina_cost"]
+        assert (
+            MOVEMENT_TABLE.threshold[MOVEMENT_TABLE.mode("crawl")] == ALWAYS_AVAILABLE
+        )
+
+    def test_strategies_read_the_table(self) -> None:
+        for name in MOVEMENT_STATS:
+            strategy = MovementStrategy(name)
+            for stamina in (-5, 0, 19, 20, 59, 60, 80, 500):
+                assert strategy.move(stamina) == MOVEMENT_TABLE.move(
+                    strategy.mode, stamina
+                )
+        assert CrawlStrategy().move(-10) == (1, 1)
+
+    def test_duplicate_gait_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            register_gait("fly", speed=1, stamina_cost=1, stamina_required=1)
+
+    def test_custom_gait_stays_in_its_table(self, glide: MovementTable) -> None:
+        assert glide.mode("glide") == len(MOVEMENT_STATS)
+        assert "glide" not in MOVEMENT_TABLE.modes
+
+    def test_custom_gait_joins_a_chain(self, glide: MovementTable) -> None:
+        chain = FlyHandler(
+            GaitHandler(
+                "glide", wings=1, successor=RunHandler(HopHandler()), table=glide
+            ),
+            table=glide,
+        )
+
+        strategy = chain.resolve(legs=0, wings=1)
+
+        assert strategy.name == "glide"
+        assert strategy.move(30) == (5, 1)
+        assert strategy.move(29) == (0, 0)
+        assert chain.resolve(legs=0, wings=2).name == "fly"
+
+    def test_engines_agree_on_custom_gait(self, glide: MovementTable) -> None:
+        simulation = Simulation(random.Random(6))
+        simulation.movement_chain = FlyHandler(
+            GaitHandler(
+                "glide",
+                wings=1,
+                successor=RunHandler(WalkHandler(HopHandler())),
+                table=glide,
+            ),
+            table=glide,
+        )
+        matchups = [simulation.create_matchup() for _ in range(300)]
+        predators = [predator for predator, _ in matchups]
+        prey = [p for _, p in matchups]
+
+        caught = BatchSimulation(simulation).simulate_chase(
+            CreatureColumns.from_creatures(predators),
+            CreatureColumns.from_creatures(prey),
+        )
+        closed = [
+            resolve_chase(
+                replace(a), replace(b), simulation.movement_chain, 1000
+            ).caught
+            for a, b in matchups
+        ]
+        ticked = [simulation.simulate_chase(a, b).caught for a, b in matchups]
+
+        assert list(caught) == ticked == closed
+        assert any(p.wings == 1 for p in prey)
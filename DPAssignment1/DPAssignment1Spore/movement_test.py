@@ -92,4 +92,46 @@ class TestMovementChain:
         strategy = movement_chain.handle(creature)
         speed, cost = strategy.move(creature.stamina)
         assert speed == 0
-        assert cost == 0
\ No newline at end of file
+        assert cost == 0
+
+    def test_depth(self, movement_chain: MovementHandler) -> None:
+        assert movement_chain.depth(legs=0, wings=2) == 1
+        assert movement_chain.depth(legs=2, wings=0) == 2
+        assert movement_chain.depth(legs=1, wings=0) == 4
+        assert movement_chain.depth(legs=0, wings=0) == 4
+
+    def test_resolve_shares_strategy_per_body_plan(
+        self, movement_chain: MovementHandler
+    ) -> None:
+        first = movement_chain.resolve(2, 2)
+        assert isinstance(first, FlyStrategy)
+        assert movement_chain.resolve(2, 2) is first
+        assert isinstance(movement_chain.resolve(1, 0), HopStrategy)
+
+    def test_resolve_cache_invalidated_on_rewire(
+        self, movement_chain: MovementHandler
+    ) -> None:
+        assert isinstance(movement_chain.resolve(1, 0), HopStrategy)
+
+        # Cut the chain after RunHandler
+        assert movement_chain.successor is not None
+        movement_chain.successor.successor = None
+
+        assert isinstance(movement_chain.resolve(1, 0), CrawlStrategy)
+
+    def test_other_chains_keep_their_cache(
+        self, movement_chain: MovementHandler
+    ) -> None:
+        first = movement_chain.resolve(2, 2)
+
+        FlyHandler(RunHandler(WalkHandler(HopHandler())))
+
+        assert movement_chain.resolve(2, 2) is first
+
+    def test_creature_move_uses_resolved_strategy(
+        self, movement_chain: MovementHandler
+    ) -> None:
+        creature = Creature(legs=2, stamina=100)
+        assert creature.move(movement_chain) == (6, 4)
+        creature.stamina = 10
+        assert creature.move(movement_chain) == (0, 0)
@@ -0,0 +1,122 @@
+import argparse
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from chase_table import ChaseTable
+from config import SimulationConfig
+from constants import SIMULATION_COUNT
+from results import OutcomeCounts
+from simulate import Simulation
+from sinks import CounterSink
+
+# Matchups per unit of work. Every chunk has its own random stream, so the
+# results depend on the seed and this size, never on the number of workers.
+CHUNK_SIZE: int = 1000
+
+
+def chunk_rng(seed: int, chunk: int) -> random.Random:
+    # String seeds are hashed with SHA-512, so streams are stable across processes
+    return random.Random(f"{seed}/{chunk}")
+
+
+def run_chunk(
+    seed: int,
+    chunk: int,
+    count: int,
+    config: Optional[SimulationConfig] = None,
+    chase_table: Optional[ChaseTable] = None,
+) -> OutcomeCounts:
+    """Runs count matchups on the random stream of the given chunk."""
+    sink = CounterSink()
+    simulation = Simulation(
+        chunk_rng(seed, chunk),
+        closed_form=True,
+        sink=sink,
+        chase_table=chase_table,
+        config=config,
+    )
+    simulation.run_simulation(count)
+    return sink.counts
+
+
+def split_chunks(count: int, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Splits count matchups into (chunk index, matchups) pairs."""
+    return [
+        (chunk, min(chunk_size, count - start))
+        for chunk, start in enumerate(range(0, count, chunk_size))
+    ]
+
+
+def run_parallel(
+    count: int,
+    seed: int,
+    workers: Optional[int] = None,
+    config: Optional[SimulationConfig] = None,
+    chase_table: Optional[ChaseTable] = None,
+) -> OutcomeCounts:
+    """
+    Runs count matchups across a pool of worker processes and merges their counts.
+    The same seed gives the same counts whatever the number of workers, and
+    with or without a chase table.
+    """
+    chunks = split_chunks(count)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            run_chunk,
+            [seed] * len(chunks),
+            [chunk for chunk, _ in chunks],
+            [size for _, size in chunks],
+            [config] * len(chunks),
+            [chase_table] * len(chunks),
+        )
+        return sum(results, OutcomeCounts())
+
+
+def run_sweep(
+    configs: Sequence[SimulationConfig],
+    count: int,
+    seed: int,
+    workers: Optional[int] = None,
+    chase_table: Optional[ChaseTable] = None,
+) -> List[OutcomeCounts]:
+    """
+    Runs count matchups under every config on one pool, the counts of each in
+    the order given. Every config plays the same random streams, so the counts
+    differ only by what the configs change.
+    """
+    chunks = split_chunks(count)
+    tasks = [(config, chunk, size) for config in configs for chunk, size in chunks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(
+            pool.map(
+                run_chunk,
+                [seed] * len(tasks),
+                [chunk for _, chunk, _ in tasks],
+                [size for _, _, size in tasks],
+                [config for config, _, _ in tasks],
+                [chase_table] * len(tasks),
+            )
+        )
+    return [
+        sum(results[i : i + len(chunks)], OutcomeCounts())
+        for i in range(0, len(results), len(chunks))
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run Spore matchups on all cores.")
+    parser.add_argument("--count", type=int, default=SIMULATION_COUNT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    counts = run_parallel(args.count, args.seed, args.workers)
+    print(
+        f"{counts.matchups} matchups: {counts.predator_wins} predator wins, "
+        f"{counts.prey_wins} prey wins, {counts.escapes} escapes"
+    )
+
+
+if __name__ == "__main__":
+    main()
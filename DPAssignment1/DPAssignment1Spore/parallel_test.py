@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from chase_table import ChaseTable, TableSpec
+from config import SimulationConfig
+from parallel import run_chunk, run_parallel, run_sweep, split_chunks
+from results import OutcomeCounts
+
+
+class TestParallel:
+    def test_split_chunks(self) -> None:
+        assert split_chunks(2500, 1000) == [(0, 1000), (1, 1000), (2, 500)]
+        assert split_chunks(0, 1000) == []
+
+    def test_chunk_is_reproducible(self) -> None:
+        assert run_chunk(7, 3, 200) == run_chunk(7, 3, 200)
+        assert run_chunk(7, 3, 200) != run_chunk(7, 4, 200)
+
+    def test_counts_add_up(self) -> None:
+        counts = run_parallel(2500, seed=1, workers=2)
+        assert counts.matchups == 2500
+        assert counts.escapes + counts.predator_wins + counts.prey_wins == 2500
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_independent_of_worker_count(self, workers: int) -> None:
+        expected = sum(
+            (run_chunk(11, chunk, size) for chunk, size in split_chunks(2500)),
+            OutcomeCounts(),
+        )
+        assert run_parallel(2500, seed=11, workers=workers) == expected
+
+    def test_sweep_runs_every_config(self) -> None:
+        capped_config = SimulationConfig(max_iterations=10)
+        default, capped = run_sweep(
+            [SimulationConfig(), capped_config], 1500, seed=3, workers=2
+        )
+
+        assert default == run_parallel(1500, seed=3, workers=1)
+        assert capped != default
+        assert capped.matchups == 1500
+
+    def test_parallel_run_by_config(self) -> None:
+        capped_config = SimulationConfig(max_iterations=10)
+
+        capped = run_parallel(1500, seed=3, workers=2, config=capped_config)
+
+        assert capped == run_sweep([capped_config], 1500, seed=3, workers=1)[0]
+        assert capped != run_parallel(1500, seed=3, workers=2)
+
+    def test_chase_table_leaves_counts_unchanged(self, tmp_path: Path) -> None:
+        spec = TableSpec(predator_stamina=(0, 120), prey_stamina=(0, 60), max_gap=200)
+        table = ChaseTable.open(tmp_path, spec)
+
+        with_table = run_parallel(1500, seed=5, workers=2, chase_table=table)
+
+        assert with_table == run_parallel(1500, seed=5, workers=2)
+        assert run_sweep([SimulationConfig()], 1500, seed=5, chase_table=table) == [
+            with_table
+        ]
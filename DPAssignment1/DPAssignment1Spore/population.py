@@ -0,0 +1,108 @@
+from dataclasses import fields
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from creature import Creature, MovementHandler
+
+# Storage type of every Creature attribute
+COLUMN_TYPES: Dict[str, npt.DTypeLike] = {
+    "legs": np.int8,
+    "wings": np.int8,
+    "claw_multiplier": np.int8,
+    "teeth_bonus": np.int8,
+    "health": np.int32,
+    "stamina": np.int32,
+    "base_attack": np.int32,
+    "position": np.int32,
+}
+
+_DEFAULTS = {field.name: field.default for field in fields(Creature)}
+
+
+class _Column:
+    """Exposes one population column as an int attribute of CreatureView."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, view: "CreatureView", owner: type) -> int:
+        return int(view.population.columns[self.name][view.index])
+
+    def __set__(self, view: "CreatureView", value: int) -> None:
+        view.population.columns[self.name][view.index] = value
+
+
+class CreatureView:
+    """
+    A single creature of a CreaturePopulation. Reads and writes go straight
+    to the population's columns, and it offers the same API as Creature.
+    """
+
+    __slots__ = ("population", "index")
+
+    legs = _Column()
+    wings = _Column()
+    claw_multiplier = _Column()
+    teeth_bonus = _Column()
+    health = _Column()
+    stamina = _Column()
+    base_attack = _Column()
+    position = _Column()
+
+    def __init__(self, population: "CreaturePopulation", index: int) -> None:
+        self.population = population
+        self.index = index
+
+    def get_attack_power(self) -> int:
+        return (self.base_attack * self.claw_multiplier) + self.teeth_bonus
+
+    def move(self, movement_chain: MovementHandler) -> Tuple[int, int]:
+        strategy = movement_chain.resolve(self.legs, self.wings)
+        return strategy.move(self.stamina)
+
+    def to_creature(self) -> Creature:
+        return Creature(**{name: getattr(self, name) for name in COLUMN_TYPES})
+
+
+class CreaturePopulation:
+    """
+    Many creatures stored as one typed array per attribute (see COLUMN_TYPES)
+    instead of one object each. Indexing returns a CreatureView.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.columns: Dict[str, npt.NDArray[Any]] = {
+            name: np.full(size, _DEFAULTS[name], dtype=dtype)
+            for name, dtype in COLUMN_TYPES.items()
+        }
+
+    @classmethod
+    def from_creatures(cls, creatures: Sequence[Creature]) -> "CreaturePopulation":
+        population = cls(len(creatures))
+        for name, column in population.columns.items():
+            column[:] = [getattr(creature, name) for creature in creatures]
+        return population
+
+    def attack_power(self) -> npt.NDArray[np.int64]:
+        """Attack power of every creature, as Creature.get_attack_power."""
+        base_attack = self.columns["base_attack"].astype(np.int64)
+        claw_multiplier = self.columns["claw_multiplier"].astype(np.int64)
+        teeth_bonus = self.columns["teeth_bonus"].astype(np.int64)
+        return base_attack * claw_multiplier + teeth_bonus
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __len__(self) -> int:
+        return len(self.columns["legs"])
+
+    def __getitem__(self, index: int) -> CreatureView:
+        if not -len(self) <= index < len(self):
+            raise IndexError("population index out of range")
+        return CreatureView(self, index % len(self))
+
+    def __iter__(self) -> Iterator[CreatureView]:
+        return (CreatureView(self, index) for index in range(len(self)))
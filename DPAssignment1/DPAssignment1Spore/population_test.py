@@ -0,0 +1,70 @@
+import pytest
+
+from batch import CreatureColumns
+from benchmark import creature_memory
+from constants import ClawSize, TeethSharpness
+from creature import Creature, FlyHandler, HopHandler, RunHandler, WalkHandler
+from population import CreaturePopulation
+
+
+class TestCreaturePopulation:
+    @pytest.fixture
+    def creatures(self) -> list[Creature]:
+        return [
+            Creature(legs=2, wings=2, health=150, stamina=80, position=5),
+            Creature(
+                base_attack=10,
+                claw_multiplier=ClawSize.MEDIUM.value,
+                teeth_bonus=TeethSharpness.SHARP.value,
+            ),
+        ]
+
+    @pytest.fixture
+    def population(self, creatures: list[Creature]) -> CreaturePopulation:
+        return CreaturePopulation.from_creatures(creatures)
+
+    def test_default_population(self) -> None:
+        population = CreaturePopulation(3)
+        assert len(population) == 3
+        assert all(view.to_creature() == Creature() for view in population)
+
+    def test_views_round_trip(
+        self, population: CreaturePopulation, creatures: list[Creature]
+    ) -> None:
+        assert [view.to_creature() for view in population] == creatures
+        assert population[-1].to_creature() == creatures[-1]
+
+    def test_view_api_matches_creature(
+        self, population: CreaturePopulation, creatures: list[Creature]
+    ) -> None:
+        chain = FlyHandler(RunHandler(WalkHandler(HopHandler())))
+        for view, creature in zip(population, creatures):
+            assert view.get_attack_power() == creature.get_attack_power()
+            assert view.move(chain) == creature.move(chain)
+
+    def test_view_writes_through(self, population: CreaturePopulation) -> None:
+        view = population[0]
+        view.stamina -= 30
+        view.position += 8
+
+        assert population.columns["stamina"][0] == 50
+        assert population[0].position == 13
+
+    def test_index_out_of_range(self, population: CreaturePopulation) -> None:
+        with pytest.raises(IndexError):
+            population[2]
+
+    def test_attack_power(self, population: CreaturePopulation) -> None:
+        assert population.attack_power().tolist() == [10, 36]
+
+    def test_batch_columns(self, population: CreaturePopulation) -> None:
+        columns = CreatureColumns.from_population(population)
+        assert columns.stamina.tolist() == [80, 100]
+        assert columns.attack.tolist() == [10, 36]
+
+    def test_creature_is_slotted(self) -> None:
+        assert not hasattr(Creature(), "__dict__")
+
+    def test_memory_saving(self) -> None:
+        memory = creature_memory(10_000)
+        assert memory["population"] < memory["slotted"] < memory["dataclass"]
@@ -0,0 +1,178 @@
+import marshal
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
+
+from creature import Creature
+from results import ChaseResult, FightResult
+
+if TYPE_CHECKING:
+    from simulate import Simulation
+
+# Phase of a matchup, and the Simulation method it is spent in
+PHASES: Dict[str, str] = {
+    "evolution": "create_matchup",
+    "chase": "simulate_chase",
+    "fight": "simulate_fight",
+}
+
+# pstats identifies a function by (file name, first line, function name)
+FunctionKey = Tuple[str, int, str]
+
+
+@dataclass
+class PhaseTiming:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+def histogram_bucket(value: int) -> Tuple[int, int]:
+    """The power-of-two range [low, high) value falls in."""
+    low = 1
+    while low * 2 <= value:
+        low *= 2
+    return low, low * 2
+
+
+class Profiler:
+    """
+    Opt-in instrumentation for Simulation. Pass one as Simulation(profiler=...)
+    and every matchup records its per-phase wall time, how many ticks and
+    rounds it took, whether it hit MAX_ITERATIONS and how deep the movement
+    chain went. A simulation without a profiler runs exactly as before.
+    """
+
+    def __init__(self) -> None:
+        self.phases = {phase: PhaseTiming() for phase in PHASES}
+        self.chase_ticks: Counter[int] = Counter()
+        self.fight_rounds: Counter[int] = Counter()
+        # Chases and fights stopped by MAX_ITERATIONS instead of an outcome
+        self.cap_hits: Counter[str] = Counter()
+        # Handlers visited to resolve each creature's movement strategy
+        self.chain_depths: Counter[int] = Counter()
+
+    def instrument(self, simulation: "Simulation") -> None:
+        """
+        Times the phases of simulation from now on. The methods in PHASES are
+        wrapped on the instance, so Simulation.run_matchup runs unchanged.
+        """
+        recorders: Dict[str, Callable[[Any], None]] = {
+            "evolution": lambda matchup: self.record_depths(simulation, matchup),
+            "chase": lambda chase: self.record_chase(chase, simulation.MAX_ITERATIONS),
+            "fight": lambda fight: self.record_fight(fight, simulation.MAX_ITERATIONS),
+        }
+        for phase, method in PHASES.items():
+            timed = self._timed(phase, getattr(simulation, method), recorders[phase])
+            setattr(simulation, method, timed)
+
+    def _timed(
+        self, phase: str, run: Callable[..., Any], record: Callable[[Any], None]
+    ) -> Callable[..., Any]:
+        timing = self.phases[phase]
+
+        def timed(*args: Any) -> Any:
+            started = perf_counter()
+            result = run(*args)
+            timing.calls += 1
+            timing.seconds += perf_counter() - started
+            record(result)
+            return result
+
+        return timed
+
+    def record_depths(
+        self, simulation: "Simulation", creatures: Tuple[Creature, ...]
+    ) -> None:
+        for creature in creatures:
+            self.chain_depths[
+                simulation.movement_chain.depth(creature.legs, creature.wings)
+            ] += 1
+
+    def record_chase(self, chase: ChaseResult, max_iterations: int) -> None:
+        self.chase_ticks[chase.ticks] += 1
+        if (
+            not chase.caught
+            and chase.ticks >= max_iterations
+            and chase.predator_stamina > 0
+        ):
+            self.cap_hits["chase"] += 1
+
+    def record_fight(self, fight: FightResult, max_iterations: int) -> None:
+        self.fight_rounds[fight.rounds] += 1
+        if (
+            fight.rounds >= max_iterations
+            and fight.predator_health > 0
+            and fight.prey_health > 0
+        ):
+            self.cap_hits["fight"] += 1
+
+    def summary(self) -> str:
+        """The collected numbers as plain-text tables."""
+        total = sum(timing.seconds for timing in self.phases.values())
+        lines = [f"{'phase':<10}{'calls':>9}{'seconds':>10}{'us/call':>10}{'share':>8}"]
+        for phase, timing in self.phases.items():
+            per_call = timing.seconds / timing.calls * 1e6 if timing.calls else 0.0
+            share = timing.seconds / total if total else 0.0
+            lines.append(
+                f"{phase:<10}{timing.calls:>9}{timing.seconds:>10.3f}"
+                f"{per_call:>10.1f}{share:>8.1%}"
+            )
+
+        for title, counts in (
+            ("chase ticks", self.chase_ticks),
+            ("fight rounds", self.fight_rounds),
+        ):
+            lines.append("")
+            lines.append(f"{title:<16}{'count':>9}")
+            buckets: Counter[Tuple[int, int]] = Counter()
+            for value, count in counts.items():
+                buckets[histogram_bucket(value)] += count
+            for (low, high), count in sorted(buckets.items()):
+                lines.append(f"{f'[{low}, {high})':<16}{count:>9}")
+
+        lines.append("")
+        lines.append(
+            f"MAX_ITERATIONS hits: {self.cap_hits['chase']} chases, "
+            f"{self.cap_hits['fight']} fights"
+        )
+        depths = ", ".join(
+            f"{depth}: {count}" for depth, count in sorted(self.chain_depths.items())
+        )
+        lines.append(f"movement chain depth: {depths}")
+        return "\n".join(lines)
+
+    def stats(self) -> Dict[FunctionKey, Tuple[Any, ...]]:
+        """
+        The phase timings in the layout cProfile gives pstats, with every phase
+        called from Simulation.run_matchup.
+        """
+        from simulate import Simulation
+
+        def key(name: str) -> FunctionKey:
+            code = getattr(Simulation, name).__code__
+            return code.co_filename, code.co_firstlineno, code.co_name
+
+        caller = key("run_matchup")
+        matchups = self.phases["evolution"].calls
+        total = sum(timing.seconds for timing in self.phases.values())
+        stats: Dict[FunctionKey, Tuple[Any, ...]] = {
+            caller: (matchups, matchups, 0.0, total, {})
+        }
+        for phase, method in PHASES.items():
+            timing = self.phases[phase]
+            calls, seconds = timing.calls, timing.seconds
+            stats[key(method)] = (
+                calls,
+                calls,
+                seconds,
+                seconds,
+                {caller: (calls, calls, seconds, seconds)},
+            )
+        return stats
+
+    def dump_stats(self, path: Path) -> None:
+        """Writes stats() where pstats.Stats(path) and snakeviz can read it."""
+        with open(path, "wb") as file:
+            marshal.dump(self.stats(), file)
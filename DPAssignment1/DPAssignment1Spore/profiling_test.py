@@ -0,0 +1,54 @@
+import pstats
+import random
+from pathlib import Path
+
+from profiling import Profiler, histogram_bucket
+from results import ChaseResult, FightResult
+from simulate import Simulation
+from sinks import CounterSink
+
+
+class TestProfiler:
+    def test_profiled_run_matches_plain_run(self) -> None:
+        plain = Simulation(random.Random(1), sink=CounterSink())
+        profiler = Profiler()
+        profiled = Simulation(random.Random(1), sink=CounterSink(), profiler=profiler)
+
+        assert profiled.run_simulation(300) == plain.run_simulation(300)
+        assert profiler.phases["evolution"].calls == 300
+        assert profiler.phases["chase"].calls == 300
+        assert sum(profiler.chase_ticks.values()) == 300
+        assert profiler.phases["fight"].calls == sum(profiler.fight_rounds.values())
+        assert sum(profiler.chain_depths.values()) == 600
+
+    def test_cap_hits(self) -> None:
+        profiler = Profiler()
+        profiler.record_chase(ChaseResult(False, 1000, 50, 10), 1000)
+        profiler.record_chase(ChaseResult(True, 1000, 50, 10), 1000)
+        profiler.record_chase(ChaseResult(False, 1000, 0, 10), 1000)
+        profiler.record_fight(FightResult(False, 1000, 5, 5), 1000)
+        assert profiler.cap_hits == {"chase": 1, "fight": 1}
+
+    def test_histogram_bucket(self) -> None:
+        assert histogram_bucket(1) == (1, 2)
+        assert histogram_bucket(7) == (4, 8)
+        assert histogram_bucket(1000) == (512, 1024)
+
+    def test_dump_loads_in_pstats(self, tmp_path: Path) -> None:
+        profiler = Profiler()
+        Simulation(
+            random.Random(2), sink=CounterSink(), profiler=profiler
+        ).run_simulation(50)
+        path = tmp_path / "run.stats"
+
+        profiler.dump_stats(path)
+        stats = pstats.Stats(str(path))
+
+        functions = {name for _, _, name in stats.stats}  # type: ignore[attr-defined]
+        assert functions == {
+            "run_matchup",
+            "create_matchup",
+            "simulate_chase",
+            "simulate_fight",
+        }
+        assert "evolution" in profiler.summary()
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+from creature import Creature
+
+Row = Dict[str, Union[int, bool, None]]
+
+
+@dataclass(frozen=True)
+class ChaseResult:
+    caught: bool
+    # Iterations the tick-by-tick chase takes
+    ticks: int
+    predator_stamina: int
+    prey_stamina: int
+
+
+@dataclass(frozen=True)
+class FightResult:
+    predator_won: bool
+    rounds: int
+    predator_health: int
+    prey_health: int
+
+
+@dataclass(frozen=True)
+class CreatureTraits:
+    legs: int
+    wings: int
+    attack_power: int
+    position: int
+
+    @classmethod
+    def of(cls, creature: Creature) -> "CreatureTraits":
+        return cls(
+            legs=creature.legs,
+            wings=creature.wings,
+            attack_power=creature.get_attack_power(),
+            position=creature.position,
+        )
+
+
+@dataclass(frozen=True)
+class MatchupRecord:
+    index: int
+    # Traits as evolved, before the chase
+    predator: CreatureTraits
+    prey: CreatureTraits
+    chase: ChaseResult
+    # Only fought when the chase was caught
+    fight: Optional[FightResult] = None
+
+    @property
+    def predator_won(self) -> bool:
+        return self.fight is not None and self.fight.predator_won
+
+    def as_row(self) -> Row:
+        """Flattens the record into one column per field."""
+        row: Row = {"index": self.index}
+        for side, traits in (("predator", self.predator), ("prey", self.prey)):
+            row[f"{side}_legs"] = traits.legs
+            row[f"{side}_wings"] = traits.wings
+            row[f"{side}_attack_power"] = traits.attack_power
+            row[f"{side}_position"] = traits.position
+        row["caught"] = self.chase.caught
+        row["chase_ticks"] = self.chase.ticks
+        row["predator_stamina"] = self.chase.predator_stamina
+        row["prey_stamina"] = self.chase.prey_stamina
+        row["predator_won"] = self.predator_won
+        row["fight_rounds"] = self.fight.rounds if self.fight else None
+        row["predator_health"] = self.fight.predator_health if self.fight else None
+        row["prey_health"] = self.fight.prey_health if self.fight else None
+        return row
+
+
+@dataclass
+class OutcomeCounts:
+    matchups: int = 0
+    # Prey got away during the chase
+    escapes: int = 0
+    predator_wins: int = 0
+    prey_wins: int = 0
+
+    def add(self, record: MatchupRecord) -> None:
+        self.matchups += 1
+        if not record.chase.caught:
+            self.escapes += 1
+        elif record.predator_won:
+            self.predator_wins += 1
+        else:
+            self.prey_wins += 1
+
+    def __add__(self, other: "OutcomeCounts") -> "OutcomeCounts":
+        return OutcomeCounts(
+            matchups=self.matchups + other.matchups,
+            escapes=self.escapes + other.escapes,
+            predator_wins=self.predator_wins + other.predator_wins,
+            prey_wins=self.prey_wins + other.prey_wins,
+        )
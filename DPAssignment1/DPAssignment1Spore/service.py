@@ -0,0 +1,381 @@
+import argparse
+import asyncio
+import functools
+import json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from batch import BatchSimulation, CreatureColumns, IntColumn
+from config import DEFAULT_CONFIG, SimulationConfig
+from constants import ClawSize, TeethSharpness
+from evolution import Genome
+from parallel import chunk_rng
+from results import OutcomeCounts
+from simulate import Simulation
+
+# Trials per random stream. A spec's outcome depends on its seed and this
+# size only, never on which other requests its chunks were batched with.
+CHUNK_TRIALS: int = 10_000
+# Most trials handed to one worker process at a time
+BATCH_TRIALS: int = 100_000
+# Finished specs kept for repeated requests
+CACHE_SIZE: int = 1024
+
+
+@dataclass(frozen=True)
+class MatchupSpec:
+    """A request's predator, prey, number of trials and seed; the cache key."""
+
+    predator: Genome
+    prey: Genome
+    trials: int
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class Chunk:
+    spec: MatchupSpec
+    index: int
+    trials: int
+
+
+def _columns(genome: Genome, positions: List[int]) -> CreatureColumns:
+    creature = genome.express()
+
+    def column(value: int) -> IntColumn:
+        return np.full(len(positions), value, dtype=np.int64)
+
+    return CreatureColumns(
+        legs=column(creature.legs),
+        wings=column(creature.wings),
+        stamina=column(creature.stamina),
+        position=np.array(positions, dtype=np.int64),
+        health=column(creature.health),
+        attack=column(creature.get_attack_power()),
+    )
+
+
+def run_batch(
+    chunks: List[Chunk], config: Optional[SimulationConfig] = None
+) -> List[OutcomeCounts]:
+    """
+    Plays every chunk in one vectorized batch by config, by default
+    DEFAULT_CONFIG, and tallies each one separately. The prey starts somewhere
+    in the world, drawn from the chunk's own stream.
+    """
+    simulation = Simulation(config=config)
+    size = simulation.config.world_max_position
+    predators, prey = [], []
+    for chunk in chunks:
+        rng = chunk_rng(chunk.spec.seed, chunk.index)
+        positions = [rng.randint(0, size) for _ in range(chunk.trials)]
+        predators.append(_columns(chunk.spec.predator, [0] * chunk.trials))
+        prey.append(_columns(chunk.spec.prey, positions))
+
+    def stack(sides: List[CreatureColumns]) -> CreatureColumns:
+        return CreatureColumns(
+            **{
+                column.name: np.concatenate(
+                    [getattr(side, column.name) for side in sides]
+                )
+                for column in fields(CreatureColumns)
+            }
+        )
+
+    caught, won = BatchSimulation(simulation).resolve_outcomes(
+        stack(predators), stack(prey)
+    )
+
+    counts, start = [], 0
+    for chunk in chunks:
+        end = start + chunk.trials
+        chunk_caught = int(caught[start:end].sum())
+        chunk_won = int(won[start:end].sum())
+        counts.append(
+            OutcomeCounts(
+                matchups=chunk.trials,
+                escapes=chunk.trials - chunk_caught,
+                predator_wins=chunk_won,
+                prey_wins=chunk_caught - chunk_won,
+            )
+        )
+        start = end
+    return counts
+
+
+Update = Union[OutcomeCounts, BaseException]
+
+
+@dataclass
+class _Job:
+    """
+    A spec being played, shared by every request for it that arrives before
+    it's finished. Each request gets the tallies of finished chunks, those
+    that finished before it subscribed included, on a queue of its own.
+    """
+
+    spec: MatchupSpec
+    chunks: int
+    # Tallies of finished chunks, and the error that stopped the rest
+    tallies: List[OutcomeCounts] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    subscribers: "List[asyncio.Queue[Update]]" = field(default_factory=list)
+    # Set once nobody waits for it, so its queued chunks are dropped
+    cancelled: bool = False
+
+    @property
+    def done(self) -> bool:
+        return self.error is not None or len(self.tallies) == self.chunks
+
+    def subscribe(self) -> "asyncio.Queue[Update]":
+        updates: "asyncio.Queue[Update]" = asyncio.Queue()
+        for tally in self.tallies:
+            updates.put_nowait(tally)
+        if self.error is not None:
+            updates.put_nowait(self.error)
+        self.subscribers.append(updates)
+        return updates
+
+    def publish(self, update: Update) -> None:
+        if isinstance(update, BaseException):
+            self.error = update
+        else:
+            self.tallies.append(update)
+        for updates in self.subscribers:
+            updates.put_nowait(update)
+
+
+class MatchupService:
+    """
+    Queues matchup requests, cuts them into chunks and batches chunks from
+    any number of requests into one worker call, run on a process pool so the
+    event loop never blocks. Identical requests in flight share one job, and
+    finished specs are cached. Every spec is played by the service's config.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        batch_trials: int = BATCH_TRIALS,
+        cache_size: int = CACHE_SIZE,
+        config: Optional[SimulationConfig] = None,
+    ) -> None:
+        self.workers = workers
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.batch_trials = batch_trials
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[MatchupSpec, OutcomeCounts]" = OrderedDict()
+        self._pending: Dict[MatchupSpec, _Job] = {}
+        self._queue: "asyncio.Queue[Tuple[_Job, Chunk]]" = asyncio.Queue()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._batcher: Optional["asyncio.Task[None]"] = None
+
+    async def start(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    async def stop(self) -> None:
+        if self._batcher is not None:
+            self._batcher.cancel()
+        if self._pool is not None:
+            # Waiting for the workers to exit would block the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self._pool.shutdown, cancel_futures=True)
+            )
+
+    async def submit(
+        self, spec: MatchupSpec
+    ) -> AsyncGenerator[OutcomeCounts, None]:
+        """
+        Yields the running tally of spec after each finished chunk. Closing
+        the iterator early cancels the spec's queued chunks, unless another
+        request still waits for them.
+        """
+        cached = self.cache.get(spec)
+        if cached is not None:
+            self.cache.move_to_end(spec)
+            yield cached
+            return
+
+        job = self._pending.get(spec)
+        if job is None:
+            job = self._enqueue(spec)
+        updates = job.subscribe()
+        try:
+            total = OutcomeCounts()
+            for _ in range(job.chunks):
+                update = await updates.get()
+                if isinstance(update, BaseException):
+                    raise update
+                total = total + update
+                yield total
+        finally:
+            job.subscribers.remove(updates)
+            if not job.subscribers and not job.done:
+                job.cancelled = True
+                if self._pending.get(spec) is job:
+                    del self._pending[spec]
+
+    def _enqueue(self, spec: MatchupSpec) -> _Job:
+        starts = range(0, spec.trials, CHUNK_TRIALS)
+        job = _Job(spec, len(starts))
+        for index, start in enumerate(starts):
+            trials = min(CHUNK_TRIALS, spec.trials - start)
+            self._queue.put_nowait((job, Chunk(spec, index, trials)))
+        self._pending[spec] = job
+        return job
+
+    def _settle(self, job: _Job) -> None:
+        # Called once a job is done: later requests read the cache, or after
+        # an error start over
+        if self._pending.get(job.spec) is job:
+            del self._pending[job.spec]
+        if job.error is None:
+            self.cache[job.spec] = sum(job.tallies, OutcomeCounts())
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    async def _next_chunk(self) -> Tuple[_Job, Chunk]:
+        while True:
+            job, chunk = await self._queue.get()
+            if not job.cancelled:
+                return job, chunk
+
+    async def _run_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._next_chunk()]
+            trials = batch[0][1].trials
+            while trials < self.batch_trials and not self._queue.empty():
+                job, chunk = self._queue.get_nowait()
+                if not job.cancelled:
+                    batch.append((job, chunk))
+                    trials += chunk.trials
+
+            try:
+                counts = await loop.run_in_executor(
+                    self._pool, run_batch, [chunk for _, chunk in batch], self.config
+                )
+            except Exception as error:
+                updates: List[Update] = [error] * len(batch)
+            else:
+                updates = list(counts)
+            for (job, _), update in zip(batch, updates):
+                if job.done:
+                    continue
+                job.publish(update)
+                if job.done:
+                    self._settle(job)
+
+
+class CreatureSpec(BaseModel):
+    legs: int = Field(0, ge=0)
+    wings: int = Field(0, ge=0)
+    claws: Literal["SMALL", "MEDIUM", "LARGE"] = "SMALL"
+    teeth: Literal["DULL", "SHARP", "VERY_SHARP"] = "DULL"
+    health: int = 100
+    stamina: int = 100
+    base_attack: int = 10
+
+    def genome(self) -> Genome:
+        return Genome(
+            legs=self.legs,
+            wings=self.wings,
+            claws=ClawSize[self.claws],
+            teeth=TeethSharpness[self.teeth],
+            health=self.health,
+            stamina=self.stamina,
+            base_attack=self.base_attack,
+        )
+
+
+class MatchupRequest(BaseModel):
+    predator: CreatureSpec
+    prey: CreatureSpec
+    trials: int = Field(1000, ge=1, le=10_000_000)
+    seed: int = 0
+
+    def spec(self) -> MatchupSpec:
+        return MatchupSpec(
+            self.predator.genome(), self.prey.genome(), self.trials, self.seed
+        )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    service = MatchupService(workers=app.state.workers, config=app.state.config)
+    await service.start()
+    app.state.service = service
+    yield
+    await service.stop()
+
+
+app = FastAPI(title="Spore Matchup Service", lifespan=lifespan)
+app.state.workers = None
+app.state.config = DEFAULT_CONFIG
+
+
+@app.post("/matchups")
+async def run_matchups(matchup: MatchupRequest, request: Request) -> StreamingResponse:
+    """
+    Streams one NDJSON line per finished chunk with the running tally. The
+    last line has done equal to trials, or an error if the run failed.
+    """
+    service: MatchupService = request.app.state.service
+    spec = matchup.spec()
+
+    async def lines() -> AsyncIterator[str]:
+        # The status is sent with the first line, so an error after that is
+        # reported as a last line of its own rather than by cutting it short
+        try:
+            async for counts in service.submit(spec):
+                yield (
+                    json.dumps(
+                        {
+                            "trials": spec.trials,
+                            "done": counts.matchups,
+                            "escapes": counts.escapes,
+                            "predator_wins": counts.predator_wins,
+                            "prey_wins": counts.prey_wins,
+                        }
+                    )
+                    + "\n"
+                )
+        except Exception as error:
+            yield json.dumps({"trials": spec.trials, "error": str(error)}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve Spore matchups over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    app.state.workers = args.workers
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import threading
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+import service as service_module
+from config import SimulationConfig
+from results import OutcomeCounts
+from service import (
+    CHUNK_TRIALS,
+    Chunk,
+    MatchupRequest,
+    MatchupService,
+    MatchupSpec,
+    app,
+    run_batch,
+)
+
+REQUEST: Dict[str, Any] = {
+    "predator": {"legs": 2, "claws": "LARGE", "stamina": 700, "base_attack": 40},
+    "prey": {"wings": 1, "teeth": "SHARP", "stamina": 400, "health": 60},
+    "trials": 25_000,
+    "seed": 3,
+}
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    app.state.workers = 2
+    with TestClient(app) as client:
+        yield client
+
+
+def stream(client: TestClient, body: Dict[str, Any]) -> List[Dict[str, int]]:
+    response = client.post("/matchups", json=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def spec_of(seed: int, trials: int = REQUEST["trials"]) -> MatchupSpec:
+    body = {**REQUEST, "seed": seed, "trials": trials}
+    return MatchupRequest.model_validate(body).spec()
+
+
+async def tally(service: MatchupService, spec: MatchupSpec) -> OutcomeCounts:
+    total = OutcomeCounts()
+    async for total in service.submit(spec):
+        pass
+    return total
+
+
+@pytest.fixture
+def played(monkeypatch: pytest.MonkeyPatch) -> List[Chunk]:
+    # Chunks handed to run_batch, by a service that runs batches on threads
+    chunks: List[Chunk] = []
+
+    def recording_run_batch(
+        batch: List[Chunk], config: Optional[SimulationConfig] = None
+    ) -> List[OutcomeCounts]:
+        chunks.extend(batch)
+        return run_batch(batch, config)
+
+    monkeypatch.setattr(service_module, "run_batch", recording_run_batch)
+    return chunks
+
+
+async def threaded_service(batch_trials: int = 1) -> MatchupService:
+    service = MatchupService(batch_trials=batch_trials)
+    service._batcher = asyncio.create_task(service._run_batches())
+    return service
+
+
+class FailingService:
+    async def submit(
+        self, spec: MatchupSpec
+    ) -> AsyncGenerator[OutcomeCounts, None]:
+        yield OutcomeCounts(CHUNK_TRIALS, CHUNK_TRIALS, 0, 0)
+        raise RuntimeError("worker died")
+
+
+class ShutdownRecorder:
+    def __init__(self) -> None:
+        self.threads: List[threading.Thread] = []
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self.threads.append(threading.current_thread())
+
+
+class TestMatchupService:
+    def test_stop_shuts_the_pool_down_off_the_loop(self) -> None:
+        pool = ShutdownRecorder()
+
+        async def stop() -> threading.Thread:
+            service = MatchupService()
+            service._pool = pool  # type: ignore[assignment]
+            await service.stop()
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(stop())
+
+        assert len(pool.threads) == 1
+        assert pool.threads[0] is not loop_thread
+
+    def test_streams_running_tallies(self, client: TestClient) -> None:
+        lines = stream(client, REQUEST)
+
+        assert [line["done"] for line in lines] == [10_000, 20_000, 25_000]
+        final = lines[-1]
+        assert final["escapes"] + final["predator_wins"] + final["prey_wins"] == 25_000
+
+    def test_matches_unbatched_chunks(self, client: TestClient) -> None:
+        spec = MatchupRequest.model_validate({**REQUEST, "seed": 4}).spec()
+        expected = [
+            run_batch([Chunk(spec, index, trials)])[0]
+            for index, trials in enumerate([CHUNK_TRIALS, CHUNK_TRIALS, 5_000])
+        ]
+
+        final = stream(client, {**REQUEST, "seed": 4})[-1]
+
+        assert final["predator_wins"] == sum(c.predator_wins for c in expected)
+        assert final["escapes"] == sum(c.escapes for c in expected)
+
+    def test_batches_play_by_the_config(self) -> None:
+        chunks = [Chunk(spec_of(13), 0, 2_000)]
+
+        # Every prey starts where the predator does
+        same_spot = run_batch(chunks, SimulationConfig(world_max_position=0))[0]
+
+        assert same_spot != run_batch(chunks)[0]
+        assert same_spot.escapes < run_batch(chunks)[0].escapes
+
+    def test_repeated_spec_is_cached(self, client: TestClient) -> None:
+        first = stream(client, {**REQUEST, "seed": 5})
+        second = stream(client, {**REQUEST, "seed": 5})
+
+        assert second == [first[-1]]
+        assert stream(client, {**REQUEST, "seed": 6})[-1] != first[-1]
+
+    def test_rejects_bad_spec(self, client: TestClient) -> None:
+        response = client.post(
+            "/matchups", json={**REQUEST, "predator": {"claws": "HUGE"}}
+        )
+        assert response.status_code == 422
+
+    def test_concurrent_specs_share_batches(self) -> None:
+        specs = [
+            MatchupRequest.model_validate({**REQUEST, "seed": seed}).spec()
+            for seed in (7, 8, 9)
+        ]
+
+        async def run_all() -> List[OutcomeCounts]:
+            service = MatchupService(workers=1)
+            await service.start()
+            try:
+                return list(
+                    await asyncio.gather(*(tally(service, spec) for spec in specs))
+                )
+            finally:
+                await service.stop()
+
+        sequential = [
+            sum(
+                (
+                    run_batch([Chunk(spec, index, trials)])[0]
+                    for index, trials in enumerate([CHUNK_TRIALS, CHUNK_TRIALS, 5_000])
+                ),
+                OutcomeCounts(),
+            )
+            for spec in specs
+        ]
+        assert asyncio.run(run_all()) == sequential
+
+    def test_identical_specs_in_flight_share_a_job(self, played: List[Chunk]) -> None:
+        spec = spec_of(10)
+
+        async def run_all() -> List[OutcomeCounts]:
+            service = await threaded_service()
+            try:
+                return list(
+                    await asyncio.gather(*(tally(service, spec) for _ in range(3)))
+                )
+            finally:
+                await service.stop()
+
+        totals = asyncio.run(run_all())
+
+        assert totals[0] == totals[1] == totals[2]
+        assert totals[0].matchups == spec.trials
+        assert [chunk.index for chunk in played] == [0, 1, 2]
+
+    def test_closed_request_drops_queued_chunks(self, played: List[Chunk]) -> None:
+        abandoned, other = spec_of(11, 10 * CHUNK_TRIALS), spec_of(12)
+
+        async def run_all() -> None:
+            service = await threaded_service()
+            try:
+                updates = service.submit(abandoned)
+                await updates.__anext__()
+                await updates.aclose()
+                await tally(service, other)
+            finally:
+                await service.stop()
+
+        asyncio.run(run_all())
+
+        # The first chunk, and at most the one already running when it closed
+        assert len([chunk for chunk in played if chunk.spec == abandoned]) <= 2
+        assert len([chunk for chunk in played if chunk.spec == other]) == 3
+
+    def test_error_after_streaming_starts(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(app.state, "service", FailingService())
+
+        lines = stream(client, REQUEST)
+
+        assert lines[0]["done"] == CHUNK_TRIALS
+        assert lines[-1] == {"trials": REQUEST["trials"], "error": "worker died"}
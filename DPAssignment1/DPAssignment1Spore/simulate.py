@@ -1,31 +1,79 @@
+import argparse
 import random
+import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import IO, Any, List, Optional, TextIO, Tuple
 
-from constants import SIMULATION_COUNT, WORLD_MAX_POSITION, ClawSize, TeethSharpness, \
-    INITIAL_HEALTH_RANGE_PREDATOR, INITIAL_STAMINA_RANGE_PREDATOR, BASE_ATTACK_RANGE_PREDATOR, \
-    INITIAL_HEALTH_RANGE_PRAY, INITIAL_STAMINA_RANGE_PRAY, BASE_ATTACK_RANGE_PRAY
-from creature import (
-    Creature,
-    CreatureBuilder,
-    FlyHandler,
-    HopHandler,
-    RunHandler,
-    WalkHandler,
+from chase_table import ChaseTable
+from checkpoint import CHECKPOINT_INTERVAL, RunCheckpoint, reopen_output
+from closed_form import prune_chase, resolve_chase, resolve_fight
+from columnar import ColumnarSink
+from config import DEFAULT_CONFIG, SimulationConfig
+from constants import SIMULATION_COUNT
+from creature import CLAW_SIZES, TEETH_SHARPNESSES, Creature, CreatureBuilder
+from profiling import Profiler
+from results import (
+    ChaseResult,
+    CreatureTraits,
+    FightResult,
+    MatchupRecord,
+    OutcomeCounts,
 )
+from sinks import ConsoleSink, CounterSink, CsvSink, JsonlSink, OutcomeSink
 
 
 class Simulation:
-    def __init__(self) -> None:
-        # Set up movement chain
-        self.movement_chain = FlyHandler(RunHandler(WalkHandler(HopHandler())))
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        closed_form: bool = False,
+        sink: Optional[OutcomeSink] = None,
+        chase_table: Optional[ChaseTable] = None,
+        profiler: Optional[Profiler] = None,
+        prune: bool = True,
+        config: Optional[SimulationConfig] = None,
+    ) -> None:
+        # Random stream used for evolution; pass a seeded one for reproducible runs
+        self.rng = rng if rng is not None else random.Random()
+        # Resolve phases analytically instead of stepping them tick by tick
+        self.closed_form = closed_form
+        # Where run_simulation reports matchups
+        self.sink = sink if sink is not None else ConsoleSink()
+        # Precomputed chase outcomes, consulted before simulating a chase
+        self.chase_table = chase_table
+        # Opt-in instrumentation of every matchup
+        self.profiler = profiler
+        # Stop the tick loop once the prey is provably out of reach
+        self.prune = prune
+        # Movement stats, creature profiles and world size to play by
+        self.config = config if config is not None else DEFAULT_CONFIG
+        # Set up movement chain, shared by every simulation of the config
+        self.movement_chain = self.config.movement_chain
         # Maximum iterations to prevent infinite loops
-        self.MAX_ITERATIONS = 1000
+        self.MAX_ITERATIONS = self.config.max_iterations
+        if profiler is not None:
+            profiler.instrument(self)
 
-    def simulate_chase(self, predator: Creature, prey: Creature) -> bool:
+    def simulate_chase(self, predator: Creature, prey: Creature) -> ChaseResult:
         """
-        Simulates chase phase. Returns True if predator catches prey, False otherwise.
+        Simulates chase phase. The result says whether predator catches prey.
         Only ends when predator runs out of stamina or catches prey.
         """
+        if self.chase_table is not None:
+            result = self.chase_table.resolve(
+                predator, prey, self.movement_chain, self.MAX_ITERATIONS
+            )
+            if result is not None:
+                return result
+
+        if self.closed_form:
+            return resolve_chase(
+                predator, prey, self.movement_chain, self.MAX_ITERATIONS
+            )
+
         iterations = 0
+        pace = None
 
         while iterations < self.MAX_ITERATIONS:
             iterations += 1
@@ -36,8 +84,19 @@ class Simulation:
 
             # If neither can move and predator hasn't caught prey, chase ends
             if pred_speed == 0 and prey_speed == 0:
-                print("Pray ran into infinity")
-                return False
+                return ChaseResult(False, iterations, predator.stamina, prey.stamina)
+
+            # Whenever either side changes pace, check whether the prey is out of reach
+            if self.prune and (pred_speed, prey_speed) != pace:
+                pace = (pred_speed, prey_speed)
+                escape = prune_chase(
+                    predator,
+                    prey,
+                    self.movement_chain,
+                    self.MAX_ITERATIONS - iterations + 1,
+                )
+                if escape is not None:
+                    return replace(escape, ticks=escape.ticks + iterations - 1)
 
             # Update stamina
             predator.stamina -= pred_stamina_cost
@@ -49,21 +108,22 @@ class Simulation:
 
             # Check win/lose conditions
             if predator.stamina <= 0:
-                print("Pray ran into infinity")
-                return False
+                return ChaseResult(False, iterations, predator.stamina, prey.stamina)
 
             if predator.position >= prey.position:
-                return True
+                return ChaseResult(True, iterations, predator.stamina, prey.stamina)
 
         # If we reach max iterations, prey escapes
-        print("Pray ran into infinity")
-        return False
+        return ChaseResult(False, iterations, predator.stamina, prey.stamina)
 
-    def simulate_fight(self, predator: Creature, prey: Creature) -> bool:
+    def simulate_fight(self, predator: Creature, prey: Creature) -> FightResult:
         """
-        Simulates fight phase. Returns True if predator wins, False if prey wins.
+        Simulates fight phase. The result says whether predator or prey wins.
         Only ends when either creature runs out of health.
         """
+        if self.closed_form:
+            return resolve_fight(predator, prey, self.MAX_ITERATIONS)
+
         iterations = 0
 
         while iterations < self.MAX_ITERATIONS:
@@ -74,73 +134,199 @@ class Simulation:
             prey.health -= predator.get_attack_power()
 
             if predator.health <= 0:
-                print("Pray ran into infinity")
-                return False
+                return FightResult(False, iterations, predator.health, prey.health)
 
             if prey.health <= 0:
-                print("Some R-rated things have happened")
-                return True
+                return FightResult(True, iterations, predator.health, prey.health)
 
         # If we reach max iterations, consider it a prey escape
-        print("Pray ran into infinity")
-        return False
+        return FightResult(False, iterations, predator.health, prey.health)
 
     def create_random_creature(self, type: int, position: int = 0) -> Creature:
+        # Type 0 is a predator, anything else a prey
+        profile = self.config.profile(type)
         builder = CreatureBuilder()
 
         # Randomly assign characteristics
-        if (type == 0):
-            builder.add_legs(random.randint(0, 4))
-            builder.add_wings(random.randint(0, 2))
-            builder.add_claws(random.choice(list(ClawSize)))
-            builder.add_teeth(random.choice(list(TeethSharpness)))
-
-            return (
-                builder.set_health(random.randint(INITIAL_HEALTH_RANGE_PREDATOR[0], INITIAL_HEALTH_RANGE_PREDATOR[1]))
-                .set_stamina(random.randint(INITIAL_STAMINA_RANGE_PREDATOR[0], INITIAL_STAMINA_RANGE_PREDATOR[1]))
-                .set_base_attack(random.randint(BASE_ATTACK_RANGE_PREDATOR[0], BASE_ATTACK_RANGE_PREDATOR[1]))
-                .set_position(position)
-                .build()
-            )
-        else:
-            builder.add_legs(random.randint(0, 3))
-            builder.add_wings(random.randint(0, 1))
-            builder.add_claws(random.choice(list(ClawSize)))
-            builder.add_teeth(random.choice(list(TeethSharpness)))
-
-            return (
-                builder.set_health(random.randint(INITIAL_HEALTH_RANGE_PRAY[0], INITIAL_HEALTH_RANGE_PRAY[1]))
-                .set_stamina(random.randint(INITIAL_STAMINA_RANGE_PRAY[0], INITIAL_STAMINA_RANGE_PRAY[1]))
-                .set_base_attack(random.randint(BASE_ATTACK_RANGE_PRAY[0], BASE_ATTACK_RANGE_PRAY[1]))
-                .set_position(position)
-                .build()
-            )
+        builder.add_legs(self.rng.randint(*profile["legs_range"]))
+        builder.add_wings(self.rng.randint(*profile["wings_range"]))
+        builder.add_claws(self.rng.choice(CLAW_SIZES))
+        builder.add_teeth(self.rng.choice(TEETH_SHARPNESSES))
 
-    def run_simulation(self) -> None:
-        for i in range(SIMULATION_COUNT):
-            print(f"\nSimulation {i + 1}")
+        return (
+            builder.set_health(self.rng.randint(*profile["health_range"]))
+            .set_stamina(self.rng.randint(*profile["stamina_range"]))
+            .set_base_attack(self.rng.randint(*profile["base_attack_range"]))
+            .set_position(position)
+            .build()
+        )
 
-            # Evolution phase
-            predator = self.create_random_creature(0,0)
-            prey = self.create_random_creature(1, random.randint(0, WORLD_MAX_POSITION))
+    def create_matchup(self) -> Tuple[Creature, Creature]:
+        """
+        Evolves a predator at position 0 and a prey somewhere in the world.
+        The prey's position is drawn before its traits.
+        """
+        predator = self.create_random_creature(0, 0)
+        prey = self.create_random_creature(
+            1, self.rng.randint(0, self.config.world_max_position)
+        )
+        return predator, prey
 
-            print(
-                f"Predator evolved at position 0 with {predator.legs} legs, "
-                f"{predator.wings} wings, attack power {predator.get_attack_power()}"
-            )
-            print(
-                f"Prey evolved at position {prey.position} with {prey.legs} legs, "
-                f"{prey.wings} wings, attack power {prey.get_attack_power()}"
-            )
+    def run_matchup(self, index: int = 0) -> MatchupRecord:
+        """Evolves one matchup and plays it out."""
+        # Evolution phase
+        predator, prey = self.create_matchup()
+        predator_traits = CreatureTraits.of(predator)
+        prey_traits = CreatureTraits.of(prey)
+
+        # Chase phase - if successful, enter fight phase
+        chase = self.simulate_chase(predator, prey)
+        fight = self.simulate_fight(predator, prey) if chase.caught else None
+        return MatchupRecord(index, predator_traits, prey_traits, chase, fight)
+
+    def run_simulation(
+        self,
+        count: Optional[int] = None,
+        checkpoint: Optional[Path] = None,
+        interval: int = CHECKPOINT_INTERVAL,
+        resume_from: Optional[RunCheckpoint] = None,
+    ) -> List[bool]:
+        """
+        Runs count matchups, by default the config's simulation_count, and
+        reports each one to the sink.
+        Returns, for each one, whether the predator ate the prey.
+        With checkpoint set, progress is saved there every interval matchups
+        and at the end. resume_from carries on a run from such a checkpoint,
+        with the same outcomes as if it had never stopped.
+        """
+        if interval < 1:
+            raise ValueError(f"checkpoint interval must be at least 1, not {interval}")
+        if count is None:
+            count = self.config.simulation_count
+        start = 0
+        counts = OutcomeCounts()
+        if resume_from is not None:
+            self.rng.setstate(resume_from.rng_state)
+            start, counts = resume_from.completed, replace(resume_from.counts)
+
+        results = []
+        for i in range(start, count):
+            matchup = self.run_matchup(i)
+            self.sink.record(matchup)
+            results.append(matchup.predator_won)
+            if checkpoint is not None:
+                counts.add(matchup)
+                if (i + 1) % interval == 0 or i + 1 == count:
+                    RunCheckpoint(
+                        count, i + 1, self.rng.getstate(), counts, self.sink.sync()
+                    ).save(checkpoint)
+        return results
 
-            # Chase phase - if successful, enter fight phase
-            if self.simulate_chase(predator, prey):
-                self.simulate_fight(predator, prey)
+
+def create_sink(
+    kind: str, output: Optional[TextIO], resumed: Optional[RunCheckpoint] = None
+) -> OutcomeSink:
+    if kind == "quiet":
+        sink = CounterSink()
+        if resumed is not None:
+            sink.counts = replace(resumed.counts)
+        return sink
+    if kind in ("jsonl", "csv"):
+        stream = output if output is not None else sys.stdout
+        if kind == "jsonl":
+            return JsonlSink(stream)
+        return CsvSink(stream, header=resumed is None or resumed.completed == 0)
+    return ConsoleSink()
 
 
 def main() -> None:
-    simulation = Simulation()
-    simulation.run_simulation()
+    parser = argparse.ArgumentParser(description="Run the Spore simulation.")
+    parser.add_argument("--count", type=int, default=SIMULATION_COUNT)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--sink",
+        choices=["console", "quiet", "jsonl", "csv", "columnar"],
+        default="console",
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument(
+        "--closed-form",
+        action="store_true",
+        help="resolve chases and fights analytically instead of tick by tick",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="file to save progress to, every --checkpoint-interval matchups",
+    )
+    parser.add_argument("--checkpoint-interval", type=int, default=CHECKPOINT_INTERVAL)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the run saved in --checkpoint, with the same other options",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="print per-phase timings to stderr"
+    )
+    parser.add_argument(
+        "--profile-stats",
+        type=Path,
+        default=None,
+        help="also write the timings as a pstats file",
+    )
+    args = parser.parse_args()
+
+    if args.checkpoint_interval < 1:
+        parser.error("--checkpoint-interval must be at least 1")
+    resumed = None
+    if args.resume:
+        if args.checkpoint is None:
+            parser.error("--resume needs --checkpoint")
+        resumed = RunCheckpoint.load(args.checkpoint)
+
+    output: Optional[IO[Any]] = None
+    sink: OutcomeSink
+    if args.sink == "columnar":
+        if args.output is None or resumed is not None:
+            parser.error("--sink columnar needs --output and can't be resumed")
+        output = open(args.output, "wb")
+        sink = ColumnarSink(output)
+    else:
+        text = None
+        if args.output is not None and resumed is not None:
+            text = reopen_output(args.output, resumed.output_offset)
+        elif args.output is not None:
+            text = open(args.output, "w")
+        output = text
+        sink = create_sink(args.sink, text, resumed)
+    rng = random.Random(args.seed) if args.seed is not None else None
+    profiler = Profiler() if args.profile or args.profile_stats else None
+    simulation = Simulation(
+        rng, closed_form=args.closed_form, sink=sink, profiler=profiler
+    )
+    simulation.run_simulation(
+        resumed.count if resumed is not None else args.count,
+        checkpoint=args.checkpoint,
+        interval=args.checkpoint_interval,
+        resume_from=resumed,
+    )
+    sink.close()
+    if output is not None:
+        output.close()
+
+    if profiler is not None:
+        if args.profile:
+            print(profiler.summary(), file=sys.stderr)
+        if args.profile_stats:
+            profiler.dump_stats(args.profile_stats)
+
+    if isinstance(sink, CounterSink):
+        counts = sink.counts
+        print(
+            f"{counts.matchups} matchups: {counts.predator_wins} predator wins, "
+            f"{counts.prey_wins} prey wins, {counts.escapes} escapes"
+        )
 
 
 if __name__ == "__main__":
@@ -41,14 +41,14 @@ class TestSimulation:
         predator = Creature(legs=4, stamina=100, position=0)
         prey = Creature(legs=1, stamina=100, position=5)
 
-        assert simulation.simulate_chase(predator, prey) is True
+        assert simulation.simulate_chase(predator, prey).caught is True
 
     def test_simulate_chase_prey_escapes(self, simulation: Simulation) -> None:
         # Low stamina predator
         predator = Creature(legs=2, stamina=20, position=0)
         prey = Creature(wings=2, stamina=100, position=50)
 
-        assert simulation.simulate_chase(predator, prey) is False
+        assert simulation.simulate_chase(predator, prey).caught is False
 
     def test_simulate_fight_predator_wins(self, simulation: Simulation) -> None:
         predator = Creature(
@@ -59,7 +59,7 @@ class TestSimulation:
         )
         prey = Creature(base_attack=5, health=50)
 
-        assert simulation.simulate_fight(predator, prey) is True
+        assert simulation.simulate_fight(predator, prey).predator_won is True
 
     def test_simulate_fight_prey_wins(self, simulation: Simulation) -> None:
         predator = Creature(base_attack=5, health=50)
@@ -70,7 +70,7 @@ class TestSimulation:
             health=100,
         )
 
-        assert simulation.simulate_fight(predator, prey) is False
+        assert simulation.simulate_fight(predator, prey).predator_won is False
 
     def test_full_simulation_run(self, simulation: Simulation) -> None:
         try:
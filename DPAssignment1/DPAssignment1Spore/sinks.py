@@ -0,0 +1,118 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from typing import IO, List, Optional
+
+from results import MatchupRecord, OutcomeCounts
+
+
+# Outcome Sink Strategy Pattern
+class OutcomeSink(ABC):
+    """Receives the record of every matchup a Simulation runs."""
+
+    @abstractmethod
+    def record(self, matchup: MatchupRecord) -> None:
+        pass
+
+    def sync(self) -> int:
+        """
+        Writes out everything recorded so far. Returns how many bytes of
+        output exist at this point, or 0 when there's no file to resume.
+        """
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
+class ConsoleSink(OutcomeSink):
+    """Prints every matchup, the way the simulation always has."""
+
+    def record(self, matchup: MatchupRecord) -> None:
+        predator, prey = matchup.predator, matchup.prey
+        print(f"\nSimulation {matchup.index + 1}")
+        print(
+            f"Predator evolved at position {predator.position} "
+            f"with {predator.legs} legs, "
+            f"{predator.wings} wings, attack power {predator.attack_power}"
+        )
+        print(
+            f"Prey evolved at position {prey.position} with {prey.legs} legs, "
+            f"{prey.wings} wings, attack power {prey.attack_power}"
+        )
+        if matchup.predator_won:
+            print("Some R-rated things have happened")
+        else:
+            print("Pray ran into infinity")
+
+
+class CounterSink(OutcomeSink):
+    """Only counts outcomes. Nothing is written anywhere."""
+
+    def __init__(self) -> None:
+        self.counts = OutcomeCounts()
+
+    def record(self, matchup: MatchupRecord) -> None:
+        self.counts.add(matchup)
+
+
+class BufferedSink(OutcomeSink):
+    """Collects records and writes them to a text stream in batches."""
+
+    def __init__(self, stream: IO[str], batch_size: int = 10_000) -> None:
+        self.stream = stream
+        self.batch_size = batch_size
+        self._pending: List[MatchupRecord] = []
+
+    def record(self, matchup: MatchupRecord) -> None:
+        self._pending.append(matchup)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.write(self._pending)
+            self._pending = []
+        self.stream.flush()
+
+    def sync(self) -> int:
+        self.flush()
+        return self.stream.tell() if self.stream.seekable() else 0
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def write(self, matchups: List[MatchupRecord]) -> None:
+        pass
+
+
+class JsonlSink(BufferedSink):
+    """Writes one JSON object per matchup."""
+
+    def write(self, matchups: List[MatchupRecord]) -> None:
+        self.stream.write(
+            "".join(json.dumps(matchup.as_row()) + "\n" for matchup in matchups)
+        )
+
+
+class CsvSink(BufferedSink):
+    """
+    Writes one CSV row per matchup, with a header row first unless header is
+    False, as when appending to the output of an interrupted run.
+    """
+
+    def __init__(
+        self, stream: IO[str], batch_size: int = 10_000, header: bool = True
+    ) -> None:
+        super().__init__(stream, batch_size)
+        self.header = header
+        self._writer: Optional["csv.DictWriter[str]"] = None
+
+    def write(self, matchups: List[MatchupRecord]) -> None:
+        rows = [matchup.as_row() for matchup in matchups]
+        if self._writer is None:
+            self._writer = csv.DictWriter(self.stream, fieldnames=list(rows[0]))
+            if self.header:
+                self._writer.writeheader()
+        self._writer.writerows(rows)
@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+import random
+
+import pytest
+
+from results import ChaseResult, CreatureTraits, FightResult, MatchupRecord
+from simulate import Simulation
+from sinks import ConsoleSink, CounterSink, CsvSink, JsonlSink
+
+
+@pytest.fixture
+def escaped() -> MatchupRecord:
+    return MatchupRecord(
+        index=0,
+        predator=CreatureTraits(legs=2, wings=0, attack_power=90, position=0),
+        prey=CreatureTraits(legs=0, wings=1, attack_power=40, position=700),
+        chase=ChaseResult(False, 151, 0, 220),
+    )
+
+
+@pytest.fixture
+def eaten() -> MatchupRecord:
+    return MatchupRecord(
+        index=1,
+        predator=CreatureTraits(legs=4, wings=2, attack_power=120, position=0),
+        prey=CreatureTraits(legs=1, wings=0, attack_power=40, position=30),
+        chase=ChaseResult(True, 6, 576, 288),
+        fight=FightResult(True, 1, 60, -50),
+    )
+
+
+class TestSinks:
+    def test_console_sink(
+        self,
+        eaten: MatchupRecord,
+        escaped: MatchupRecord,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        sink = ConsoleSink()
+        sink.record(escaped)
+        sink.record(eaten)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "",
+            "Simulation 1",
+            "Predator evolved at position 0 with 2 legs, 0 wings, attack power 90",
+            "Prey evolved at position 700 with 0 legs, 1 wings, attack power 40",
+            "Pray ran into infinity",
+            "",
+            "Simulation 2",
+            "Predator evolved at position 0 with 4 legs, 2 wings, attack power 120",
+            "Prey evolved at position 30 with 1 legs, 0 wings, attack power 40",
+            "Some R-rated things have happened",
+        ]
+
+    def test_counter_sink(self, eaten: MatchupRecord, escaped: MatchupRecord) -> None:
+        sink = CounterSink()
+        sink.record(escaped)
+        sink.record(eaten)
+
+        assert sink.counts.matchups == 2
+        assert sink.counts.escapes == 1
+        assert sink.counts.predator_wins == 1
+        assert sink.counts.prey_wins == 0
+
+    def test_jsonl_sink_buffers(
+        self, eaten: MatchupRecord, escaped: MatchupRecord
+    ) -> None:
+        stream = io.StringIO()
+        sink = JsonlSink(stream, batch_size=10)
+        sink.record(escaped)
+        sink.record(eaten)
+        assert stream.getvalue() == ""
+
+        sink.close()
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert rows == [escaped.as_row(), eaten.as_row()]
+        assert rows[0]["fight_rounds"] is None
+        assert rows[1]["prey_health"] == -50
+
+    def test_csv_sink(self, eaten: MatchupRecord, escaped: MatchupRecord) -> None:
+        stream = io.StringIO()
+        sink = CsvSink(stream, batch_size=1)
+        sink.record(escaped)
+        sink.record(eaten)
+        sink.close()
+
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        assert [row["caught"] for row in rows] == ["False", "True"]
+        assert rows[1]["chase_ticks"] == "6"
+
+    def test_simulation_reports_to_sink(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        sink = CounterSink()
+        results = Simulation(random.Random(0), sink=sink).run_simulation(50)
+
+        assert capsys.readouterr().out == ""
+        assert sink.counts.matchups == 50
+        assert sink.counts.predator_wins == sum(results)
@@ -0,0 +1,158 @@
+import random
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import AbstractSet, List, Optional, Sequence, Set
+
+from closed_form import resolve_fight
+from config import DEFAULT_CONFIG, SimulationConfig
+from creature import Creature, MovementHandler
+from simulate import Simulation
+
+
+@dataclass(frozen=True)
+class Hunt:
+    """A predator reaching its prey, and the fight that followed."""
+
+    tick: int
+    predator: int
+    prey: int
+    predator_won: bool
+
+
+class World:
+    """
+    A line shared by many predators and prey. Every tick each predator chases
+    the nearest prey ahead of it, and reaching it starts a fight to the death.
+    Prey behind a predator are out of its reach, as in Simulation, until they
+    overtake it.
+
+    Living prey are kept sorted by position, so finding the nearest one is a
+    binary search. Creatures only ever move forward, so after a tick the order
+    is nearly sorted and re-sorting it is close to linear. A tick therefore
+    costs O(n log n) rather than comparing every predator with every prey.
+    """
+
+    def __init__(
+        self,
+        predators: Sequence[Creature],
+        prey: Sequence[Creature],
+        movement_chain: Optional[MovementHandler] = None,
+        max_iterations: Optional[int] = None,
+        config: Optional[SimulationConfig] = None,
+    ) -> None:
+        self.predators = list(predators)
+        self.prey = list(prey)
+        # The chain and iteration limit default to the config's
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.movement_chain = (
+            movement_chain if movement_chain is not None else self.config.movement_chain
+        )
+        self.max_iterations = (
+            max_iterations if max_iterations is not None else self.config.max_iterations
+        )
+        self.tick = 0
+        # Predators still hunting, and prey still alive
+        self.hunters = list(range(len(self.predators)))
+        self._prey_order = sorted(
+            range(len(self.prey)), key=lambda i: self.prey[i].position
+        )
+        self._prey_positions = [self.prey[i].position for i in self._prey_order]
+
+    @classmethod
+    def populate(
+        cls,
+        predators: int,
+        prey: int,
+        rng: Optional[random.Random] = None,
+        config: Optional[SimulationConfig] = None,
+    ) -> "World":
+        """A world of random creatures spread over the config's world."""
+        simulation = Simulation(rng, config=config)
+        size = simulation.config.world_max_position
+        spread = simulation.rng.randint
+        return cls(
+            [
+                simulation.create_random_creature(0, spread(0, size))
+                for _ in range(predators)
+            ],
+            [
+                simulation.create_random_creature(1, spread(0, size))
+                for _ in range(prey)
+            ],
+            config=simulation.config,
+        )
+
+    @property
+    def living_prey(self) -> List[int]:
+        """Indices of the living prey, by position."""
+        return list(self._prey_order)
+
+    def nearest_prey(self, position: int) -> Optional[int]:
+        """Index of the living prey closest to position, if any is left."""
+        at = bisect_left(self._prey_positions, position)
+        candidates = [i for i in (at - 1, at) if 0 <= i < len(self._prey_positions)]
+        if not candidates:
+            return None
+        nearest = min(candidates, key=lambda i: abs(self._prey_positions[i] - position))
+        return self._prey_order[nearest]
+
+    def prey_ahead(self, position: int) -> Optional[int]:
+        """Index of the nearest living prey at or past position, if any."""
+        at = bisect_left(self._prey_positions, position)
+        return self._prey_order[at] if at < len(self._prey_order) else None
+
+    def _reindex(self, eaten: AbstractSet[int] = frozenset()) -> None:
+        self._prey_order = [i for i in self._prey_order if i not in eaten]
+        self._prey_order.sort(key=lambda i: self.prey[i].position)
+        self._prey_positions = [self.prey[i].position for i in self._prey_order]
+
+    def step(self) -> List[Hunt]:
+        """
+        Advances the world by one tick. Returns the hunts that ended in it.
+        Follows the rules of Simulation.simulate_chase: nobody moving stalls
+        the world, and predators out of stamina stop hunting.
+        """
+        self.tick += 1
+        targets = [self.prey_ahead(self.predators[p].position) for p in self.hunters]
+
+        movers = [self.predators[p] for p in self.hunters]
+        movers += [self.prey[y] for y in self._prey_order]
+        moves = [creature.move(self.movement_chain) for creature in movers]
+        if not any(speed > 0 for speed, _ in moves):
+            self.hunters = []
+            return []
+        for creature, (speed, stamina_cost) in zip(movers, moves):
+            creature.stamina -= stamina_cost
+            creature.position += speed
+
+        hunts: List[Hunt] = []
+        eaten: Set[int] = set()
+        still_hunting: List[int] = []
+        for p, target in zip(self.hunters, targets):
+            predator = self.predators[p]
+            if predator.stamina <= 0:
+                continue
+            if (
+                target is None
+                or target in eaten
+                or predator.position < self.prey[target].position
+            ):
+                still_hunting.append(p)
+                continue
+
+            fight = resolve_fight(predator, self.prey[target], self.max_iterations)
+            hunts.append(Hunt(self.tick, p, target, fight.predator_won))
+            if fight.predator_won:
+                eaten.add(target)
+                still_hunting.append(p)
+
+        self.hunters = still_hunting
+        self._reindex(eaten)
+        return hunts
+
+    def run(self) -> List[Hunt]:
+        """Steps until no predator hunts, no prey is left or time runs out."""
+        hunts: List[Hunt] = []
+        while self.hunters and self._prey_order and self.tick < self.max_iterations:
+            hunts.extend(self.step())
+        return hunts
@@ -0,0 +1,89 @@
+import random
+from dataclasses import replace
+
+import pytest
+from config import SimulationConfig
+from creature import Creature
+from simulate import Simulation
+from world import World
+
+
+def creature(position: int, legs: int = 0, wings: int = 0) -> Creature:
+    return Creature(legs=legs, wings=wings, position=position)
+
+
+class TestWorld:
+    def test_nearest_prey_matches_linear_scan(self) -> None:
+        rng = random.Random(3)
+        prey = [creature(rng.randint(0, 1000)) for _ in range(200)]
+        world = World([], prey)
+
+        for position in [rng.randint(-50, 1050) for _ in range(500)]:
+            nearest = world.nearest_prey(position)
+            assert nearest is not None
+            assert abs(prey[nearest].position - position) == min(
+                abs(other.position - position) for other in prey
+            )
+
+    def test_nearest_prey_of_empty_world(self) -> None:
+        assert World([], []).nearest_prey(10) is None
+
+    def test_prey_ahead(self) -> None:
+        world = World([], [creature(90), creature(300), creature(120)])
+
+        assert world.prey_ahead(100) == 2
+        assert world.prey_ahead(120) == 2
+        assert world.prey_ahead(301) is None
+
+    def test_prey_behind_is_not_caught(self) -> None:
+        # The prey at 95 is nearest, but the predator runs away from it
+        world = World([creature(100)], [creature(95), creature(300)])
+
+        assert world.step() == []
+        assert world.living_prey == [0, 1]
+
+    def test_index_follows_moving_prey(self) -> None:
+        # The fast flyer starts behind the crawler and overtakes it
+        prey = [creature(50), creature(40, wings=2)]
+        world = World([creature(0)], prey)
+        assert world.living_prey == [1, 0]
+
+        for _ in range(3):
+            world.step()
+
+        assert world.living_prey == [0, 1]
+        assert world.nearest_prey(prey[1].position) == 1
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_single_pair_matches_simulation(self, seed: int) -> None:
+        simulation = Simulation(random.Random(seed))
+        predator, prey = simulation.create_matchup()
+        world = World([replace(predator)], [replace(prey)])
+
+        hunts = world.run()
+        chase = simulation.simulate_chase(predator, prey)
+
+        assert [hunt.tick for hunt in hunts] == ([chase.ticks] if chase.caught else [])
+        if chase.caught:
+            assert (
+                hunts[0].predator_won
+                == simulation.simulate_fight(predator, prey).predator_won
+            )
+
+    def test_eaten_prey_leave_the_index(self) -> None:
+        world = World.populate(50, 200, random.Random(5))
+
+        hunts = world.run()
+
+        eaten = {hunt.prey for hunt in hunts if hunt.predator_won}
+        assert set(world.living_prey) == set(range(200)) - eaten
+        assert world.tick <= world.max_iterations
+
+    def test_populate_by_config(self) -> None:
+        config = SimulationConfig(world_max_position=10, max_iterations=50)
+
+        world = World.populate(20, 20, random.Random(6), config)
+
+        assert world.max_iterations == 50
+        assert world.movement_chain is config.movement_chain
+        assert all(0 <= c.position <= 10 for c in world.predators + world.prey)
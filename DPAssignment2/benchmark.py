@@ -0,0 +1,194 @@
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+from DPAssignment2.src.db.database import POOL_SIZE, PROFILES, DatabasePool
+from DPAssignment2.src.db.migrations import migrate
+from DPAssignment2.src.db.repository.product_repository import ProductRepository
+from DPAssignment2.src.db.repository.receipt_repository import ReceiptRepository
+from DPAssignment2.src.db.repository.unit_repository import UnitRepository
+from DPAssignment2.src.service.receipt_service import ReceiptService
+
+# Products in the catalogue the tills scan from
+CATALOGUE_SIZE: int = 50
+# Queries timed before and after the schema migrations, with their parameters
+QUERIES: Dict[str, Tuple[str, Callable[[List[str]], Tuple[str, ...]]]] = {
+    "sales of a product": (
+        "SELECT SUM(quantity) FROM Receipt_items WHERE product_id = ?",
+        lambda products: (products[len(products) // 2],)),
+    "open receipts": (
+        "SELECT id FROM Receipt WHERE status = 1", lambda products: ()),
+    "revenue": ("SELECT SUM(total) FROM Receipt", lambda products: ()),
+}
+
+
+def stock_catalogue(pool: DatabasePool, size: int = CATALOGUE_SIZE) -> List[UUID]:
+    with pool.connection() as db:
+        unit = UnitRepository(db).create_unit("pcs")
+        products = ProductRepository(db)
+        return [
+            products.create_product(
+                f"product {i}", unit.id, f"{i:013d}", Decimal("1.99") + i
+            ).id
+            for i in range(size)
+        ]
+
+
+def run_till(pool: DatabasePool, products: List[UUID],
+             receipts: int, items: int, till: int) -> None:
+    """
+    Rings up receipts one after another like a till: open a receipt, scan
+    items products, close it. Each step checks out its own connection, the
+    way get_db does for every request.
+    """
+    for receipt_number in range(receipts):
+        with pool.connection() as db:
+            receipt = ReceiptService(ReceiptRepository(db)).create_receipt()
+        for item in range(items):
+            product = products[(till + receipt_number + item) % len(products)]
+            with pool.connection() as db:
+                ReceiptService(ReceiptRepository(db)).add_product(
+                    receipt.id, product, 1)
+        with pool.connection() as db:
+            ReceiptService(ReceiptRepository(db)).close_receipt(receipt.id)
+
+
+def receipts_per_second(profile: str, path: Path, tills: int = 4,
+                        receipts: int = 50, items: int = 5,
+                        pool_size: int = POOL_SIZE) -> float:
+    """Receipts rung up per second by tills concurrent tills on a fresh file."""
+    pool = DatabasePool(str(path), pool_size, PROFILES[profile])
+    pool.connect()
+    try:
+        pool.create_tables()
+        products = stock_catalogue(pool)
+        errors: List[BaseException] = []
+
+        def till(number: int) -> None:
+            try:
+                run_till(pool, products, receipts, items, number)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=till, args=(number,))
+                   for number in range(tills)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.disconnect()
+    if errors:
+        raise errors[0]
+    return tills * receipts / elapsed
+
+
+def run_benchmarks(profiles: List[str], tills: int = 4, receipts: int = 50,
+                   items: int = 5, pool_size: int = POOL_SIZE) -> Dict[str, float]:
+    rates = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in profiles:
+            path = Path(directory) / f"{profile}.db"
+            rates[profile] = receipts_per_second(
+                profile, path, tills, receipts, items, pool_size)
+    return rates
+
+
+def fill_history(connection: sqlite3.Connection, products: int,
+                 receipts: int, items: int) -> List[str]:
+    """
+    Fills a schema at version 1 with closed receipts, and one open receipt
+    in a hundred, the way an existing database.db looks.
+    """
+    unit = str(uuid4())
+    product_ids = [str(uuid4()) for _ in range(products)]
+    connection.execute("INSERT INTO Unit (id, name) VALUES (?, 'pcs')", (unit,))
+    connection.executemany(
+        "INSERT INTO Product (id, unit_id, name, barcode, price) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(product, unit, f"product {i}", f"{i:013d}", "1.99")
+         for i, product in enumerate(product_ids)])
+    for number in range(receipts):
+        receipt = str(uuid4())
+        connection.execute(
+            "INSERT INTO Receipt (id, status, total) VALUES (?, ?, ?)",
+            (receipt, int(number % 100 == 0), str(Decimal("1.99") * items)))
+        connection.executemany(
+            "INSERT INTO Receipt_items VALUES (?, ?, 1, '1.99', '1.99')",
+            [(receipt, product_ids[(number + item) % products])
+             for item in range(items)])
+    connection.commit()
+    return product_ids
+
+
+def queries_per_second(connection: sqlite3.Connection, products: List[str],
+                       repeat: int) -> Dict[str, float]:
+    rates = {}
+    for name, (query, parameters) in QUERIES.items():
+        arguments = parameters(products)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            connection.execute(query, arguments).fetchall()
+        rates[name] = repeat / (time.perf_counter() - start)
+    return rates
+
+
+def migration_benchmark(path: Path, products: int = 500, receipts: int = 20_000,
+                        items: int = 5, repeat: int = 20
+                        ) -> Dict[str, Tuple[float, float]]:
+    """
+    Queries/sec of every QUERIES entry on a file at the original schema, then
+    on the same file migrated to the latest one.
+    """
+    connection = sqlite3.connect(path)
+    try:
+        migrate(connection, target=1)
+        product_ids = fill_history(connection, products, receipts, items)
+        before = queries_per_second(connection, product_ids, repeat)
+        migrate(connection)
+        after = queries_per_second(connection, product_ids, repeat)
+    finally:
+        connection.close()
+    return {name: (before[name], after[name]) for name in QUERIES}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark receipts/sec of the POS database profiles.")
+    parser.add_argument("--profile", nargs="+", choices=sorted(PROFILES),
+                        default=sorted(PROFILES))
+    parser.add_argument("--tills", type=int, default=4)
+    parser.add_argument("--receipts", type=int, default=50,
+                        help="receipts rung up by every till")
+    parser.add_argument("--items", type=int, default=5,
+                        help="products scanned onto every receipt")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE)
+    parser.add_argument("--migrations", action="store_true",
+                        help="time queries before and after the schema migrations "
+                             "instead")
+    args = parser.parse_args()
+
+    if args.migrations:
+        with tempfile.TemporaryDirectory() as directory:
+            results = migration_benchmark(Path(directory) / "history.db")
+        for name, (before, after) in results.items():
+            print(f"{name:<20}{before:>10,.1f} -> {after:>10,.1f} queries/s"
+                  f"{after / before:>8.1f}x")
+        return
+
+    rates = run_benchmarks(args.profile, args.tills, args.receipts,
+                           args.items, args.pool_size)
+    for profile, rate in rates.items():
+        print(f"{profile:<14}{rate:>10,.1f} receipts/s")
+
+
+if __name__ == "__main__":
+    main()
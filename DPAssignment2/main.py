@@ -8,6 +8,8 @@ from DPAssignment2.src.api.receipt_api import router as receipt_router
 from DPAssignment2.src.api.sales_api import router as sales_router
 from DPAssignment2.src.api.unit_api import router as unit_router
 from DPAssignment2.src.db.db_dependency import DatabaseManager, get_db
+from DPAssignment2.src.db.repository.product_repository import ProductRepository
+from DPAssignment2.src.service.product_cache import ProductCacheManager
 
 
 @asynccontextmanager
@@ -15,12 +17,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     db = DatabaseManager.get_instance()
     db.connect()
     db.create_tables()
+    with db.connection() as connection:
+        ProductCacheManager.get_instance().warm(
+            ProductRepository(connection).list_products())
     yield
     db.disconnect()
 
 app = FastAPI(title="POS System API", lifespan=lifespan)
 
 app.include_router(unit_router, dependencies=[Depends(get_db)])
-app.include_router(product_router, dependencies=[Depends(get_db)])
+# Product routes check out their own connection, so cache hits take none
+app.include_router(product_router)
 app.include_router(receipt_router, dependencies=[Depends(get_db)])
 app.include_router(sales_router, dependencies=[Depends(get_db)])
\ No newline at end of file
@@ -3,12 +3,14 @@ from typing import Any, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from DPAssignment2.src.db.database import Database
-from DPAssignment2.src.db.db_dependency import get_db
+from DPAssignment2.src.db.database import Database, DatabasePool
+from DPAssignment2.src.db.db_dependency import get_db, get_db_pool
+from DPAssignment2.src.db.money import MINOR_DIGITS
 from DPAssignment2.src.db.repository.product_repository import ProductRepository
 from DPAssignment2.src.models.product import Product as ProductModel
+from DPAssignment2.src.service.product_cache import ProductCache, get_product_cache
 from DPAssignment2.src.service.product_service import ProductService
 
 
@@ -16,10 +18,11 @@ class ProductCreate(BaseModel):
     name: str
     unit_id: UUID
     barcode: str
-    price: Decimal
+    # Prices are stored in minor units, so finer ones are rejected with 422
+    price: Decimal = Field(decimal_places=MINOR_DIGITS)
 
 class ProductUpdate(BaseModel):
-    price: Decimal
+    price: Decimal = Field(decimal_places=MINOR_DIGITS)
 
 class Product(BaseModel):
     id: UUID
@@ -42,12 +45,15 @@ router: APIRouter = APIRouter(
     tags=["products"]
 )
 
-def get_product_service(db: Database = Depends(get_db)) -> ProductService:
-    return ProductService(ProductRepository(db))
+def get_product_service(
+    db: Database = Depends(get_db),
+    cache: ProductCache = Depends(get_product_cache)
+) -> ProductService:
+    return ProductService(ProductRepository(db), cache)
 
 @router.post("", response_model=ProductResponse, status_code=201,
              responses={409: {"model": ErrorResponse}})
-async def create_product(
+def create_product(
     product_data: ProductCreate,
     service: ProductService = Depends(get_product_service)
 ) -> ProductResponse:
@@ -70,7 +76,7 @@ async def create_product(
 
 @router.get("/{product_id}", response_model=ProductResponse,
             responses={404: {"model": ErrorResponse}})
-async def get_product(
+def get_product(
     product_id: UUID,
     service: ProductService = Depends(get_product_service)
 ) -> ProductResponse:
@@ -88,8 +94,34 @@ async def get_product(
         price=product.price
     ))
 
+@router.get("/barcode/{barcode}", response_model=ProductResponse,
+            responses={404: {"model": ErrorResponse}})
+def get_product_by_barcode(
+    barcode: str,
+    cache: ProductCache = Depends(get_product_cache),
+    pool: DatabasePool = Depends(get_db_pool)
+) -> ProductResponse:
+    # A scan answered from the cache never waits for a pooled connection
+    product: Optional[ProductModel] = cache.get_by_barcode(barcode)
+    if product is None:
+        with pool.connection() as db:
+            service = ProductService(ProductRepository(db), cache)
+            product = service.read_product_by_barcode(barcode)
+    if product is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"message": f"Product with barcode<{barcode}> does not exist."}
+        )
+    return ProductResponse(product=Product(
+        id=product.id,
+        unit_id=product.unit_id,
+        name=product.name,
+        barcode=product.barcode,
+        price=product.price
+    ))
+
 @router.get("", response_model=ProductsResponse)
-async def list_products(
+def list_products(
     service: ProductService = Depends(get_product_service)
 ) -> ProductsResponse:
     products: List[ProductModel] = service.list_products()
@@ -105,7 +137,7 @@ async def list_products(
 
 @router.patch("/{product_id}", response_model=None,
               responses={404: {"model": ErrorResponse}})
-async def update_product(
+def update_product(
     product_id: UUID,
     product_data: ProductUpdate,
     service: ProductService = Depends(get_product_service)
@@ -53,7 +53,7 @@ def get_receipt_service(db: Database = Depends(get_db)) -> ReceiptService:
 
 
 @router.post("", response_model=ReceiptResponse, status_code=201)
-async def create_receipt(
+def create_receipt(
         service: ReceiptService = Depends(get_receipt_service)
 ) -> ReceiptResponse:
     receipt: ReceiptModel = service.create_receipt()
@@ -67,7 +67,7 @@ async def create_receipt(
 
 @router.post("/{receipt_id}/products", response_model=ReceiptResponse, status_code=201,
              responses={404: {"model": ErrorResponse}})
-async def add_product(
+def add_product(
         receipt_id: UUID,
         product_data: AddProduct,
         service: ReceiptService = Depends(get_receipt_service)
@@ -96,7 +96,7 @@ async def add_product(
 
 @router.get("/{receipt_id}", response_model=ReceiptResponse,
             responses={404: {"model": ErrorResponse}})
-async def get_receipt(
+def get_receipt(
         receipt_id: UUID,
         service: ReceiptService = Depends(get_receipt_service)
 ) -> ReceiptResponse:
@@ -122,7 +122,7 @@ async def get_receipt(
 
 @router.patch("/{receipt_id}", response_model=None,
               responses={404: {"model": ErrorResponse}})
-async def close_receipt(
+def close_receipt(
         receipt_id: UUID,
         service: ReceiptService = Depends(get_receipt_service)
 ) -> dict[str, Any]:
@@ -135,7 +135,7 @@ async def close_receipt(
 
 @router.delete("/{receipt_id}", response_model=None,
                responses={404: {"model": ErrorResponse}})
-async def delete_receipt(
+def delete_receipt(
         receipt_id: UUID,
         service: ReceiptService = Depends(get_receipt_service)
 ) -> dict[str, Any]:
@@ -21,7 +21,7 @@ def get_sales_service(db: Database = Depends(get_db)) -> SalesService:
     return SalesService(SalesRepository(db))
 
 @router.get("", response_model=SalesResponse)
-async def get_sales_report(
+def get_sales_report(
     service: SalesService = Depends(get_sales_service)
 ) -> SalesResponse:
     return SalesResponse(sales={
@@ -39,7 +39,7 @@ def get_unit_service(db: Database = Depends(get_db)) -> UnitService:
 
 @router.post("", response_model=UnitResponse, status_code=201,
              responses={409: {"model": ErrorResponse}})
-async def create_unit(unit_data: UnitCreate,
+def create_unit(unit_data: UnitCreate,
                       service: UnitService = Depends(get_unit_service)) -> UnitResponse:
     try:
         unit = service.create_unit(unit_data.name)
@@ -49,7 +49,7 @@ async def create_unit(unit_data: UnitCreate,
 
 @router.get("/{unit_id}", response_model=UnitResponse,
             responses={404: {"model": ErrorResponse}})
-async def get_unit(unit_id: UUID,
+def get_unit(unit_id: UUID,
                    service: UnitService = Depends(get_unit_service)) -> UnitResponse:
     unit = service.read_unit(unit_id)
     if unit is None:
@@ -60,7 +60,7 @@ async def get_unit(unit_id: UUID,
     return UnitResponse(unit=Unit(id=unit.id, name=unit.name))
 
 @router.get("", response_model=UnitsResponse)
-async def list_units(
+def list_units(
         service: UnitService = Depends(get_unit_service)) -> UnitsResponse:
     units = service.list_units()
     return UnitsResponse(units=[Unit(id=u.id, name=u.name) for u in units])
\ No newline at end of file
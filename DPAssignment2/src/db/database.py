@@ -1,16 +1,71 @@
 import sqlite3
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from queue import Queue
+from typing import Dict, Iterator, List, Optional
+
+from DPAssignment2.src.db.migrations import migrate
+
+# Connections a DatabasePool opens by default
+POOL_SIZE: int = 4
+
+
+@dataclass(frozen=True)
+class PragmaProfile:
+    """
+    PRAGMA settings applied to every connection when it opens. A setting
+    left as None keeps SQLite's default.
+    """
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    # Bytes of the file read through a memory map
+    mmap_size: Optional[int] = None
+    # Pages, or KiB when negative
+    cache_size: Optional[int] = None
+    temp_store: Optional[str] = None
+    # Milliseconds to wait for a lock held by another connection
+    busy_timeout: Optional[int] = None
+
+    def statements(self) -> List[str]:
+        return [
+            f"PRAGMA {name} = {value}"
+            for name, value in vars(self).items()
+            if value is not None
+        ]
+
+
+PROFILES: Dict[str, PragmaProfile] = {
+    # Rollback journal with a full fsync on every commit
+    "default": PragmaProfile(),
+    # Readers don't block the writer, and commits only append to the WAL;
+    # a power loss may drop the last commits but never corrupts the file
+    "performance": PragmaProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+}
+DEFAULT_PROFILE: str = "performance"
 
 
 class Database:
-    def __init__(self, db_name: str = "database.db") -> None:
+    def __init__(self, db_name: str = "database.db",
+                 profile: PragmaProfile = PROFILES["default"]) -> None:
         self.db_name : str = db_name
+        self.profile : PragmaProfile = profile
         self.connection : Optional[sqlite3.Connection] = None
         self.cursor : Optional[sqlite3.Cursor] = None
 
     def connect(self) -> None:
-        # Initialize connection
-        self.connection = sqlite3.connect(self.db_name)
+        # Initialize connection. A pool hands it to whichever thread serves
+        # the request, so it may be used outside the thread that opened it.
+        self.connection = sqlite3.connect(self.db_name, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        for statement in self.profile.statements():
+            self.connection.execute(statement)
         self.cursor = self.connection.cursor()
 
     def disconnect(self) -> None:
@@ -27,53 +82,56 @@ class Database:
             self.connection.rollback()
 
     def create_tables(self) -> None:
-        if self.cursor is None:
+        # Brings the schema up to date, whether the file is new or not
+        if self.connection is None:
             raise RuntimeError("Database not connected. Call connect() first.")
+        migrate(self.connection)
 
-        self.cursor.execute("PRAGMA foreign_keys = ON")
-
-        # Units table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Unit (
-                id TEXT PRIMARY KEY,
-                name TEXT UNIQUE NOT NULL
-            )
-        ''')
-
-        # Products table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Product (
-                id TEXT PRIMARY KEY,
-                unit_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                barcode TEXT UNIQUE NOT NULL,
-                price TEXT NOT NULL,
-                FOREIGN KEY (unit_id) REFERENCES Unit (id)
-            )
-        ''')
-
-        # Receipts table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Receipt (
-                id TEXT PRIMARY KEY,
-                status INTEGER NOT NULL,
-                total TEXT NOT NULL
-            )
-        ''')
-
-        # Receipt items table (junction table)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Receipt_items (
-                receipt_id TEXT NOT NULL,
-                product_id TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                price_when_sold TEXT NOT NULL,
-                total TEXT NOT NULL,
-                PRIMARY KEY (receipt_id, product_id),
-                FOREIGN KEY (receipt_id) REFERENCES Receipt (id),
-                FOREIGN KEY (product_id) REFERENCES Product (id)
-            )
-        ''')
+class DatabasePool:
+    """
+    A fixed set of Database connections to one file. Each request checks one
+    out for itself, so requests no longer share a cursor and reads run side
+    by side. An in-memory database is private to its connection, so a pool
+    of one gets a single connection.
+    """
 
-        if self.connection is not None:
-            self.connection.commit()
\ No newline at end of file
+    def __init__(self, db_name: str = "database.db", size: int = POOL_SIZE,
+                 profile: PragmaProfile = PROFILES[DEFAULT_PROFILE]) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.db_name : str = db_name
+        self.size : int = 1 if db_name == ":memory:" else size
+        self.databases : List[Database] = [
+            Database(db_name, profile) for _ in range(self.size)
+        ]
+        self._idle : Queue[Database] = Queue()
+        for database in self.databases:
+            self._idle.put(database)
+
+    def connect(self) -> None:
+        for database in self.databases:
+            database.connect()
+
+    def disconnect(self) -> None:
+        for database in self.databases:
+            database.disconnect()
+
+    def create_tables(self) -> None:
+        self.databases[0].create_tables()
+
+    def checkout(self) -> Database:
+        # Blocks until a connection is free
+        return self._idle.get()
+
+    def checkin(self, database: Database) -> None:
+        # Drop whatever a failed request left uncommitted
+        database.rollback()
+        self._idle.put(database)
+
+    @contextmanager
+    def connection(self) -> Iterator[Database]:
+        database = self.checkout()
+        try:
+            yield database
+        finally:
+            self.checkin(database)
@@ -1,17 +1,40 @@
 # db_dependency.py
-from typing import Optional
+import os
+from typing import Iterator, Optional
 
-from DPAssignment2.src.db.database import Database
+from DPAssignment2.src.db.database import (
+    DEFAULT_PROFILE,
+    POOL_SIZE,
+    PROFILES,
+    Database,
+    DatabasePool,
+)
 
 
 class DatabaseManager:
-    _instance : Optional[Database] = None
+    _instance : Optional[DatabasePool] = None
 
     @classmethod
-    def get_instance(cls) -> Database:
+    def get_instance(cls) -> DatabasePool:
+        # POS_DB_PROFILE picks a PROFILES entry, POS_DB_POOL_SIZE the pool size
         if cls._instance is None:
-            cls._instance = Database()
+            profile = os.environ.get("POS_DB_PROFILE", DEFAULT_PROFILE)
+            if profile not in PROFILES:
+                raise ValueError(
+                    f"Unknown database profile {profile!r}, "
+                    f"expected one of {sorted(PROFILES)}"
+                )
+            cls._instance = DatabasePool(
+                size=int(os.environ.get("POS_DB_POOL_SIZE", POOL_SIZE)),
+                profile=PROFILES[profile],
+            )
         return cls._instance
 
-def get_db() -> Database:
-    return DatabaseManager.get_instance()
\ No newline at end of file
+def get_db() -> Iterator[Database]:
+    # One connection per request, returned to the pool once it's answered
+    with DatabaseManager.get_instance().connection() as db:
+        yield db
+
+def get_db_pool() -> DatabasePool:
+    # For handlers that only need a connection on some requests
+    return DatabaseManager.get_instance()
@@ -0,0 +1,161 @@
+import argparse
+import sqlite3
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, List, Optional, Tuple
+
+from DPAssignment2.src.db.money import CENT, to_minor
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Cursor], None]
+
+
+def create_tables(cursor: sqlite3.Cursor) -> None:
+    # The original schema. IF NOT EXISTS adopts files made before migrations.
+
+    # Units table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Unit (
+            id TEXT PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL
+        )
+    ''')
+
+    # Products table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Product (
+            id TEXT PRIMARY KEY,
+            unit_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            barcode TEXT UNIQUE NOT NULL,
+            price TEXT NOT NULL,
+            FOREIGN KEY (unit_id) REFERENCES Unit (id)
+        )
+    ''')
+
+    # Receipts table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Receipt (
+            id TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            total TEXT NOT NULL
+        )
+    ''')
+
+    # Receipt items table (junction table)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Receipt_items (
+            receipt_id TEXT NOT NULL,
+            product_id TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            price_when_sold TEXT NOT NULL,
+            total TEXT NOT NULL,
+            PRIMARY KEY (receipt_id, product_id),
+            FOREIGN KEY (receipt_id) REFERENCES Receipt (id),
+            FOREIGN KEY (product_id) REFERENCES Product (id)
+        )
+    ''')
+
+
+MONEY_COLUMNS: List[Tuple[str, str]] = [("Product", "price"),
+                                        ("Receipt", "total"),
+                                        ("Receipt_items", "price_when_sold"),
+                                        ("Receipt_items", "total")]
+
+
+def integer_money(cursor: sqlite3.Cursor) -> None:
+    # TEXT amounts become INTEGER counts of minor units, keeping column order.
+    # Amounts finer than a minor unit can't be converted exactly, so rather
+    # than round them the migration fails and lists them.
+    inexact = [
+        f"{table}.{column} rowid {rowid}: {amount}"
+        for table, column in MONEY_COLUMNS
+        for rowid, amount in cursor.execute(f"SELECT rowid, {column} FROM {table}")
+        if Decimal(amount) != Decimal(amount).quantize(CENT)
+    ]
+    if inexact:
+        raise ValueError("amounts finer than a minor unit, fix them and migrate "
+                         "again:\n" + "\n".join(inexact))
+    cursor.connection.create_function(
+        "to_minor", 1, lambda text: to_minor(Decimal(text)), deterministic=True
+    )
+    for table, column in MONEY_COLUMNS:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column}_minor "
+                       "INTEGER NOT NULL DEFAULT 0")
+        cursor.execute(f"UPDATE {table} SET {column}_minor = to_minor({column})")
+        cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+        cursor.execute(f"ALTER TABLE {table} RENAME COLUMN {column}_minor TO {column}")
+
+
+def add_indexes(cursor: sqlite3.Cursor) -> None:
+    # Barcode lookups already use the index behind its UNIQUE constraint
+    cursor.execute('''CREATE INDEX IF NOT EXISTS Receipt_items_product_id
+                      ON Receipt_items (product_id)''')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS Receipt_status
+                      ON Receipt (status)''')
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create tables", create_tables),
+    Migration(2, "integer money", integer_money),
+    Migration(3, "indexes", add_indexes),
+]
+LATEST_VERSION: int = MIGRATIONS[-1].version
+
+
+def schema_version(connection: sqlite3.Connection) -> int:
+    return int(connection.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(connection: sqlite3.Connection,
+            target: int = LATEST_VERSION) -> List[Migration]:
+    """
+    Applies the migrations past the file's PRAGMA user_version up to target
+    and returns them. Each runs in its own transaction together with the
+    version bump, so a failed migration leaves the file at the previous
+    version, and in WAL mode readers carry on while it runs.
+    """
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version > target:
+            break
+        cursor = connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # Another connection may have migrated while we waited for the lock
+            if migration.version <= schema_version(connection):
+                connection.rollback()
+                continue
+            migration.apply(cursor)
+            cursor.execute(f"PRAGMA user_version = {migration.version}")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        applied.append(migration)
+    return applied
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Migrate a POS database file.")
+    parser.add_argument("database", nargs="?", default="database.db")
+    parser.add_argument("--target", type=int, default=LATEST_VERSION)
+    args = parser.parse_args(argv)
+
+    connection = sqlite3.connect(args.database)
+    try:
+        connection.execute("PRAGMA foreign_keys = ON")
+        before = schema_version(connection)
+        for migration in migrate(connection, args.target):
+            print(f"applied {migration.version}: {migration.name}")
+        print(f"schema version {before} -> {schema_version(connection)}")
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+from decimal import Decimal
+
+# Money is stored as an integer count of the currency's minor unit
+MINOR_DIGITS: int = 2
+CENT: Decimal = Decimal(1).scaleb(-MINOR_DIGITS)
+
+
+def to_minor(amount: Decimal) -> int:
+    if amount != amount.quantize(CENT):
+        raise ValueError(f"{amount} has more than {MINOR_DIGITS} decimal places")
+    return int(amount.scaleb(MINOR_DIGITS))
+
+
+def from_minor(minor: int) -> Decimal:
+    return Decimal(minor).scaleb(-MINOR_DIGITS)
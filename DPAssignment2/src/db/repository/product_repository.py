@@ -5,6 +5,7 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from DPAssignment2.src.db.database import Database
+from DPAssignment2.src.db.money import from_minor, to_minor
 from DPAssignment2.src.models.product import Product
 
 
@@ -18,6 +19,10 @@ class IProductRepository(ABC):
     def read_product(self, product_id: UUID) -> Optional[Product]:
         pass
 
+    @abstractmethod
+    def read_product_by_barcode(self, barcode: str) -> Optional[Product]:
+        pass
+
     @abstractmethod
     def list_products(self) -> List[Product]:
         pass
@@ -39,7 +44,7 @@ class ProductRepository(IProductRepository):
            self.db.cursor.execute(
                '''INSERT INTO Product 
                (id, unit_id, name, barcode, price) VALUES (?, ?, ?, ?, ?)''',
-               (str(product_id), str(unit_id), name, barcode, str(price))
+               (str(product_id), str(unit_id), name, barcode, to_minor(price))
            )
            self.db.commit()
            return Product(id=product_id, unit_id=unit_id,
@@ -61,7 +66,23 @@ class ProductRepository(IProductRepository):
            unit_id=UUID(row[1]),
            name=row[2],
            barcode=row[3],
-           price=Decimal(row[4])
+           price=from_minor(row[4])
+       )
+
+   def read_product_by_barcode(self, barcode: str) -> Optional[Product]:
+       if self.db.cursor is None:
+           raise RuntimeError("Database not connected")
+       self.db.cursor.execute(
+           "SELECT * FROM Product WHERE barcode = ?", (barcode,))
+       row = self.db.cursor.fetchone()
+       if row is None:
+           return None
+       return Product(
+           id=UUID(row[0]),
+           unit_id=UUID(row[1]),
+           name=row[2],
+           barcode=row[3],
+           price=from_minor(row[4])
        )
 
    def list_products(self) -> List[Product]:
@@ -73,7 +94,7 @@ class ProductRepository(IProductRepository):
            unit_id=UUID(row[1]),
            name=row[2],
            barcode=row[3],
-           price=Decimal(row[4])
+           price=from_minor(row[4])
        ) for row in self.db.cursor.fetchall()]
 
    def update_product(self, product_id: UUID, price: Decimal) -> None:
@@ -82,7 +103,7 @@ class ProductRepository(IProductRepository):
                raise RuntimeError("Database not connected")
            self.db.cursor.execute(
                "UPDATE Product SET price = ? WHERE id = ?",
-               (str(price), str(product_id))
+               (to_minor(price), str(product_id))
            )
            if self.db.cursor.rowcount == 0:
                raise ValueError(f"Product with id {product_id} not found")
@@ -5,8 +5,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from DPAssignment2.src.db.database import Database
-from DPAssignment2.src.db.repository.product_repository import ProductRepository
-from DPAssignment2.src.models.product import Product
+from DPAssignment2.src.db.money import from_minor, to_minor
 from DPAssignment2.src.models.receipt import Receipt, ReceiptProduct
 
 
@@ -47,7 +46,7 @@ class ReceiptRepository(IReceiptRepository):
            receipt = Receipt()
            self.db.cursor.execute(
                "INSERT INTO Receipt (id, status, total) VALUES (?, ?, ?)",
-               (str(receipt.id), 1, str(receipt.total))
+               (str(receipt.id), 1, to_minor(receipt.total))
            )
            self.db.commit()
            return receipt
@@ -83,23 +82,74 @@ class ReceiptRepository(IReceiptRepository):
        )
 
    def add_product(self, receipt_id: UUID, product_id: UUID, quantity: int) -> Receipt:
+       # One transaction: read the receipt, its items and the product's price
+       # together, upsert the item, then add the item's change to the total
+       if self.db.cursor is None:
+           raise RuntimeError("Database not connected")
        try:
-           product: Optional[Product] = (
-               ProductRepository(self.db).read_product(product_id))
-           existing_quantity: int = self.get_existing_quantity(receipt_id, product_id)
-           if product is None:
-               raise ValueError("Product not found")
-           if existing_quantity:
-               self._update_existing_product(receipt_id, product_id, quantity, product)
-           else:
-               self._add_new_product(receipt_id, product_id, quantity, product)
-
-           self._update_receipt_total(receipt_id)
-           ret: Optional[Receipt] = self.get_receipt(receipt_id)
-           if ret is None:
+           self.db.cursor.execute("BEGIN IMMEDIATE")
+           self.db.cursor.execute(
+               '''SELECT r.status,
+                      (SELECT price FROM Product WHERE id = ?),
+                      i.product_id, i.quantity, i.price_when_sold, i.total
+               FROM Receipt r
+               LEFT JOIN Receipt_items i ON i.receipt_id = r.id
+               WHERE r.id = ?
+               ORDER BY i.rowid''',
+               (str(product_id), str(receipt_id))
+           )
+           rows = self.db.cursor.fetchall()
+           if not rows:
                raise ValueError("Receipt not found")
-           return ret
+           status, price = rows[0][:2]
+           if not status:
+               raise ValueError("Receipt is not open")
+           if price is None:
+               raise ValueError("Product not found")
+
+           products: List[ReceiptProduct] = []
+           position, existing_quantity, existing_total = len(rows), 0, 0
+           for row in rows:
+               if row[2] is None:
+                   continue
+               if row[2] == str(product_id):
+                   position = len(products)
+                   existing_quantity, existing_total = row[3], row[5]
+               products.append(ReceiptProduct(
+                   product_id=UUID(row[2]),
+                   quantity=row[3],
+                   price_when_sold=from_minor(row[4])
+               ))
+
+           item_total = (existing_quantity + quantity) * price
+           self.db.cursor.execute(
+               '''INSERT INTO Receipt_items (receipt_id, product_id,
+               quantity, price_when_sold, total)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT (receipt_id, product_id) DO UPDATE SET
+                   quantity = quantity + excluded.quantity,
+                   total = excluded.total
+               RETURNING quantity, price_when_sold''',
+               (str(receipt_id), str(product_id), quantity, price, item_total)
+           )
+           new_quantity, price_when_sold = self.db.cursor.fetchone()
+           products[position:position + 1] = [ReceiptProduct(
+               product_id=product_id,
+               quantity=new_quantity,
+               price_when_sold=from_minor(price_when_sold)
+           )]
 
+           self.db.cursor.execute(
+               "UPDATE Receipt SET total = total + ? WHERE id = ? RETURNING total",
+               (item_total - existing_total, str(receipt_id))
+           )
+           total = from_minor(self.db.cursor.fetchone()[0])
+           self.db.commit()
+           return Receipt(id=receipt_id, status=True, products=products, total=total)
+
+       except ValueError:
+           self.db.rollback()
+           raise
        except sqlite3.Error as e:
            self.db.rollback()
            raise RuntimeError(f"Database error while adding product: {e}")
@@ -134,69 +184,25 @@ class ReceiptRepository(IReceiptRepository):
        return {
            'id': UUID(row[0]),
            'status': bool(row[1]),
-           'total': Decimal(row[2])
+           'total': from_minor(row[2])
        }
 
    def _get_receipt_items(self, receipt_id: UUID) -> List[ReceiptProduct]:
        if self.db.cursor is None:
            raise RuntimeError("Database not connected")
        self.db.cursor.execute(
-           "SELECT * FROM Receipt_items WHERE receipt_id = ?",
+           "SELECT * FROM Receipt_items WHERE receipt_id = ? ORDER BY rowid",
            (str(receipt_id),)
        )
        return [
            ReceiptProduct(
                product_id=UUID(row[1]),
                quantity=row[2],
-               price_when_sold=Decimal(row[3])
+               price_when_sold=from_minor(row[3])
            )
            for row in self.db.cursor.fetchall()
        ]
 
-   def _update_existing_product(self, receipt_id: UUID, product_id: UUID,
-                               quantity: int, product: Product) -> None:
-       existing_quantity = self.get_existing_quantity(receipt_id, product_id)
-       new_quantity = existing_quantity + quantity
-       new_total = new_quantity * product.price
-       self.update_receipt_item(receipt_id, product_id, new_quantity, new_total)
-
-   def _add_new_product(self, receipt_id: UUID, product_id: UUID,
-                        quantity: int, product: Product) -> None:
-       total = product.price * quantity
-       self.insert_receipt_item(receipt_id, product_id, quantity, product.price, total)
-
-   def get_existing_quantity(self, receipt_id: UUID, product_id: UUID) -> int:
-       if self.db.cursor is None:
-           raise RuntimeError("Database not connected")
-       self.db.cursor.execute(
-           '''SELECT quantity FROM Receipt_items 
-           WHERE receipt_id = ? AND product_id = ?''',
-           (str(receipt_id), str(product_id))
-       )
-       row = self.db.cursor.fetchone()
-       return row[0] if row else 0
-
-   def update_receipt_item(self, receipt_id: UUID, product_id: UUID,
-                          quantity: int, total: Decimal) -> None:
-       if self.db.cursor is None:
-           raise RuntimeError("Database not connected")
-       self.db.cursor.execute(
-           '''UPDATE Receipt_items SET quantity = ?, total = ? 
-              WHERE receipt_id = ? AND product_id = ?''',
-           (quantity, str(total), str(receipt_id), str(product_id))
-       )
-
-   def insert_receipt_item(self, receipt_id: UUID, product_id: UUID,
-                          quantity: int, price: Decimal, total: Decimal) -> None:
-       if self.db.cursor is None:
-           raise RuntimeError("Database not connected")
-       self.db.cursor.execute(
-           '''INSERT INTO Receipt_items (receipt_id, product_id, 
-           quantity, price_when_sold, total) 
-           VALUES (?, ?, ?, ?, ?)''',
-           (str(receipt_id), str(product_id), quantity, str(price), str(total))
-       )
-
    def get_total(self, receipt_id: UUID) -> Decimal:
        if self.db.cursor is None:
            raise RuntimeError("Database not connected")
@@ -205,7 +211,7 @@ class ReceiptRepository(IReceiptRepository):
            (str(receipt_id),)
        )
        row = self.db.cursor.fetchone()
-       return Decimal(row[0]) if row and row[0] else Decimal(0)
+       return from_minor(row[0]) if row and row[0] else Decimal(0)
 
    def update_total(self, receipt_id: UUID, new_total: Decimal) -> None:
        if self.db.cursor is None:
@@ -215,13 +221,9 @@ class ReceiptRepository(IReceiptRepository):
                raise ValueError("New total must be a Decimal.")
            self.db.cursor.execute(
                "UPDATE Receipt SET total = ? WHERE id = ?",
-               (str(new_total), str(receipt_id))
+               (to_minor(new_total), str(receipt_id))
            )
            self.db.commit()
        except sqlite3.Error as e:
            self.db.rollback()
-           raise e
-
-   def _update_receipt_total(self, receipt_id: UUID) -> None:
-       new_receipt_total = self.get_total(receipt_id)
-       self.update_total(receipt_id, new_receipt_total)
\ No newline at end of file
+           raise e
\ No newline at end of file
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 
 from DPAssignment2.src.db.database import Database
+from DPAssignment2.src.db.money import from_minor
 
 
 class ISalesRepository(ABC):
@@ -31,4 +32,4 @@ class SalesRepository(ISalesRepository):
            raise RuntimeError("Database not connected")
        self.db.cursor.execute("SELECT SUM(total) FROM Receipt")
        row = self.db.cursor.fetchone()
-       return Decimal(row[0]) if row and row[0] else Decimal(0)
\ No newline at end of file
+       return from_minor(row[0]) if row and row[0] else Decimal(0)
\ No newline at end of file
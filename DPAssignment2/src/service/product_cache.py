@@ -0,0 +1,63 @@
+from threading import Lock
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from DPAssignment2.src.models.product import Product
+
+
+class ProductCache:
+    """
+    Products by id and by barcode, so a scan at the till is a dict lookup.
+    The cache belongs to one process: with several uvicorn workers, each
+    keeps its own and only sees the changes made through it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._by_id : Dict[UUID, Product] = {}
+        self._by_barcode : Dict[str, Product] = {}
+        # Bumped by every invalidation, see put()
+        self.version : int = 0
+
+    def warm(self, products: Iterable[Product]) -> None:
+        with self._lock:
+            self._by_id.clear()
+            self._by_barcode.clear()
+            for product in products:
+                self._by_id[product.id] = product
+                self._by_barcode[product.barcode] = product
+
+    def get(self, product_id: UUID) -> Optional[Product]:
+        return self._by_id.get(product_id)
+
+    def get_by_barcode(self, barcode: str) -> Optional[Product]:
+        return self._by_barcode.get(barcode)
+
+    def put(self, product: Product, version: Optional[int] = None) -> None:
+        # A product read before an invalidation may be stale, so it is only
+        # cached if version, taken before the read, is still current
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._by_id[product.id] = product
+            self._by_barcode[product.barcode] = product
+
+    def invalidate(self, product_id: UUID) -> None:
+        with self._lock:
+            self.version += 1
+            product = self._by_id.pop(product_id, None)
+            if product is not None:
+                self._by_barcode.pop(product.barcode, None)
+
+
+class ProductCacheManager:
+    _instance : Optional[ProductCache] = None
+
+    @classmethod
+    def get_instance(cls) -> ProductCache:
+        if cls._instance is None:
+            cls._instance = ProductCache()
+        return cls._instance
+
+def get_product_cache() -> ProductCache:
+    return ProductCacheManager.get_instance()
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from DPAssignment2.src.db.repository.product_repository import ProductRepository
 from DPAssignment2.src.models.product import Product
+from DPAssignment2.src.service.product_cache import ProductCache
 
 
 class IProductService(ABC):
@@ -17,6 +18,10 @@ class IProductService(ABC):
     def read_product(self, product_id: UUID) -> Optional[Product]:
         pass
 
+    @abstractmethod
+    def read_product_by_barcode(self, barcode: str) -> Optional[Product]:
+        pass
+
     @abstractmethod
     def list_products(self) -> List[Product]:
         pass
@@ -26,8 +31,10 @@ class IProductService(ABC):
         pass
 
 class ProductService(IProductService):
-    def __init__(self, product_repo: ProductRepository):
+    def __init__(self, product_repo: ProductRepository,
+                 cache: Optional[ProductCache] = None):
         self.product_repo = product_repo
+        self.cache = cache
 
     def create_product(self, name: str, unit_id: UUID,
                        barcode: str, price: Decimal) -> Product:
@@ -38,10 +45,32 @@ class ProductService(IProductService):
         if price <= 0:
             raise ValueError("Price must be greater than zero")
 
-        return self.product_repo.create_product(name, unit_id, barcode, price)
+        product = self.product_repo.create_product(name, unit_id, barcode, price)
+        if self.cache is not None:
+            self.cache.put(product)
+        return product
 
     def read_product(self, product_id: UUID) -> Optional[Product]:
-        return self.product_repo.read_product(product_id)
+        if self.cache is None:
+            return self.product_repo.read_product(product_id)
+        product = self.cache.get(product_id)
+        if product is None:
+            version = self.cache.version
+            product = self.product_repo.read_product(product_id)
+            if product is not None:
+                self.cache.put(product, version)
+        return product
+
+    def read_product_by_barcode(self, barcode: str) -> Optional[Product]:
+        if self.cache is None:
+            return self.product_repo.read_product_by_barcode(barcode)
+        product = self.cache.get_by_barcode(barcode)
+        if product is None:
+            version = self.cache.version
+            product = self.product_repo.read_product_by_barcode(barcode)
+            if product is not None:
+                self.cache.put(product, version)
+        return product
 
     def list_products(self) -> List[Product]:
         return self.product_repo.list_products()
@@ -49,4 +78,8 @@ class ProductService(IProductService):
     def update_product(self, product_id: UUID, price: Decimal) -> None:
         if price <= 0:
             raise ValueError("Price must be greater than zero")
-        self.product_repo.update_product(product_id, price)
\ No newline at end of file
+        try:
+            self.product_repo.update_product(product_id, price)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(product_id)
\ No newline at end of file
@@ -46,9 +46,6 @@ class ReceiptService(IReceiptService):
     def add_product(self, receipt_id: UUID, product_id: UUID, quantity: int) -> Receipt:
         if quantity <= 0:
             raise ValueError("Quantity must be greater than 0")
-        rec: Optional[Receipt] = self.receipt_repo.get_receipt(receipt_id)
-        if rec is None:
-            raise ValueError("Receipt not found")
-        if not rec.status:
-            raise ValueError("Receipt is not open")
+        # The repository checks the receipt exists and is open in the same
+        # transaction that adds the product
         return self.receipt_repo.add_product(receipt_id, product_id, quantity)
\ No newline at end of file
@@ -7,6 +7,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from DPAssignment2.main import app
+from DPAssignment2.src.db.database import DatabasePool
+from DPAssignment2.src.models.product import Product
+from DPAssignment2.src.service.product_cache import ProductCache, get_product_cache
 
 # Constants
 SAMPLE_PRODUCT_ID = UUID('7d3184ae-80cd-417f-8b14-e3de42a98031')
@@ -82,6 +85,20 @@ class TestCreateProduct:
             "detail": {"message": "Product with barcode<1234567890> already exists."}
         }
 
+    def test_create_product_price_below_a_cent(self, test_client: TestClient,
+                                               mock_service: Mock) -> None:
+        # Execute
+        response = test_client.post("/products", json={
+            "unit_id": str(SAMPLE_UNIT_ID),
+            "name": "Apple",
+            "barcode": "1234567890",
+            "price": "1.005"
+        })
+
+        # Assert
+        assert response.status_code == 422
+        mock_service.create_product.assert_not_called()
+
 # Tests for GET /products/{product_id}
 class TestGetProduct:
     def test_get_product_success(self, test_client: TestClient,
@@ -116,6 +133,61 @@ class TestGetProduct:
                            f"Product with id<{SAMPLE_PRODUCT_ID}> does not exist."}
         }
 
+# Tests for GET /products/barcode/{barcode}
+class TestGetProductByBarcode:
+    def test_get_product_by_barcode_success(self, test_client: TestClient,
+                                            mock_service: Mock) -> None:
+        # Setup
+        product = mock_service.read_product_by_barcode.return_value
+        product.id = SAMPLE_PRODUCT_ID
+        product.unit_id = SAMPLE_UNIT_ID
+        product.name = "Apple"
+        product.barcode = "1234567890"
+        product.price = Decimal("520.00")
+
+        # Execute
+        response = test_client.get("/products/barcode/1234567890")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"product": SAMPLE_PRODUCT}
+        mock_service.read_product_by_barcode.assert_called_once_with("1234567890")
+
+    def test_get_product_by_barcode_not_found(self, test_client: TestClient,
+                                              mock_service: Mock) -> None:
+        # Setup
+        mock_service.read_product_by_barcode.return_value = None
+
+        # Execute
+        response = test_client.get("/products/barcode/1234567890")
+
+        # Assert
+        assert response.status_code == 404
+        assert response.json() == {
+            "detail": {"message": "Product with barcode<1234567890> does not exist."}
+        }
+
+    def test_get_product_by_barcode_from_cache(self,
+                                               test_client: TestClient) -> None:
+        # Setup
+        cache = ProductCache()
+        cache.warm([Product(name="Apple", unit_id=SAMPLE_UNIT_ID,
+                            barcode="1234567890", price=Decimal("520.00"),
+                            id=SAMPLE_PRODUCT_ID)])
+        app.dependency_overrides[get_product_cache] = lambda: cache
+
+        # Execute
+        try:
+            with patch.object(DatabasePool, "checkout") as checkout:
+                response = test_client.get("/products/barcode/1234567890")
+        finally:
+            del app.dependency_overrides[get_product_cache]
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"product": SAMPLE_PRODUCT}
+        checkout.assert_not_called()
+
 # Tests for GET /products
 class TestListProducts:
     def test_list_products_success(self, test_client: TestClient,
@@ -175,4 +247,16 @@ class TestUpdateProduct:
         assert response.json() == {
             "detail": {"message":
                            f"Product with id<{SAMPLE_PRODUCT_ID}> does not exist."}
-        }
\ No newline at end of file
+        }
+
+    def test_update_product_price_below_a_cent(self, test_client: TestClient,
+                                               mock_service: Mock) -> None:
+        # Execute
+        response = test_client.patch(
+            f"/products/{SAMPLE_PRODUCT_ID}",
+            json={"price": "1.005"}
+        )
+
+        # Assert
+        assert response.status_code == 422
+        mock_service.update_product.assert_not_called()
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from DPAssignment2.benchmark import QUERIES, migration_benchmark, run_benchmarks
+from DPAssignment2.src.db.database import PROFILES
+
+
+class TestBenchmark:
+    def test_run_benchmarks(self) -> None:
+        rates = run_benchmarks(sorted(PROFILES), tills=2, receipts=3, items=2)
+
+        assert set(rates) == set(PROFILES)
+        assert all(rate > 0 for rate in rates.values())
+
+    def test_migration_benchmark(self, tmp_path: Path) -> None:
+        results = migration_benchmark(tmp_path / "history.db", products=10,
+                                      receipts=20, items=2, repeat=1)
+
+        assert set(results) == set(QUERIES)
+        assert all(before > 0 and after > 0 for before, after in results.values())
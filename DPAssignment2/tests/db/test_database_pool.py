@@ -0,0 +1,128 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Generator, List
+from unittest.mock import patch
+
+import pytest
+
+from DPAssignment2.src.db.database import PROFILES, Database, DatabasePool
+from DPAssignment2.src.db.db_dependency import DatabaseManager, get_db
+from DPAssignment2.src.db.repository.unit_repository import UnitRepository
+
+
+class TestDatabasePool:
+    @pytest.fixture
+    def pool(self, tmp_path: Path) -> Generator[DatabasePool, None, None]:
+        pool = DatabasePool(str(tmp_path / "pos.db"), size=3)
+        pool.connect()
+        pool.create_tables()
+        yield pool
+        pool.disconnect()  # Clean up after test
+
+    def test_connections_are_distinct(self, pool: DatabasePool) -> None:
+        checked_out = [pool.checkout() for _ in range(3)]
+
+        assert len({id(db.connection) for db in checked_out}) == 3
+        for db in checked_out:
+            pool.checkin(db)
+
+    def test_connections_share_the_file(self, pool: DatabasePool) -> None:
+        with pool.connection() as writer:
+            unit = UnitRepository(writer).create_unit("kg")
+            with pool.connection() as reader:
+                assert reader is not writer
+                assert UnitRepository(reader).read_unit(unit.id) == unit
+
+    def test_foreign_keys_on_every_connection(self, pool: DatabasePool) -> None:
+        for db in pool.databases:
+            assert db.cursor is not None
+            db.cursor.execute("PRAGMA foreign_keys")
+            assert db.cursor.fetchone() == (1,)
+
+    def test_checkin_rolls_back(self, pool: DatabasePool) -> None:
+        with pool.connection() as db:
+            assert db.cursor is not None
+            db.cursor.execute("INSERT INTO Unit (id, name) VALUES ('1', 'kg')")
+
+        with pool.connection() as db:
+            assert db.cursor is not None
+            db.cursor.execute("SELECT COUNT(*) FROM Unit")
+            assert db.cursor.fetchone() == (0,)
+
+    def test_connections_work_across_threads(self, pool: DatabasePool) -> None:
+        # Every thread holds a connection at the same time, opened elsewhere
+        barrier = threading.Barrier(3)
+        errors: List[BaseException] = []
+
+        def read() -> None:
+            try:
+                with pool.connection() as db:
+                    barrier.wait(timeout=5)
+                    UnitRepository(db).list_units()
+            except (sqlite3.Error, threading.BrokenBarrierError) as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_memory_database_gets_one_connection(self) -> None:
+        assert DatabasePool(":memory:", size=4).size == 1
+
+    def test_invalid_size(self) -> None:
+        with pytest.raises(ValueError):
+            DatabasePool(size=0)
+
+    def test_get_db_returns_connection(self) -> None:
+        pool = DatabasePool(":memory:")
+        with patch.object(DatabaseManager, "_instance", pool):
+            dependency = get_db()
+            db = next(dependency)
+            assert isinstance(db, Database)
+            assert pool._idle.empty()
+
+            with pytest.raises(StopIteration):
+                next(dependency)
+            assert pool._idle.qsize() == 1
+
+
+class TestPragmaProfile:
+    def test_default_profile_changes_nothing(self) -> None:
+        assert PROFILES["default"].statements() == []
+
+    def test_performance_profile_applied_on_connect(self, tmp_path: Path) -> None:
+        db = Database(str(tmp_path / "pos.db"), PROFILES["performance"])
+        db.connect()
+        assert db.cursor is not None
+        settings = {}
+        for name in ("journal_mode", "synchronous", "temp_store", "busy_timeout"):
+            db.cursor.execute(f"PRAGMA {name}")
+            settings[name] = db.cursor.fetchone()[0]
+        db.disconnect()
+
+        # synchronous NORMAL is 1, temp_store MEMORY is 2
+        assert settings == {"journal_mode": "wal", "synchronous": 1,
+                            "temp_store": 2, "busy_timeout": 5000}
+
+    def test_profile_selected_from_environment(
+            self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(DatabaseManager, "_instance", None)
+        monkeypatch.setenv("POS_DB_PROFILE", "default")
+        monkeypatch.setenv("POS_DB_POOL_SIZE", "2")
+
+        pool = DatabaseManager.get_instance()
+
+        assert pool.size == 2
+        assert all(db.profile == PROFILES["default"] for db in pool.databases)
+
+    def test_unknown_profile(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(DatabaseManager, "_instance", None)
+        monkeypatch.setenv("POS_DB_PROFILE", "turbo")
+
+        with pytest.raises(ValueError):
+            DatabaseManager.get_instance()
@@ -0,0 +1,106 @@
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+from typing import Generator, List
+from uuid import UUID, uuid4
+
+import pytest
+
+from DPAssignment2.src.db import migrations
+from DPAssignment2.src.db.database import Database
+from DPAssignment2.src.db.migrations import (
+    LATEST_VERSION,
+    Migration,
+    migrate,
+    schema_version,
+)
+from DPAssignment2.src.db.repository.product_repository import ProductRepository
+from DPAssignment2.src.db.repository.receipt_repository import ReceiptRepository
+
+
+class TestMigrations:
+    @pytest.fixture
+    def connection(self, tmp_path: Path) -> Generator[sqlite3.Connection, None, None]:
+        connection = sqlite3.connect(tmp_path / "database.db")
+        connection.execute("PRAGMA foreign_keys = ON")
+        yield connection
+        connection.close()  # Clean up after test
+
+    def column_types(self, connection: sqlite3.Connection, table: str) -> List[str]:
+        return [row[2] for row in connection.execute(f"PRAGMA table_info({table})")]
+
+    def test_new_file_gets_latest_schema(self, connection: sqlite3.Connection) -> None:
+        applied = migrate(connection)
+
+        assert [m.version for m in applied] == list(range(1, LATEST_VERSION + 1))
+        assert schema_version(connection) == LATEST_VERSION
+        assert self.column_types(connection, "Receipt_items") == [
+            "TEXT", "TEXT", "INTEGER", "INTEGER", "INTEGER"]
+        indexes = {row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"Receipt_items_product_id", "Receipt_status"} <= indexes
+
+    def test_migrate_is_idempotent(self, connection: sqlite3.Connection) -> None:
+        migrate(connection)
+        assert migrate(connection) == []
+
+    def test_existing_file_keeps_its_data(self, connection: sqlite3.Connection) -> None:
+        # A database.db made before migrations existed
+        migrate(connection, target=1)
+        connection.execute("PRAGMA user_version = 0")
+        unit, product, receipt = (str(uuid4()) for _ in range(3))
+        connection.execute("INSERT INTO Unit VALUES (?, 'kg')", (unit,))
+        connection.execute("INSERT INTO Product VALUES (?, ?, 'apple', '1', '3.99')",
+                           (product, unit))
+        connection.execute("INSERT INTO Receipt VALUES (?, 1, '7.98')", (receipt,))
+        connection.execute("INSERT INTO Receipt_items VALUES (?, ?, 2, '3.99', '7.98')",
+                           (receipt, product))
+        connection.commit()
+
+        migrate(connection)
+
+        assert connection.execute("SELECT price FROM Product").fetchone() == (399,)
+        assert connection.execute(
+            "SELECT * FROM Receipt_items").fetchone() == (receipt, product, 2, 399, 798)
+        db = Database()
+        db.connection, db.cursor = connection, connection.cursor()
+        stored = ReceiptRepository(db).get_receipt(UUID(receipt))
+        assert stored is not None and stored.total == Decimal("7.98")
+        read = ProductRepository(db).read_product(UUID(product))
+        assert read is not None and read.price == Decimal("3.99")
+
+    def test_amount_below_a_cent_fails(self, connection: sqlite3.Connection) -> None:
+        migrate(connection, target=1)
+        unit, product = str(uuid4()), str(uuid4())
+        connection.execute("INSERT INTO Unit VALUES (?, 'kg')", (unit,))
+        connection.execute("INSERT INTO Product VALUES (?, ?, 'apple', '1', '1.005')",
+                           (product, unit))
+        connection.commit()
+
+        with pytest.raises(ValueError, match=r"Product.price rowid 1: 1.005"):
+            migrate(connection)
+        assert schema_version(connection) == 1
+        assert connection.execute("SELECT price FROM Product").fetchone() == ("1.005",)
+
+    def test_failed_migration_rolls_back(self, connection: sqlite3.Connection,
+                                         monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(cursor: sqlite3.Cursor) -> None:
+            cursor.execute("CREATE TABLE Half (id INTEGER)")
+            raise sqlite3.OperationalError("disk full")
+
+        monkeypatch.setattr(migrations, "MIGRATIONS", [
+            *migrations.MIGRATIONS, Migration(LATEST_VERSION + 1, "broken", fail)])
+
+        with pytest.raises(sqlite3.OperationalError):
+            migrate(connection, target=LATEST_VERSION + 1)
+        assert schema_version(connection) == LATEST_VERSION
+        assert connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'Half'").fetchone() is None
+
+    def test_product_lookup_uses_index(self, connection: sqlite3.Connection) -> None:
+        migrate(connection)
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM Receipt_items WHERE product_id = ?",
+            ("x",)).fetchall()
+
+        assert "Receipt_items_product_id" in plan[0][3]
@@ -0,0 +1,16 @@
+from decimal import Decimal
+
+import pytest
+
+from DPAssignment2.src.db.money import from_minor, to_minor
+
+
+class TestMoney:
+    def test_round_trip(self) -> None:
+        for amount in ["0", "0.01", "3.99", "520.00", "63960"]:
+            assert from_minor(to_minor(Decimal(amount))) == Decimal(amount)
+        assert to_minor(Decimal("3.99")) == 399
+
+    def test_sub_minor_amount(self) -> None:
+        with pytest.raises(ValueError):
+            to_minor(Decimal("0.005"))
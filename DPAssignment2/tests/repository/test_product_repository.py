@@ -163,4 +163,16 @@ class TestProductRepository:
             pr.read_product(uuid4())
 
         with pytest.raises(RuntimeError, match="Database not connected"):
-            pr.list_products()
\ No newline at end of file
+            pr.list_products()
+
+    def test_read_product_by_barcode(self, product_repo: ProductRepository,
+                                     test_unit1: Unit) -> None:
+        product = product_repo.create_product(
+            name="apple",
+            unit_id=test_unit1.id,
+            barcode="123123",
+            price=Decimal("3.99")
+        )
+
+        assert product_repo.read_product_by_barcode("123123") == product
+        assert product_repo.read_product_by_barcode("321321") is None
@@ -1,5 +1,6 @@
 from decimal import Decimal
-from typing import Generator, Optional
+from typing import Generator, List, Optional
+from uuid import uuid4
 
 import pytest
 
@@ -109,4 +110,52 @@ class TestReceiptRepository:
         receipt_repo.add_product(receipt.id, sample_product.id, 2)
 
         receipt_repo.delete_receipt(receipt.id)
-        assert receipt_repo.get_receipt(receipt.id) is None
\ No newline at end of file
+        assert receipt_repo.get_receipt(receipt.id) is None
+
+    def test_add_product_returns_stored_receipt(
+            self, receipt_repo: ReceiptRepository, product_repo: ProductRepository,
+            sample_unit: Unit, sample_product: Product) -> None:
+        other: Product = product_repo.create_product(
+            name="Other Product", price=Decimal("2.50"),
+            unit_id=sample_unit.id, barcode="456456")
+        receipt = receipt_repo.open_receipt()
+        receipt_repo.add_product(receipt.id, sample_product.id, 2)
+        receipt_repo.add_product(receipt.id, other.id, 1)
+        returned = receipt_repo.add_product(receipt.id, sample_product.id, 3)
+        stored: Optional[Receipt] = receipt_repo.get_receipt(receipt.id)
+
+        assert stored is not None
+        assert returned == stored
+        assert returned.total == stored.total == Decimal("52.50")
+        assert stored.total == receipt_repo.get_total(receipt.id)
+
+    def test_add_product_round_trips(self, init_repository: Database,
+                                     receipt_repo: ReceiptRepository,
+                                     sample_product: Product) -> None:
+        receipt = receipt_repo.open_receipt()
+        receipt_repo.add_product(receipt.id, sample_product.id, 1)
+        statements: List[str] = []
+        assert init_repository.connection is not None
+        init_repository.connection.set_trace_callback(statements.append)
+
+        receipt_repo.add_product(receipt.id, sample_product.id, 1)
+
+        # BEGIN, read, upsert, total update, COMMIT
+        assert len(statements) == 5
+
+    def test_add_product_to_closed_receipt(self, receipt_repo: ReceiptRepository,
+                                           sample_product: Product) -> None:
+        receipt = receipt_repo.open_receipt()
+        receipt_repo.close_receipt(receipt.id)
+
+        with pytest.raises(ValueError):
+            receipt_repo.add_product(receipt.id, sample_product.id, 1)
+        assert receipt_repo.get_total(receipt.id) == Decimal(0)
+
+    def test_add_missing_product(self, receipt_repo: ReceiptRepository) -> None:
+        receipt = receipt_repo.open_receipt()
+
+        with pytest.raises(ValueError):
+            receipt_repo.add_product(receipt.id, uuid4(), 1)
+        with pytest.raises(ValueError):
+            receipt_repo.add_product(uuid4(), uuid4(), 1)
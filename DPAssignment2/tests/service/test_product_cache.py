@@ -0,0 +1,39 @@
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from DPAssignment2.src.models.product import Product
+from DPAssignment2.src.service.product_cache import ProductCache
+
+
+class TestProductCache:
+    @pytest.fixture
+    def product(self) -> Product:
+        return Product(name="apple", unit_id=uuid4(),
+                       barcode="123123", price=Decimal("3.99"))
+
+    def test_warm(self, product: Product) -> None:
+        cache = ProductCache()
+        cache.warm([product])
+
+        assert cache.get(product.id) is product
+        assert cache.get_by_barcode("123123") is product
+        assert cache.get_by_barcode("321321") is None
+
+    def test_invalidate(self, product: Product) -> None:
+        cache = ProductCache()
+        cache.put(product)
+        cache.invalidate(product.id)
+
+        assert cache.get(product.id) is None
+        assert cache.get_by_barcode("123123") is None
+
+    def test_stale_put_is_dropped(self, product: Product) -> None:
+        cache = ProductCache()
+        # Read from the database, then updated elsewhere before it is cached
+        version = cache.version
+        cache.invalidate(product.id)
+        cache.put(product, version)
+
+        assert cache.get(product.id) is None
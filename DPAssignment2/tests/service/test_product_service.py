@@ -8,6 +8,7 @@ from DPAssignment2.src.db.repository.product_repository import ProductRepository
 from DPAssignment2.src.db.repository.unit_repository import UnitRepository
 from DPAssignment2.src.models.product import Product
 from DPAssignment2.src.models.unit import Unit
+from DPAssignment2.src.service.product_cache import ProductCache
 from DPAssignment2.src.service.product_service import ProductService
 from DPAssignment2.src.service.unit_service import UnitService
 
@@ -92,4 +93,54 @@ class TestProductService:
         prod: Product = product_service.create_product(
             "aaaa", test_unit1.id, "123123", Decimal("1.25"))
         with pytest.raises(ValueError):
-            product_service.update_product(prod.id, Decimal("-5"))
\ No newline at end of file
+            product_service.update_product(prod.id, Decimal("-5"))
+
+
+class TestCachedProductService:
+    @pytest.fixture
+    def init_db(self) -> Generator[Database, None, None]:
+        db = Database(":memory:")  # Use in-memory database for testing
+        db.connect()
+        db.create_tables()
+        yield db
+        db.disconnect()  # Clean up after test
+
+    @pytest.fixture
+    def cache(self) -> ProductCache:
+        return ProductCache()
+
+    @pytest.fixture
+    def product_service(self, init_db: Database,
+                        cache: ProductCache) -> ProductService:
+        return ProductService(ProductRepository(init_db), cache)
+
+    @pytest.fixture
+    def test_unit1(self, init_db: Database) -> Unit:
+        return UnitService(UnitRepository(init_db)).create_unit("test_unit1")
+
+    def test_scan_is_served_from_cache(self, init_db: Database,
+                                       product_service: ProductService,
+                                       test_unit1: Unit) -> None:
+        prod: Product = product_service.create_product(
+            "test_product", test_unit1.id, "123123", Decimal("1.25"))
+        statements: List[str] = []
+        assert init_db.connection is not None
+        init_db.connection.set_trace_callback(statements.append)
+
+        assert product_service.read_product_by_barcode("123123") == prod
+        assert product_service.read_product(prod.id) == prod
+        assert statements == []
+
+    def test_update_invalidates(self, product_service: ProductService,
+                                cache: ProductCache, test_unit1: Unit) -> None:
+        prod: Product = product_service.create_product(
+            "test_product", test_unit1.id, "123123", Decimal("1.25"))
+        product_service.update_product(prod.id, Decimal("5"))
+
+        assert cache.get(prod.id) is None
+        scanned: Optional[Product] = product_service.read_product_by_barcode("123123")
+        assert scanned is not None and scanned.price == Decimal("5")
+        assert cache.get_by_barcode("123123") == scanned
+
+    def test_unknown_barcode(self, product_service: ProductService) -> None:
+        assert product_service.read_product_by_barcode("000") is None
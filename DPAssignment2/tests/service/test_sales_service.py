@@ -77,4 +77,4 @@ class TestSalesService:
         receipt_service.add_product(rec.id, test_product1.id, 3)
         receipt_service.add_product(rec.id, test_product2.id, 3)
 
-        assert sales_service.get_revenue() == 3*1.25 + 3*5.3
\ No newline at end of file
+        assert sales_service.get_revenue() == 3*Decimal("1.25") + 3*Decimal("5.3")
\ No newline at end of file